@@ -0,0 +1,198 @@
+"""
+STT replay benchmark
+Feeds a directory of labeled utterances through every STT engine that can be
+built locally and reports accuracy, speed and memory per engine.
+
+Usage:
+    python benchmarks/bench_stt.py utterances/ [--engines vosk whisper google race]
+                                               [--google-recognizer MODULE:FACTORY]
+
+Each utterance is a 16 kHz, 16-bit mono WAV with its reference transcript in a
+.txt file of the same name. Every engine runs in its own process so peak
+memory is not shared between engines.
+
+Cloud engines can be pointed at local stand-ins: OPENAI_BASE_URL for a
+Whisper-compatible server on localhost, and --google-recognizer for Google.
+The latter names a factory returning a speech_recognition.Recognizer (usually
+a subclass) whose recognize_google() answers from a local server; it must be
+importable from the child process. Engines that cannot be built or that do
+not implement transcribe() are reported and skipped.
+
+Engines share one noise tracker that is never started, so nothing opens the
+microphone while audio is replayed.
+"""
+
+import os
+import sys
+import time
+import wave
+import queue
+import argparse
+import importlib
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+from chatur.core.audio_capture import SAMPLE_RATE, SAMPLE_WIDTH
+
+
+def load_utterances(directory: Path):
+    utterances = []
+    for path in sorted(directory.glob('*.wav')):
+        reference = path.with_suffix('.txt')
+        if not reference.exists():
+            print(f"Skipping {path.name} - no {reference.name}")
+            continue
+        with wave.open(str(path), 'rb') as wav:
+            if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != SAMPLE_WIDTH:
+                print(f"Skipping {path.name} - expected {SAMPLE_RATE} Hz, 16-bit mono")
+                continue
+            audio = wav.readframes(wav.getnframes())
+        utterances.append((path.name, audio, reference.read_text(encoding='utf-8').strip()))
+    return utterances
+
+
+class PeakMemory:
+    """Samples this process's resident memory in the background"""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak = self.process.memory_info().rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.process.memory_info().rss)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+
+
+def load_factory(spec: str):
+    """Resolve 'package.module:callable'"""
+    module_name, _, attr = spec.partition(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def build_engine(name: str, google_recognizer: Optional[str] = None):
+    """Build an engine for replay; its noise tracker is never started"""
+    from chatur.core.stt_factory import STTFactory
+    from chatur.core.vad import NoiseFloorTracker
+
+    idle_tracker = NoiseFloorTracker()
+    if name == 'google' and google_recognizer:
+        from chatur.core.google_stt import GoogleSTT
+        return GoogleSTT(noise_tracker=idle_tracker, recognizer=load_factory(google_recognizer)())
+    return STTFactory.create(name, fallback=False, noise_tracker=idle_tracker)
+
+
+def run_engine(name: str, utterances, results, google_recognizer: Optional[str] = None) -> None:
+    """Child process: build one engine and transcribe every utterance"""
+    from chatur.utils.metrics import word_error_rate
+
+    baseline = psutil.Process().memory_info().rss
+    with PeakMemory() as memory:
+        load_started = time.perf_counter()
+        try:
+            engine = build_engine(name, google_recognizer)
+        except Exception as e:
+            results.put({'engine': name, 'error': f"could not build: {e}"})
+            return
+        if not hasattr(engine, 'transcribe'):
+            results.put({'engine': name, 'error': "does not implement transcribe()"})
+            return
+        if not engine.is_available():
+            results.put({'engine': name, 'error': "not available (missing model, API key or server)"})
+            return
+        load_seconds = time.perf_counter() - load_started
+
+        errors, latencies, audio_seconds, failures = [], [], 0.0, 0
+        for _, audio, reference in utterances:
+            duration = len(audio) / SAMPLE_WIDTH / SAMPLE_RATE
+            started = time.perf_counter()
+            try:
+                result = engine.transcribe(audio)
+            except Exception:
+                result = None
+            latency = time.perf_counter() - started
+
+            if result is None:
+                failures += 1
+            errors.append(word_error_rate(reference, result.text if result else ''))
+            latencies.append(latency)
+            audio_seconds += duration
+
+    latencies.sort()
+    results.put({
+        'engine': name,
+        'load_s': load_seconds,
+        'wer': sum(errors) / len(errors),
+        'rtf': sum(latencies) / audio_seconds,
+        'final_p50_ms': 1000 * latencies[len(latencies) // 2],
+        'final_p95_ms': 1000 * latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))],
+        'failures': failures,
+        'peak_mb': memory.peak / (1024 * 1024),
+        'engine_mb': (memory.peak - baseline) / (1024 * 1024),
+    })
+
+
+def main():
+    from chatur.core.stt_factory import STTFactory
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('utterances', help="Directory of .wav + .txt pairs")
+    parser.add_argument('--engines', nargs='+', help="Engines to run (default: all installed, plus race)")
+    parser.add_argument('--timeout', type=float, default=1800, help="Seconds allowed per engine")
+    parser.add_argument('--google-recognizer', metavar='MODULE:FACTORY',
+                        help="Recognizer factory for a local Google stand-in")
+    args = parser.parse_args()
+
+    utterances = load_utterances(Path(args.utterances))
+    if not utterances:
+        sys.exit("No labeled utterances found")
+    engines = args.engines or STTFactory.list_available_engines() + ['race']
+
+    audio_seconds = sum(len(audio) for _, audio, _ in utterances) / SAMPLE_WIDTH / SAMPLE_RATE
+    print("=" * 92)
+    print(f"STT replay benchmark - {len(utterances)} utterances, {audio_seconds:.1f}s of audio")
+    print("=" * 92)
+    print(f"{'engine':<10}{'WER':>8}{'RTF':>8}{'final p50':>12}{'final p95':>12}"
+          f"{'load':>9}{'peak RSS':>11}{'engine':>10}{'fails':>7}")
+
+    context = multiprocessing.get_context('spawn')
+    for name in engines:
+        results = context.Queue()
+        child = context.Process(target=run_engine, args=(name, utterances, results, args.google_recognizer))
+        child.start()
+        try:
+            result = results.get(timeout=args.timeout)
+        except queue.Empty:
+            result = {'engine': name, 'error': "crashed or timed out"}
+        child.join(timeout=5)
+        if child.is_alive():
+            child.terminate()
+
+        if 'error' in result:
+            print(f"{name:<10}  {result['error']}")
+            continue
+        print(f"{name:<10}{100 * result['wer']:7.1f}%{result['rtf']:8.3f}"
+              f"{result['final_p50_ms']:10.0f}ms{result['final_p95_ms']:10.0f}ms"
+              f"{result['load_s']:8.2f}s{result['peak_mb']:9.0f}MB{result['engine_mb']:8.0f}MB"
+              f"{result['failures']:7d}")
+
+    print("\nRTF = transcription time / audio duration; 'final' = end of utterance to final text")
+
+
+if __name__ == "__main__":
+    main()
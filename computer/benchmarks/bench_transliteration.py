@@ -0,0 +1,78 @@
+"""
+Transliteration benchmark
+Times Devanagari romanization of typical Hindi replies, uncached and memoized,
+against the per-call dict walk TextToSpeech used before.
+
+Usage:
+    python benchmarks/bench_transliteration.py [--iterations 20000]
+"""
+
+import os
+import sys
+import time
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.utils.transliteration import transliterate
+
+REPLIES = [
+    "मुझे समझ नहीं आया। कृपया दोबारा कहें।",
+    "टाइमर पूरा हो गया: चाय",
+    "रिमाइंडर: दवा लो",
+    "आज बारिश होगी, छाता साथ रखें।",
+    "आपके 3 नए ईमेल हैं",
+]
+
+
+def legacy_transliterate(text: str) -> str:
+    """The original implementation: mapping rebuilt and characters appended on every call"""
+    transliteration_map = {
+        'क': 'ka', 'ख': 'kha', 'ग': 'ga', 'घ': 'gha', 'ङ': 'nga',
+        'च': 'cha', 'छ': 'chha', 'ज': 'ja', 'झ': 'jha', 'ञ': 'nya',
+        'ट': 'ta', 'ठ': 'tha', 'ड': 'da', 'ढ': 'dha', 'ण': 'na',
+        'त': 'ta', 'थ': 'tha', 'द': 'da', 'ध': 'dha', 'न': 'na',
+        'प': 'pa', 'फ': 'pha', 'ब': 'ba', 'भ': 'bha', 'म': 'ma',
+        'य': 'ya', 'र': 'ra', 'ल': 'la', 'व': 'va', 'श': 'sha',
+        'ष': 'sha', 'स': 'sa', 'ह': 'ha',
+        'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo',
+        'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ं': 'n', 'ः': 'h',
+        '्': '', 'ँ': 'n'
+    }
+    result = []
+    for char in text:
+        result.append(transliteration_map.get(char, char))
+    return ''.join(result)
+
+
+def time_per_call(function, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for reply in REPLIES:
+            function(reply)
+    return (time.perf_counter() - started) / (iterations * len(REPLIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    results = [
+        ("legacy dict walk", time_per_call(legacy_transliterate, args.iterations)),
+        ("compiled, uncached", time_per_call(transliterate.__wrapped__, args.iterations)),
+        ("compiled, memoized", time_per_call(transliterate, args.iterations)),
+    ]
+
+    print("=" * 60)
+    print(f"Transliteration - {len(REPLIES)} replies x {args.iterations} iterations")
+    print("=" * 60)
+    for name, seconds in results:
+        print(f"{name:<22}{1e6 * seconds:10.2f} us/reply")
+
+    print("\nSample output:")
+    for reply in REPLIES:
+        print(f"  {legacy_transliterate(reply)!r:48} -> {transliterate(reply)!r}")
+
+
+if __name__ == "__main__":
+    main()
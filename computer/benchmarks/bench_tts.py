@@ -0,0 +1,95 @@
+"""
+TTS backend synthesis benchmark
+Synthesizes a set of typical replies with every installed backend and reports
+startup cost, voice catalogue size and synthesis throughput.
+
+Usage:
+    python benchmarks/bench_tts.py [--backends pyttsx3 espeak] [--sentences replies.txt] [--repeat 3]
+
+Synthesis goes to WAV files in a temporary directory, so nothing is played and
+results do not depend on the audio device. RTF below 1.0 means a backend
+synthesizes faster than the audio plays back.
+"""
+
+import os
+import sys
+import time
+import wave
+import argparse
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.tts_factory import TTSFactory
+from chatur.utils.metrics import LatencyStats
+
+DEFAULT_SENTENCES = [
+    "Okay",
+    "Timer started for 5 minutes",
+    "Playing next track",
+    "You have 3 unread emails. The first one is from Alice about the project review.",
+    "Your next meeting is the weekly sync at 3 PM, followed by a design review at 4.",
+    "It is 24 degrees and partly cloudy in Bengaluru, with light rain expected this evening.",
+]
+
+
+def wav_seconds(path: Path) -> float:
+    with wave.open(str(path), 'rb') as wav:
+        return wav.getnframes() / float(wav.getframerate())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backends', nargs='+', help="Backends to run (default: all installed)")
+    parser.add_argument('--sentences', help="Text file with one reply per line (default: built-in set)")
+    parser.add_argument('--repeat', type=int, default=3, help="Passes over the sentences per backend")
+    args = parser.parse_args()
+
+    sentences = DEFAULT_SENTENCES
+    if args.sentences:
+        sentences = [line.strip() for line in Path(args.sentences).read_text(encoding='utf-8').splitlines() if line.strip()]
+    backends = args.backends or TTSFactory.list_available_backends()
+    if not backends:
+        sys.exit("No TTS backend installed (pyttsx3 or espeak-ng)")
+
+    print("=" * 84)
+    print(f"TTS synthesis benchmark - {len(sentences)} sentences x {args.repeat} passes")
+    print("=" * 84)
+    print(f"{'backend':<10}{'startup':>9}{'voices':>8}{'p50':>10}{'p95':>10}{'chars/s':>10}{'RTF':>8}{'streams':>9}")
+
+    workdir = Path(tempfile.mkdtemp(prefix='chatur_bench_tts_'))
+    for name in backends:
+        started = time.perf_counter()
+        try:
+            backend = TTSFactory.create(name, fallback=False)
+        except Exception as e:
+            print(f"{name:<10}  unavailable: {e}")
+            continue
+        startup = time.perf_counter() - started
+        backend.set_voice(backend.default_voice)
+
+        latencies = LatencyStats(window=100000)
+        characters, audio_seconds, synth_seconds = 0, 0.0, 0.0
+        for _ in range(args.repeat):
+            for index, sentence in enumerate(sentences):
+                path = workdir / f'{name}_{index:03d}.wav'
+                started = time.perf_counter()
+                backend.synthesize_to_file(sentence, str(path))
+                elapsed = time.perf_counter() - started
+
+                latencies.record(elapsed)
+                synth_seconds += elapsed
+                characters += len(sentence)
+                audio_seconds += wav_seconds(path)
+                path.unlink()
+
+        stats = latencies.snapshot()
+        rtf = synth_seconds / audio_seconds if audio_seconds else float('nan')
+        print(f"{name:<10}{startup:8.2f}s{len(backend.voices):8d}{stats['p50_ms']:8.0f}ms{stats['p95_ms']:8.0f}ms"
+              f"{characters / synth_seconds:10.0f}{rtf:8.3f}{'yes' if backend.streaming else 'no':>9}")
+
+    print("\nStreaming backends start playback before synthesis finishes; p50/p95 are per whole sentence")
+
+
+if __name__ == "__main__":
+    main()
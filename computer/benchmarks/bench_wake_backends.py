@@ -0,0 +1,101 @@
+"""
+Wake word backend benchmark
+Replays recorded clips through each keyword backend and reports CPU use,
+per-frame latency, detection latency and false accepts.
+
+Usage:
+    python benchmarks/bench_wake_backends.py clips/ [--backends porcupine vosk] [--keyword computer]
+
+Clips are 16 kHz, 16-bit mono WAVs under clips/positive (contain the keyword)
+and clips/negative (do not).
+"""
+
+import os
+import sys
+import time
+import wave
+import argparse
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.audio_capture import SAMPLE_RATE, SAMPLE_WIDTH
+from chatur.core.keyword_backends import BACKENDS, create_keyword_backend
+from chatur.utils.metrics import LatencyStats
+
+
+def load_clip(path: Path) -> bytes:
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != SAMPLE_WIDTH:
+            sys.exit(f"{path}: expected {SAMPLE_RATE} Hz, 16-bit mono")
+        return wav.readframes(wav.getnframes())
+
+
+def run_clip(backend, audio: bytes, frame_timer: LatencyStats):
+    """Returns (cpu seconds, audio seconds at first detection or None)"""
+    backend.reset()
+    frame_bytes = backend.frame_length * SAMPLE_WIDTH
+    detected_at = None
+
+    started = time.process_time()
+    for offset in range(0, len(audio) - frame_bytes + 1, frame_bytes):
+        frame_started = time.perf_counter()
+        index = backend.process(audio[offset:offset + frame_bytes])
+        frame_timer.record(time.perf_counter() - frame_started)
+        if index >= 0 and detected_at is None:
+            detected_at = (offset + frame_bytes) / SAMPLE_WIDTH / SAMPLE_RATE
+    return time.process_time() - started, detected_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('clips', help="Directory with positive/ and negative/ WAV clips")
+    parser.add_argument('--backends', nargs='+', default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument('--keyword', default='computer')
+    args = parser.parse_args()
+
+    clips_dir = Path(args.clips)
+    clips = {
+        label: [(path.name, load_clip(path)) for path in sorted((clips_dir / label).glob('*.wav'))]
+        for label in ('positive', 'negative')
+    }
+    audio_seconds = sum(len(audio) for group in clips.values() for _, audio in group) / SAMPLE_WIDTH / SAMPLE_RATE
+
+    print("=" * 72)
+    print(f"Wake word backends - {len(clips['positive'])} positive, "
+          f"{len(clips['negative'])} negative clips, {audio_seconds:.1f}s of audio")
+    print("=" * 72)
+
+    for name in args.backends:
+        load_started = time.perf_counter()
+        backend = create_keyword_backend(name, keywords=[args.keyword])
+        if backend is None:
+            print(f"{name:<10} unavailable")
+            continue
+        load_seconds = time.perf_counter() - load_started
+
+        frame_timer = LatencyStats(window=100000)
+        cpu_total = 0.0
+        hits, false_accepts, detection_times = 0, 0, []
+
+        for label, group in clips.items():
+            for _, audio in group:
+                cpu, detected_at = run_clip(backend, audio, frame_timer)
+                cpu_total += cpu
+                if detected_at is None:
+                    continue
+                if label == 'positive':
+                    hits += 1
+                    detection_times.append(detected_at)
+                else:
+                    false_accepts += 1
+
+        frames = frame_timer.snapshot()
+        mean_detection = sum(detection_times) / len(detection_times) if detection_times else 0.0
+        print(f"{name:<10} load {load_seconds:6.2f}s  cpu {100 * cpu_total / audio_seconds:5.2f}% of one core  "
+              f"frame p50 {frames['p50_ms']:.2f} ms p95 {frames['p95_ms']:.2f} ms")
+        print(f"{'':<10} detected {hits}/{len(clips['positive'])}  false accepts {false_accepts}/"
+              f"{len(clips['negative'])}  mean detection point {mean_detection:.2f}s into clip")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Wake word energy gate benchmark
+Replays recorded room audio through Porcupine with and without the energy gate
+and reports CPU time and the fraction of frames the gate skipped.
+
+Usage:
+    python benchmarks/bench_wake_gate.py room.wav [--keyword computer]
+
+The WAV must be 16 kHz, 16-bit mono. Porcupine runs only if pvporcupine is
+installed and PORCUPINE_ACCESS_KEY is set; otherwise only the gate is measured.
+"""
+
+import os
+import sys
+import time
+import wave
+import argparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from chatur.core.audio_capture import FRAME_LENGTH, SAMPLE_RATE, SAMPLE_WIDTH
+from chatur.core.vad import EnergyGate
+
+
+def load_frames(path: str):
+    with wave.open(path, 'rb') as wav:
+        if wav.getframerate() != SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != SAMPLE_WIDTH:
+            sys.exit(f"{path}: expected {SAMPLE_RATE} Hz, 16-bit mono")
+        data = wav.readframes(wav.getnframes())
+    frame_bytes = FRAME_LENGTH * SAMPLE_WIDTH
+    return [data[i:i + frame_bytes] for i in range(0, len(data) - frame_bytes + 1, frame_bytes)]
+
+
+def create_porcupine(keyword: str):
+    try:
+        import pvporcupine
+    except ImportError:
+        print("pvporcupine not installed - measuring the gate only")
+        return None
+    access_key = os.getenv('PORCUPINE_ACCESS_KEY')
+    if not access_key:
+        print("PORCUPINE_ACCESS_KEY not set - measuring the gate only")
+        return None
+    return pvporcupine.create(access_key=access_key, keywords=[keyword])
+
+
+def run(frames, porcupine, gate):
+    """Feed every frame through the (optional) gate and model, returning (cpu seconds, detections)"""
+    detections = 0
+    buffer = b''
+    frame_bytes = porcupine.frame_length * SAMPLE_WIDTH if porcupine else 0
+
+    started = time.process_time()
+    for frame in frames:
+        passed = gate.process(frame) if gate else [frame]
+        if not porcupine:
+            continue
+        buffer += b''.join(passed)
+        while len(buffer) >= frame_bytes:
+            chunk, buffer = buffer[:frame_bytes], buffer[frame_bytes:]
+            if porcupine.process(np.frombuffer(chunk, dtype=np.int16)) >= 0:
+                detections += 1
+    return time.process_time() - started, detections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('wav', help="Recorded room audio (16 kHz, 16-bit mono)")
+    parser.add_argument('--keyword', default='computer', help="Built-in Porcupine keyword")
+    args = parser.parse_args()
+
+    frames = load_frames(args.wav)
+    audio_seconds = len(frames) * FRAME_LENGTH / SAMPLE_RATE
+    porcupine = create_porcupine(args.keyword)
+
+    print("=" * 60)
+    print(f"Wake word gate benchmark - {audio_seconds:.1f}s of audio, {len(frames)} frames")
+    print("=" * 60)
+
+    try:
+        results = {}
+        for label, gate in (('ungated', None), ('gated', EnergyGate(frame_seconds=FRAME_LENGTH / SAMPLE_RATE))):
+            cpu, detections = run(frames, porcupine, gate)
+            results[label] = cpu
+            line = f"{label:<8} cpu {cpu * 1000:9.1f} ms  ({100 * cpu / audio_seconds:5.2f}% of one core)"
+            if porcupine:
+                line += f"  detections {detections}"
+            if gate:
+                line += f"  skipped {100 * gate.skipped_fraction:5.1f}% of frames"
+            print(line)
+
+        if porcupine and results['gated']:
+            print(f"CPU reduction: {results['ungated'] / results['gated']:.1f}x")
+    finally:
+        if porcupine:
+            porcupine.delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from chatur.utils.metrics import metrics
+
+router = APIRouter()
+
+@router.get("/metrics")
+async def get_metrics():
+    """Get latency distributions and counters recorded by the assistant"""
+    return metrics.snapshot()
@@ -0,0 +1,9 @@
+from fastapi import APIRouter
+from chatur.service.power_policy import power_policy
+
+router = APIRouter()
+
+@router.get("/power")
+async def get_power_policy():
+    """Get the active power profile (AC or battery) and battery level"""
+    return power_policy.snapshot()
@@ -5,7 +5,7 @@ from typing import List, Dict, Any
 import json
 import asyncio
 from chatur.utils.logger import setup_logger
-from chatur.api.routes import settings, history
+from chatur.api.routes import settings, history, metrics, power
 
 # Setup logger
 logger = setup_logger('chatur.api')
@@ -15,6 +15,8 @@ app = FastAPI()
 # Include routes
 app.include_router(settings.router, prefix="/api")
 app.include_router(history.router, prefix="/api")
+app.include_router(metrics.router, prefix="/api")
+app.include_router(power.router, prefix="/api")
 
 from fastapi.staticfiles import StaticFiles
 import sys
@@ -119,6 +121,17 @@ def broadcast_message_sync(status: str, data: Dict = None):
     else:
         logger.warning("Cannot broadcast: Server loop not running")
 
+def broadcast_transcript(text: str):
+    """
+    Push a partial transcript to the overlay ('transcript' message)
+    
+    Used as the STT engines' on_partial callback, so it runs many times per
+    utterance on the STT thread; before the server is up partials are dropped
+    without logging.
+    """
+    if server_loop and server_loop.is_running():
+        asyncio.run_coroutine_threadsafe(manager.broadcast({"status": "transcript", "text": text}), server_loop)
+
 # Helper function to run the server content
 def run_api_server(host="0.0.0.0", port=8000):
     import uvicorn
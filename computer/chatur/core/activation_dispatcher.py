@@ -0,0 +1,126 @@
+"""
+Activation queue that decouples triggers from the interaction cycle
+Hotkey and wake-word threads only enqueue; one worker runs listen → process → speak
+"""
+
+import time
+import queue
+import threading
+from typing import Callable, Optional
+from chatur.utils.logger import setup_logger
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.activation_dispatcher')
+
+
+class ActivationDispatcher:
+    """Runs activations on a single worker with debounce and coalescing"""
+
+    def __init__(
+        self,
+        on_activate: Callable,
+        debounce_seconds: float = 0.5,
+        on_busy: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Args:
+            on_activate: Interaction cycle to run for each accepted trigger
+            debounce_seconds: Triggers closer together than this are dropped (only when idle;
+                              a trigger during an activation always reaches on_busy)
+            on_busy: Called (from the triggering thread) when a trigger arrives during
+                     an activation; returns True if it handled it, e.g. by barging in
+        """
+        self.on_activate = on_activate
+        self.on_busy = on_busy
+        self.debounce_seconds = debounce_seconds
+
+        # One slot: a trigger arriving while another is pending or running is merged into it
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._lock = threading.Lock()
+        self._last_trigger = 0.0
+        self._busy = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the activation worker"""
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, name="ActivationWorker", daemon=True)
+        self._thread.start()
+        logger.info("Activation dispatcher started")
+
+    def trigger(self, source: str = "hotkey") -> bool:
+        """
+        Request an interaction cycle (safe to call from any thread, never blocks)
+
+        Args:
+            source: What raised the trigger, for logging and metrics
+
+        Returns:
+            True if the trigger was queued or handled by on_busy, False if debounced or coalesced
+        """
+        now = time.monotonic()
+        with self._lock:
+            busy = self._busy
+            # Debounce only what would queue a new activation; a quick barge-in must get through
+            if not busy:
+                if now - self._last_trigger < self.debounce_seconds:
+                    metrics.increment('activation.debounced')
+                    logger.debug(f"Activation from {source} debounced")
+                    return False
+                self._last_trigger = now
+
+        if busy:
+            if self.on_busy and self.on_busy(source):
+                metrics.increment('activation.barge_in')
+                return True
+            metrics.increment('activation.coalesced')
+            logger.info(f"Activation from {source} ignored - assistant already active")
+            return False
+
+        with self._lock:
+            try:
+                self._queue.put_nowait((source, now))
+            except queue.Full:
+                metrics.increment('activation.coalesced')
+                logger.info(f"Activation from {source} merged with pending activation")
+                return False
+
+        metrics.increment(f'activation.{source}')
+        return True
+
+    def is_busy(self) -> bool:
+        with self._lock:
+            return self._busy or not self._queue.empty()
+
+    def _worker_loop(self) -> None:
+        while self._running:
+            try:
+                source, queued_at = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            with self._lock:
+                self._busy = True
+            metrics.latency('activation.queue_wait').record(time.monotonic() - queued_at)
+            logger.info(f"Activation from {source}")
+
+            try:
+                self.on_activate()
+            except Exception as e:
+                logger.error(f"Error in activation callback: {e}", exc_info=True)
+            finally:
+                with self._lock:
+                    self._busy = False
+
+        logger.info("Activation dispatcher stopped")
+
+    def stop(self) -> None:
+        """Stop the worker (an in-flight activation finishes first)"""
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
@@ -1,5 +1,6 @@
 """State machine for assistant activation and control"""
 
+import threading
 from enum import Enum
 from typing import Optional, Callable
 from chatur.utils.logger import setup_logger
@@ -19,28 +20,55 @@ class AssistantStateMachine:
     def __init__(self, broadcast_callback: Optional[Callable] = None):
         self._state = AssistantState.IDLE
         self.broadcast_callback = broadcast_callback
+        self._lock = threading.RLock()
         logger.info("State machine initialized in IDLE state")
     
     @property
     def state(self) -> AssistantState:
         return self._state
     
-    def transition_to(self, new_state: AssistantState):
-        """Transition to a new state and broadcast the change"""
+    def _set_state(self, new_state: AssistantState) -> bool:
+        """Change the state (caller holds the lock); returns False if already there"""
         if self._state == new_state:
-            return
+            return False
         
         old_state = self._state
         self._state = new_state
-        
         logger.info(f"State transition: {old_state.value} → {new_state.value}")
+        return True
+    
+    def _broadcast(self, new_state: AssistantState):
+        # Called after releasing the lock so a slow websocket send never blocks other transitions
+        callback = self.broadcast_callback
+        if callback:
+            callback('state_change', {'state': new_state.value})
+    
+    def transition_to(self, new_state: AssistantState):
+        """Transition to a new state and broadcast the change"""
+        with self._lock:
+            changed = self._set_state(new_state)
+        if changed:
+            self._broadcast(new_state)
+    
+    def transition_if(self, expected: AssistantState, new_state: AssistantState) -> bool:
+        """
+        Atomically transition only if currently in the expected state
         
-        # Broadcast state change to UI
-        if self.broadcast_callback:
-            self.broadcast_callback('state_change', {'state': new_state.value})
+        Returns:
+            True if the transition happened
+        """
+        with self._lock:
+            if self._state != expected:
+                return False
+            changed = self._set_state(new_state)
+        if changed:
+            self._broadcast(new_state)
+        return True
     
     def is_idle(self) -> bool:
-        return self._state == AssistantState.IDLE
+        with self._lock:
+            return self._state == AssistantState.IDLE
     
     def is_active(self) -> bool:
-        return self._state != AssistantState.IDLE
+        with self._lock:
+            return self._state != AssistantState.IDLE
@@ -0,0 +1,392 @@
+"""Shared microphone capture stream fanned out to multiple consumers"""
+
+import io
+import time
+import wave
+import queue
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, List, BinaryIO
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+
+logger = setup_logger('chatur.audio_capture')
+
+SAMPLE_RATE = 16000
+FRAME_LENGTH = 512  # Samples per frame (32 ms at 16 kHz, matches Porcupine)
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+
+class AudioSubscription:
+    """Bounded queue of captured frames for a single consumer"""
+
+    def __init__(self, capture: 'AudioCapture', max_frames: int = 256):
+        self._capture = capture
+        self._queue: queue.Queue = queue.Queue(maxsize=max_frames)
+        self.dropped_frames = 0
+
+    def push(self, frame: bytes) -> None:
+        """Enqueue a frame, dropping the oldest one if the consumer fell behind"""
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped_frames += 1
+            try:
+                self._queue.put_nowait(frame)
+            except queue.Full:
+                pass
+
+    def read(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Get the next frame
+
+        Args:
+            timeout: Seconds to wait for a frame (None blocks forever)
+
+        Returns:
+            PCM frame bytes or None on timeout
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def clear(self) -> None:
+        """Discard any frames queued so far"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def close(self) -> None:
+        """Stop receiving frames"""
+        self._capture.unsubscribe(self)
+
+    def __enter__(self) -> 'AudioSubscription':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AudioCapture:
+    """Single microphone stream shared by wake word, STT and VAD consumers"""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, frame_length: int = FRAME_LENGTH):
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.buffer_frames = 1  # Frames delivered per PyAudio callback (raised on battery)
+
+        self._audio = None
+        self._stream = None
+        self._subscribers: List[AudioSubscription] = []
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Open the microphone stream (no-op if already open)"""
+        with self._lock:
+            if self._stream is not None:
+                return True
+
+            try:
+                import pyaudio
+
+                self._audio = pyaudio.PyAudio()
+                self._stream = self._audio.open(
+                    rate=self.sample_rate,
+                    channels=1,
+                    format=pyaudio.paInt16,
+                    input=True,
+                    frames_per_buffer=self.frame_length * self.buffer_frames,
+                    stream_callback=self._audio_callback
+                )
+                logger.info(
+                    f"Audio capture started ({self.sample_rate} Hz, {self.frame_length} samples/frame, "
+                    f"{self.buffer_frames} frames/callback)"
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to start audio capture: {e}")
+                self._close_stream()
+                return False
+
+    def _audio_callback(self, in_data, frame_count, time_info, status):
+        """PyAudio callback - only fans frames out, never blocks"""
+        import pyaudio
+
+        self._fan_out(in_data)
+        return (None, pyaudio.paContinue)
+
+    def _fan_out(self, data: bytes) -> None:
+        """Split one callback buffer into frames and push them to every consumer"""
+        frame_bytes = self.frame_length * SAMPLE_WIDTH
+        subscribers = list(self._subscribers)
+        for offset in range(0, len(data), frame_bytes):
+            frame = data[offset:offset + frame_bytes]
+            for subscriber in subscribers:
+                subscriber.push(frame)
+
+    def set_buffer_frames(self, buffer_frames: int) -> None:
+        """
+        Change how many frames PyAudio delivers per callback
+
+        Consumers still receive frame_length-sample frames; larger buffers
+        just mean fewer wake-ups. Reopens the stream if it is running.
+        """
+        buffer_frames = max(1, buffer_frames)
+        with self._lock:
+            if buffer_frames == self.buffer_frames:
+                return
+            self.buffer_frames = buffer_frames
+            running = self._stream is not None
+            if running:
+                self._close_stream()
+
+        if running:
+            self.start()
+
+    def subscribe(self, max_frames: int = 256) -> Optional[AudioSubscription]:
+        """
+        Register a new consumer, starting the stream if needed
+
+        Args:
+            max_frames: Queue bound for this consumer
+
+        Returns:
+            AudioSubscription or None if the microphone could not be opened
+        """
+        # Register first so a source that starts producing immediately loses nothing
+        subscription = AudioSubscription(self, max_frames=max_frames)
+        with self._lock:
+            self._subscribers.append(subscription)
+
+        if not self.start():
+            self.unsubscribe(subscription)
+            return None
+        return subscription
+
+    def unsubscribe(self, subscription: AudioSubscription) -> None:
+        """Remove a consumer"""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def _close_stream(self) -> None:
+        if self._stream:
+            try:
+                self._stream.stop_stream()
+                self._stream.close()
+            except Exception as e:
+                logger.error(f"Error stopping capture stream: {e}")
+            self._stream = None
+
+        if self._audio:
+            try:
+                self._audio.terminate()
+            except Exception as e:
+                logger.error(f"Error terminating audio: {e}")
+            self._audio = None
+
+    def stop(self) -> None:
+        """Close the microphone stream and drop all consumers"""
+        with self._lock:
+            self._subscribers.clear()
+            self._close_stream()
+        logger.info("Audio capture stopped")
+
+    def is_running(self) -> bool:
+        return self._stream is not None
+
+
+class SourceCapture(AudioCapture, ABC):
+    """Capture stream fed from a PCM source instead of a sound card (headless runs)"""
+
+    paced = True  # Sleep to emulate a live microphone; False when the source blocks on its own
+    open_blocks = False  # Open on the reader thread; start() must not wait for e.g. a pipe's writer
+
+    def __init__(self, path: str, sample_rate: int = SAMPLE_RATE, frame_length: int = FRAME_LENGTH):
+        super().__init__(sample_rate, frame_length)
+        self.path = Path(path)
+        self.frames_read = 0
+        self._stop_event = threading.Event()
+        self._source: Optional[BinaryIO] = None
+
+    @abstractmethod
+    def _open_source(self) -> BinaryIO:
+        """Open the source positioned at the first PCM byte"""
+        pass
+
+    def _at_end(self) -> bool:
+        """
+        Called when the source is exhausted
+
+        Returns:
+            True to keep reading (source reopened or rewound), False to emit silence
+        """
+        return False
+
+    def start(self) -> bool:
+        """Start reading the source (no-op if already running)"""
+        with self._lock:
+            if self._stream is not None:
+                return True
+
+            if not self.open_blocks:
+                try:
+                    self._source = self._open_source()
+                except (OSError, ValueError, wave.Error) as e:
+                    logger.error(f"Failed to open audio source {self.path}: {e}")
+                    return False
+
+            # A fresh event per run, so a reader still blocked in open() from an earlier run stays stopped
+            self._stop_event = threading.Event()
+            self._stream = threading.Thread(
+                target=self._read_loop, args=(self._stop_event,), name="SourceCapture", daemon=True
+            )
+            self._stream.start()
+            logger.info(f"Audio capture started from {self.path} ({self.sample_rate} Hz)")
+            return True
+
+    def set_buffer_frames(self, buffer_frames: int) -> None:
+        """Change the frames read per block; the reader picks it up without reopening the source"""
+        self.buffer_frames = max(1, buffer_frames)
+
+    def _read_loop(self, stop_event: threading.Event) -> None:
+        if self._source is None:
+            try:
+                source = self._open_source()
+            except (OSError, ValueError, wave.Error) as e:
+                logger.error(f"Failed to open audio source {self.path}: {e}")
+                return
+            if stop_event.is_set():
+                source.close()
+                return
+            self._source = source
+
+        next_deadline = time.monotonic()
+        exhausted = False
+
+        while not stop_event.is_set():
+            buffer_bytes = self.frame_length * SAMPLE_WIDTH * self.buffer_frames
+            buffer_seconds = self.frame_length * self.buffer_frames / self.sample_rate
+            data = b''
+            if not exhausted:
+                while len(data) < buffer_bytes:
+                    chunk = self._source.read(buffer_bytes - len(data))
+                    if chunk:
+                        data += chunk
+                        continue
+                    if stop_event.is_set() or not self._at_end():
+                        exhausted = True
+                        break
+
+            # Past the end, keep the clock running with silence so consumer timeouts still fire
+            data = data.ljust(buffer_bytes, b'\0')
+            self.frames_read += self.buffer_frames
+            self._fan_out(data)
+
+            if self.paced or exhausted:
+                next_deadline = max(next_deadline + buffer_seconds, time.monotonic() - buffer_seconds)
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    stop_event.wait(delay)
+
+    def _close_stream(self) -> None:
+        self._stop_event.set()
+        thread = self._stream
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+        self._stream = None
+
+        if self._source:
+            try:
+                self._source.close()
+            except OSError:
+                pass
+            self._source = None
+
+
+class FileCapture(SourceCapture):
+    """Replays a WAV or raw PCM file (16 kHz, 16-bit mono) at real-time speed"""
+
+    def __init__(self, path: str, loop: bool = False, **kwargs):
+        """
+        Args:
+            path: .wav file, or headerless PCM for any other extension
+            loop: Rewind at the end instead of continuing with silence
+        """
+        super().__init__(path, **kwargs)
+        self.loop = loop
+
+    def _open_source(self) -> BinaryIO:
+        if self.path.suffix.lower() != '.wav':
+            return open(self.path, 'rb')
+
+        with wave.open(str(self.path), 'rb') as wav:
+            if (wav.getframerate() != self.sample_rate or wav.getnchannels() != 1
+                    or wav.getsampwidth() != SAMPLE_WIDTH):
+                raise ValueError(f"expected {self.sample_rate} Hz 16-bit mono WAV")
+            return io.BytesIO(wav.readframes(wav.getnframes()))
+
+    def _at_end(self) -> bool:
+        if not self.loop or self._source.tell() == 0:
+            logger.info(f"End of audio source {self.path}")
+            return False
+        self._source.seek(0)
+        return True
+
+
+class PipeCapture(SourceCapture):
+    """Reads raw 16-bit mono PCM from a named pipe; the writer sets the pace"""
+
+    paced = False
+    open_blocks = True
+
+    def _open_source(self) -> BinaryIO:
+        # Blocks until a writer opens the pipe (runs on the reader thread)
+        return open(self.path, 'rb', buffering=0)
+
+    def _at_end(self) -> bool:
+        # Writer closed - wait for the next one
+        self._source.close()
+        self._source = self._open_source()
+        return True
+
+
+def create_audio_capture() -> AudioCapture:
+    """
+    Create the capture backend selected by audio.input
+
+    Returns:
+        Microphone capture, or a file / named pipe source for headless runs
+    """
+    backend = config.get('audio.input', 'microphone')
+    path = config.get('audio.input_path')
+
+    if backend == 'file' and path:
+        return FileCapture(path, loop=config.get_bool('audio.input_loop', False))
+    if backend == 'pipe' and path:
+        return PipeCapture(path)
+    if backend != 'microphone':
+        logger.error(f"Audio input '{backend}' needs audio.input_path - using microphone")
+    return AudioCapture()
+
+
+_capture: Optional[AudioCapture] = None
+_capture_lock = threading.Lock()
+
+
+def get_audio_capture() -> AudioCapture:
+    """Get the process-wide shared capture stream"""
+    global _capture
+    with _capture_lock:
+        if _capture is None:
+            _capture = create_audio_capture()
+        return _capture
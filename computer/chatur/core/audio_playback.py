@@ -0,0 +1,75 @@
+"""
+WAV playback for synthesized speech
+Plays in small blocks so a barge-in can stop a clip mid-sentence
+"""
+
+import wave
+import threading
+from typing import BinaryIO, Callable, Optional, Union
+from chatur.utils.logger import setup_logger
+
+logger = setup_logger('chatur.audio_playback')
+
+BLOCK_FRAMES = 1024  # ~23-64 ms per write depending on the clip's sample rate
+
+
+class WavPlayer:
+    """Plays WAV files on the default output device (one PyAudio instance per process)"""
+
+    def __init__(self):
+        self._audio = None
+        self._lock = threading.Lock()
+
+    def _pyaudio(self):
+        with self._lock:
+            if self._audio is None:
+                import pyaudio
+                self._audio = pyaudio.PyAudio()
+            return self._audio
+
+    def play(self, path: Union[str, BinaryIO], should_stop: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Play a WAV file or stream, blocking until it ends
+
+        Args:
+            path: WAV file, or a readable WAV stream (e.g. a subprocess's stdout)
+            should_stop: Checked between blocks; playback ends early when it returns True
+
+        Returns:
+            True if the whole clip was played
+        """
+        try:
+            audio = self._pyaudio()
+            with wave.open(path, 'rb') as wav:
+                stream = audio.open(
+                    format=audio.get_format_from_width(wav.getsampwidth()),
+                    channels=wav.getnchannels(),
+                    rate=wav.getframerate(),
+                    output=True
+                )
+                try:
+                    data = wav.readframes(BLOCK_FRAMES)
+                    while data:
+                        if should_stop and should_stop():
+                            return False
+                        stream.write(data)
+                        data = wav.readframes(BLOCK_FRAMES)
+                finally:
+                    stream.stop_stream()
+                    stream.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"Playback of {path} failed: {e}")
+            return False
+
+
+_player: Optional[WavPlayer] = None
+
+
+def get_player() -> WavPlayer:
+    """Get the process-wide WAV player"""
+    global _player
+    if _player is None:
+        _player = WavPlayer()
+    return _player
@@ -0,0 +1,68 @@
+"""Restricted command vocabulary for grammar-constrained offline recognition"""
+
+import json
+import re
+from typing import List, Iterable
+from chatur.core.intent_keywords import INTENT_KEYWORDS, CLOSE_KEYWORDS
+from chatur.utils.config import config
+
+UNKNOWN_WORD = '[unk]'
+
+# Words that fill intent slots (durations, times, actions, targets)
+SLOT_WORDS: List[str] = [
+    # Numbers
+    'zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten',
+    'eleven', 'twelve', 'thirteen', 'fourteen', 'fifteen', 'sixteen', 'seventeen',
+    'eighteen', 'nineteen', 'twenty', 'thirty', 'forty', 'fifty', 'sixty', 'seventy',
+    'eighty', 'ninety', 'hundred', 'half', 'quarter',
+    # Time
+    'second', 'seconds', 'minute', 'minutes', 'hour', 'hours', 'am', 'pm', "o'clock",
+    'today', 'tomorrow', 'tonight', 'morning', 'afternoon', 'evening', 'night',
+    'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+    # Actions
+    'set', 'add', 'create', 'new', 'show', 'read', 'check', 'search', 'find', 'complete',
+    'finish', 'done', 'remove', 'delete', 'increase', 'decrease', 'up', 'down', 'silent',
+    'percent', 'latest', 'pending', 'schedule',
+    # Targets
+    'battery', 'cpu', 'memory', 'disk', 'network', 'weather', 'calendar', 'event',
+    'events', 'meeting', 'emails', 'tasks', 'website', 'site', 'file',
+    # Function words
+    'a', 'an', 'the', 'my', 'me', 'to', 'for', 'at', 'in', 'on', 'of', 'and', 'from',
+    'what', "what's", 'is', 'are', 'please', 'can', 'you', 'i', 'have', 'any', 'it',
+]
+
+_WORD_PATTERN = re.compile(r"^[a-z']+$")
+
+
+def _ascii_words(phrases: Iterable[str]) -> List[str]:
+    """Split phrases into lowercase latin words (the offline models are English)"""
+    words = []
+    for phrase in phrases:
+        for word in re.split(r"[\s\-]+", phrase.lower()):
+            if _WORD_PATTERN.match(word):
+                words.append(word)
+    return words
+
+
+def build_command_vocabulary() -> List[str]:
+    """
+    Collect every word the command recognizer should accept
+
+    Returns:
+        Sorted, de-duplicated word list drawn from intent keywords,
+        recognized apps and common slot words
+    """
+    phrases: List[str] = []
+    for keywords in INTENT_KEYWORDS.values():
+        phrases.extend(keywords)
+    phrases.extend(CLOSE_KEYWORDS)
+    phrases.extend(config.recognized_apps)
+    phrases.append(config.default_browser)
+    phrases.extend(SLOT_WORDS)
+
+    return sorted(set(_ascii_words(phrases)))
+
+
+def build_command_grammar() -> str:
+    """Build the JSON grammar accepted by KaldiRecognizer"""
+    return json.dumps(build_command_vocabulary() + [UNKNOWN_WORD])
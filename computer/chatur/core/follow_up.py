@@ -0,0 +1,67 @@
+"""
+Follow-up window after a spoken reply
+Speech that starts within the window begins the next turn without re-activation
+"""
+
+from contextlib import nullcontext
+from typing import Callable, Optional
+from chatur.core.audio_capture import AudioCapture
+from chatur.core.vad import record_utterance
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.follow_up')
+
+
+def listen_for_follow_up(
+    stt,
+    window_seconds: Optional[float] = None,
+    on_listening: Optional[Callable[[], None]] = None,
+    capture: Optional[AudioCapture] = None
+) -> Optional[str]:
+    """
+    Keep the shared mic open for the follow-up window after a reply
+
+    Args:
+        stt: STT engine; engines without transcribe() fall back to their own listen()
+        window_seconds: How long to wait for speech (default: conversation.follow_up_seconds, 0 disables)
+        on_listening: Called once the window opens (e.g. to show the listening state)
+        capture: Capture stream (default: shared stream)
+
+    Returns:
+        Recognized follow-up text, or None if nobody spoke in time
+    """
+    window = window_seconds if window_seconds is not None else config.get_float('conversation.follow_up_seconds', 6.0)
+    if window <= 0:
+        return None
+
+    if on_listening:
+        on_listening()
+
+    if not hasattr(stt, 'transcribe'):
+        # E.g. Azure: records from its own microphone with its own silence timeout
+        text = stt.listen()
+        if text:
+            metrics.increment('conversation.follow_up_turns')
+        return text
+
+    noise_tracker = getattr(stt, 'noise_tracker', None)
+    energy_threshold = (
+        noise_tracker.energy_threshold if noise_tracker and noise_tracker.calibrated
+        else config.get_float('conversation.follow_up_energy_threshold', 300.0)
+    )
+
+    # The noise floor must not adapt to the user's own voice
+    with noise_tracker.paused() if noise_tracker else nullcontext():
+        audio = record_utterance(capture=capture, energy_threshold=energy_threshold, timeout_seconds=window)
+    if not audio:
+        logger.info("Follow-up window closed")
+        return None
+
+    result = stt.transcribe(audio)
+    if not result:
+        return None
+
+    metrics.increment('conversation.follow_up_turns')
+    return result.text
@@ -4,29 +4,124 @@ Free, no API key required
 """
 
 import speech_recognition as sr
+from chatur.core.audio_capture import AudioCapture, AudioSubscription, SAMPLE_WIDTH, get_audio_capture
+from chatur.core.vad import NoiseFloorTracker
+from chatur.models.transcription import Transcription
 from chatur.utils.logger import setup_logger
 from typing import Optional
 
 logger = setup_logger('chatur.google_stt')
 
 
+class _SubscriptionStream:
+    """File-like adapter that serves shared-capture frames to speech_recognition"""
+    
+    def __init__(self, subscription: AudioSubscription):
+        self._subscription = subscription
+        self._buffer = b''
+    
+    def read(self, size: int) -> bytes:
+        needed = size * SAMPLE_WIDTH
+        while len(self._buffer) < needed:
+            frame = self._subscription.read(timeout=1.0)
+            if frame is None:
+                break
+            self._buffer += frame
+        
+        data, self._buffer = self._buffer[:needed], self._buffer[needed:]
+        return data
+
+
+class CaptureSource(sr.AudioSource):
+    """speech_recognition audio source backed by the shared capture stream"""
+    
+    def __init__(self, capture: AudioCapture):
+        self.capture = capture
+        self.SAMPLE_RATE = capture.sample_rate
+        self.SAMPLE_WIDTH = SAMPLE_WIDTH
+        self.CHUNK = capture.frame_length
+        self.stream = None
+        self._subscription: Optional[AudioSubscription] = None
+    
+    def __enter__(self) -> 'CaptureSource':
+        self._subscription = self.capture.subscribe()
+        if self._subscription is None:
+            raise OSError("Microphone not available")
+        self.stream = _SubscriptionStream(self._subscription)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._subscription:
+            self._subscription.close()
+        self._subscription = None
+        self.stream = None
+
+
 class GoogleSTT:
     """Google Speech Recognition wrapper"""
     
-    def __init__(self):
-        """Initialize Google Speech Recognition"""
+    def __init__(self, noise_tracker: Optional[NoiseFloorTracker] = None, recognizer: Optional[sr.Recognizer] = None):
+        """
+        Initialize Google Speech Recognition
+        
+        Args:
+            noise_tracker: Tracker owned by the caller (e.g. the racing engine); it is
+                          not started here. Default: start one on the shared stream
+            recognizer: Recognizer to use instead of sr.Recognizer(), e.g. a subclass whose
+                       recognize_google() talks to a local stand-in
+        """
         try:
-            self.recognizer = sr.Recognizer()
+            self.recognizer = recognizer or sr.Recognizer()
             
             # Adjust for ambient noise
             self.recognizer.energy_threshold = 4000
             self.recognizer.dynamic_energy_threshold = True
             
+            # Track the noise floor while idle so activations skip calibration
+            if noise_tracker is None:
+                noise_tracker = NoiseFloorTracker(on_threshold=self._set_energy_threshold)
+                noise_tracker.start()
+            self.noise_tracker = noise_tracker
+            
             logger.info("Google STT engine initialized")
         except Exception as e:
             logger.error(f"Failed to initialize Google STT: {e}")
             self.recognizer = None
     
+    def _set_energy_threshold(self, threshold: float) -> None:
+        """Receive background noise floor updates"""
+        self.recognizer.energy_threshold = threshold
+    
+    def is_available(self) -> bool:
+        return self.recognizer is not None
+    
+    def transcribe(self, audio: bytes, sample_rate: int = 16000) -> Optional[Transcription]:
+        """
+        Transcribe already captured audio
+        
+        Args:
+            audio: Raw 16-bit mono PCM
+            sample_rate: Sample rate of the audio
+            
+        Returns:
+            Transcription or None if nothing was recognized
+        """
+        if not self.recognizer:
+            return None
+        
+        audio_data = sr.AudioData(audio, sample_rate, SAMPLE_WIDTH)
+        try:
+            response = self.recognizer.recognize_google(audio_data, language='en-IN', show_all=True)
+        except sr.UnknownValueError:
+            return None
+        
+        alternatives = response.get('alternative', []) if isinstance(response, dict) else []
+        if not alternatives or not alternatives[0].get('transcript'):
+            return None
+        
+        best = alternatives[0]
+        return Transcription(text=best['transcript'], engine='google', confidence=best.get('confidence'))
+    
     def recognize_once(self, timeout_seconds: int = 10) -> Optional[str]:
         """
         Recognize speech from microphone using Google
@@ -45,10 +140,13 @@ class GoogleSTT:
             logger.info("Listening for speech...")
             print("🎤 Listening... (speak clearly)")
             
-            with sr.Microphone() as source:
-                # Adjust for ambient noise
-                logger.info("Adjusting for ambient noise...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+            with self.noise_tracker.paused(), CaptureSource(get_audio_capture()) as source:
+                # Only calibrate inline if the background tracker has no estimate yet
+                if self.noise_tracker.calibrated:
+                    self.recognizer.energy_threshold = self.noise_tracker.energy_threshold
+                else:
+                    logger.info("Adjusting for ambient noise...")
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
                 
                 # Listen for speech
                 audio = self.recognizer.listen(source, timeout=timeout_seconds)
@@ -83,6 +181,10 @@ class GoogleSTT:
             print(f"❌ Error: {e}")
             return None
     
+    def listen(self) -> Optional[str]:
+        """Alias for recognize_once for compatibility"""
+        return self.recognize_once()
+    
     def recognize_with_language_detection(self) -> Optional[tuple[str, str]]:
         """
         Recognize speech with language detection
@@ -0,0 +1,18 @@
+"""Trigger keywords for rule-based intent classification"""
+
+from typing import Dict, List
+from chatur.models.intent import IntentType
+
+INTENT_KEYWORDS: Dict[IntentType, List[str]] = {
+    IntentType.REMINDER: ['remind', 'reminder', 'याद', 'रिमाइंडर'],
+    IntentType.TIMER: ['timer', 'टाइमर', 'countdown'],
+    IntentType.NOTE: ['remember', 'note', 'याद रख', 'save'],
+    IntentType.EMAIL: ['email', 'mail', 'inbox', 'gmail', 'unread'],
+    IntentType.APP_LAUNCH: ['open', 'launch', 'start', 'close', 'quit', 'exit', 'kill', 'band',
+                            'खोल', 'kholo', 'khol', 'chalu', 'chalao', 'browser'],
+    IntentType.MEDIA_CONTROL: ['play', 'pause', 'next', 'previous', 'stop', 'music', 'song', 'track',
+                               'gana', 'bajao', 'roko', 'volume', 'awaz', 'awaaz', 'mute', 'loud', 'quiet'],
+    IntentType.TASK: ['task', 'todo', 'to-do', 'list'],
+}
+
+CLOSE_KEYWORDS: List[str] = ['close', 'quit', 'exit', 'kill', 'band', 'बंद']
@@ -0,0 +1,264 @@
+"""
+Pluggable keyword spotting backends for wake word detection
+Porcupine (licensed, needs an access key) or Vosk grammar spotting (fully offline)
+"""
+
+import os
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Dict, Type
+import numpy as np
+from chatur.core.audio_capture import SAMPLE_RATE, FRAME_LENGTH
+from chatur.core.command_grammar import UNKNOWN_WORD
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+
+logger = setup_logger('chatur.keyword_backends')
+
+
+class BuiltInKeywords:
+    """Built-in Porcupine keywords that don't require custom .ppn files"""
+
+    ALEXA = "alexa"
+    AMAZON = "amazon"
+    COMPUTER = "computer"
+    BLUEBERRY = "blueberry"
+    BUMBLEBEE = "bumblebee"
+    CORNFLOWER = "cornflower"
+    GRASSHOPPER = "grasshopper"
+    HEY_GOOGLE = "hey google"
+    HEY_SIRI = "hey siri"
+    JARVIS = "jarvis"
+    OK_GOOGLE = "ok google"
+    PICOVOICE = "picovoice"
+    PORCUPINE = "porcupine"
+    TERMINATOR = "terminator"
+
+    @classmethod
+    def all(cls) -> List[str]:
+        """Get all built-in keywords"""
+        return [
+            cls.ALEXA, cls.AMAZON, cls.COMPUTER, cls.BLUEBERRY,
+            cls.BUMBLEBEE, cls.CORNFLOWER, cls.GRASSHOPPER,
+            cls.HEY_GOOGLE, cls.HEY_SIRI, cls.JARVIS, cls.OK_GOOGLE,
+            cls.PICOVOICE, cls.PORCUPINE, cls.TERMINATOR
+        ]
+
+
+class KeywordBackend(ABC):
+    """Abstract keyword spotter fed fixed-size 16-bit PCM frames"""
+
+    name = "base"
+    sample_rate = SAMPLE_RATE
+    frame_length = FRAME_LENGTH
+
+    @abstractmethod
+    def process(self, frame: bytes) -> int:
+        """
+        Run the spotter on one frame of frame_length samples
+
+        Returns:
+            Index of the detected keyword, or -1
+        """
+        pass
+
+    def reset(self) -> None:
+        """Drop any buffered decoder state"""
+        pass
+
+
+class PorcupineBackend(KeywordBackend):
+    """Picovoice Porcupine keyword spotting"""
+
+    name = "porcupine"
+
+    def __init__(self, keywords: List[str], sensitivity: float = 0.5):
+        """
+        Args:
+            keywords: Keywords to detect (.ppn file or Porcupine built-in)
+            sensitivity: Detection sensitivity (0.0 to 1.0)
+
+        Raises:
+            ImportError: pvporcupine not installed
+            RuntimeError: No access key or no usable keyword
+        """
+        import pvporcupine
+
+        access_key = os.getenv('PORCUPINE_ACCESS_KEY')
+        if not access_key:
+            raise RuntimeError("PORCUPINE_ACCESS_KEY not set")
+
+        keyword_paths = []
+        for keyword in keywords:
+            keyword_path = self._get_keyword_path(keyword)
+            if keyword_path:
+                keyword_paths.append(keyword_path)
+            elif keyword.lower() in BuiltInKeywords.all():
+                keyword_paths.append(pvporcupine.KEYWORD_PATHS[keyword.lower()])
+
+        if not keyword_paths:
+            raise RuntimeError("No valid keyword paths found")
+
+        self.porcupine = pvporcupine.create(
+            access_key=access_key,
+            keyword_paths=keyword_paths,
+            sensitivities=[sensitivity] * len(keyword_paths)
+        )
+        self.sample_rate = self.porcupine.sample_rate
+        self.frame_length = self.porcupine.frame_length
+
+    def _get_keyword_path(self, keyword: str) -> Optional[str]:
+        """Get the path to the keyword .ppn file"""
+        keyword_lower = keyword.lower().replace(' ', '_')
+
+        base_dir = Path(__file__).parent.parent.parent
+
+        search_paths = [
+            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}_windows.ppn',
+            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}.ppn',
+            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}_linux.ppn',
+            base_dir / 'config' / 'wake_words' / f'{keyword_lower}_windows.ppn',
+        ]
+
+        for path in search_paths:
+            if path.exists():
+                logger.info(f"Found keyword file: {path}")
+                return str(path)
+
+        logger.warning(f"Keyword file not found for: {keyword}")
+        return None
+
+    def process(self, frame: bytes) -> int:
+        return self.porcupine.process(np.frombuffer(frame, dtype=np.int16))
+
+
+class VoskKeywordBackend(KeywordBackend):
+    """
+    Offline keyword spotting with a Vosk recognizer restricted to the keywords
+
+    Everything that is not a keyword decodes to [unk], so the search stays
+    tiny and a keyword shows up in the partial result while it is spoken.
+    Sensitivity maps to a minimum word confidence: a keyword fires only when
+    every one of its words has conf >= 1 - sensitivity.
+    """
+
+    name = "vosk"
+    frame_length = FRAME_LENGTH * 2  # ~64 ms per AcceptWaveform call
+
+    def __init__(self, keywords: List[str], sensitivity: float = 0.5, model_path: Optional[str] = None):
+        """
+        Args:
+            keywords: Keywords to detect (words must be in the model's vocabulary)
+            sensitivity: Detection sensitivity (0.0 to 1.0); higher accepts lower-confidence words
+            model_path: Vosk model directory (default: stt.vosk_model_path)
+
+        Raises:
+            ImportError: vosk not installed
+            RuntimeError: Model not found
+            ValueError: Sensitivity outside 0.0 to 1.0
+        """
+        if not 0.0 <= sensitivity <= 1.0:
+            raise ValueError(f"sensitivity must be between 0.0 and 1.0, got {sensitivity}")
+
+        from vosk import KaldiRecognizer
+        from chatur.core.vosk_stt import find_model_path, load_model
+
+        model_path = find_model_path(model_path or config.get('wake_word.vosk_model_path') or None)
+        if not model_path:
+            raise RuntimeError("Vosk model not found")
+
+        self.keywords = [keyword.lower() for keyword in keywords]
+        self.min_confidence = 1.0 - sensitivity
+        grammar = json.dumps(self.keywords + [UNKNOWN_WORD])
+        self.recognizer = KaldiRecognizer(load_model(model_path), self.sample_rate, grammar)
+        self.recognizer.SetWords(True)
+
+        # Per-word confidences in partial results need vosk >= 0.3.42
+        self.partial_words = hasattr(self.recognizer, 'SetPartialWords')
+        if self.partial_words:
+            self.recognizer.SetPartialWords(True)
+        else:
+            logger.warning("This vosk version has no partial word confidences - keywords fire at utterance end only")
+
+    def _match(self, words: List[dict]) -> int:
+        """
+        Find a keyword in a Vosk word list
+
+        Args:
+            words: Vosk 'result' / 'partial_result' entries ({'word': ..., 'conf': ...})
+
+        Returns:
+            Index of the first keyword whose words all meet min_confidence, or -1
+        """
+        tokens = [word.get('word', '') for word in words]
+        for index, keyword in enumerate(self.keywords):
+            parts = keyword.split()
+            for start in range(len(tokens) - len(parts) + 1):
+                if tokens[start:start + len(parts)] != parts:
+                    continue
+                if all(word.get('conf', 1.0) >= self.min_confidence for word in words[start:start + len(parts)]):
+                    return index
+        return -1
+
+    def process(self, frame: bytes) -> int:
+        if self.recognizer.AcceptWaveform(frame):
+            words = json.loads(self.recognizer.Result()).get('result', [])
+        elif self.partial_words:
+            words = json.loads(self.recognizer.PartialResult()).get('partial_result', [])
+        else:
+            return -1
+
+        index = self._match(words)
+        if index >= 0:
+            # Start fresh so the same utterance does not fire again
+            self.recognizer.Reset()
+        return index
+
+    def reset(self) -> None:
+        self.recognizer.Reset()
+
+
+BACKENDS: Dict[str, Type[KeywordBackend]] = {
+    'porcupine': PorcupineBackend,
+    'vosk': VoskKeywordBackend,
+}
+
+
+def create_keyword_backend(
+    name: Optional[str] = None,
+    keywords: Optional[List[str]] = None,
+    sensitivity: float = 0.5
+) -> Optional[KeywordBackend]:
+    """
+    Create a keyword backend from config
+
+    Args:
+        name: porcupine, vosk or auto (default: wake_word.backend);
+              auto tries Porcupine first and falls back to Vosk
+        keywords: Keywords to detect (default: ['computer'])
+        sensitivity: Detection sensitivity (0.0 to 1.0)
+
+    Returns:
+        KeywordBackend instance or None if no backend could be created
+    """
+    name = (name or config.get('wake_word.backend', 'auto')).lower()
+    keywords = keywords or ['computer']
+    candidates = list(BACKENDS) if name == 'auto' else [name]
+
+    for candidate in candidates:
+        backend_class = BACKENDS.get(candidate)
+        if backend_class is None:
+            logger.error(f"Unknown wake word backend: {candidate}")
+            continue
+        try:
+            backend = backend_class(keywords, sensitivity)
+            logger.info(f"Wake word backend: {candidate} ({keywords})")
+            return backend
+        except ImportError as e:
+            logger.warning(f"{candidate} wake word backend not installed: {e}")
+        except Exception as e:
+            logger.warning(f"{candidate} wake word backend unavailable: {e}")
+
+    logger.warning("No wake word backend available - wake word detection disabled")
+    return None
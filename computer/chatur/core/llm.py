@@ -2,9 +2,11 @@
 
 import os
 import re
+import threading
 from typing import Optional, List, Dict, Any
 from openai import OpenAI
 from chatur.models.intent import Intent, IntentType
+from chatur.core.intent_keywords import INTENT_KEYWORDS, CLOSE_KEYWORDS
 from chatur.utils.logger import setup_logger
 from chatur.utils.config import config
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -118,7 +120,7 @@ class LLMClient:
         response_language = language
         
         # Reminder intent
-        if any(word in text_lower for word in ['remind', 'reminder', 'याद', 'रिमाइंडर']):
+        if any(word in text_lower for word in INTENT_KEYWORDS[IntentType.REMINDER]):
             # Extract time
             time_str = 'in 1 hour'
             if 'at' in text_lower:
@@ -134,7 +136,7 @@ class LLMClient:
             )
         
         # Timer intent
-        elif any(word in text_lower for word in ['timer', 'टाइमर', 'countdown']):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.TIMER]):
             # Extract duration
             duration = '5 minutes'
             if 'second' in text_lower:
@@ -154,7 +156,7 @@ class LLMClient:
             )
         
         # Note intent
-        elif any(word in text_lower for word in ['remember', 'note', 'याद रख', 'save']):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.NOTE]):
             return Intent(
                 type=IntentType.NOTE,
                 language=language,
@@ -163,7 +165,7 @@ class LLMClient:
             )
         
         # Email intent (check before app launcher to avoid "open mail" being treated as app launch)
-        elif any(word in text_lower for word in ['email', 'mail', 'inbox', 'gmail', 'unread']):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.EMAIL]):
             action = 'read'
             if 'search' in text_lower or 'find' in text_lower or 'from' in text_lower:
                 action = 'search'
@@ -195,9 +197,9 @@ class LLMClient:
             )
         
         # App launch intent
-        elif any(word in text_lower for word in ['open', 'launch', 'start', 'close', 'quit', 'exit', 'kill', 'band', 'खोल', 'kholo', 'khol', 'chalu', 'chalao', 'browser']):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.APP_LAUNCH]):
             # Determine action
-            action = 'close' if any(word in text_lower for word in ['close', 'quit', 'exit', 'kill', 'band', 'बंद']) else 'open'
+            action = 'close' if any(word in text_lower for word in CLOSE_KEYWORDS) else 'open'
             
             # Check for URLs or websites
             # Build TLD pattern from config
@@ -267,7 +269,7 @@ class LLMClient:
         
         
         # Media control intent
-        elif any(word in text_lower for word in ['play', 'pause', 'next', 'previous', 'stop', 'music', 'song', 'track', 'gana', 'bajao', 'roko', 'volume', 'awaz', 'awaaz', 'mute', 'loud', 'quiet']):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.MEDIA_CONTROL]):
             action = 'play'
             volume_level = None
             
@@ -301,7 +303,7 @@ class LLMClient:
             )
 
         # Task/Todo intent
-        elif any(word in text_lower for word in ['task', 'todo', 'to-do', 'list']) or ('remind' in text_lower and not any(t in text_lower for t in ['at ', 'in ', 'tomorrow', 'next', 'baje'])):
+        elif any(word in text_lower for word in INTENT_KEYWORDS[IntentType.TASK]) or ('remind' in text_lower and not any(t in text_lower for t in ['at ', 'in ', 'tomorrow', 'next', 'baje'])):
             action = 'add'
             title = text
             
@@ -340,7 +342,13 @@ class LLMClient:
             )
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def answer_question(self, question: str, language: str = 'en', conversation_history: Optional[List[Dict[str, str]]] = None) -> str:
+    def answer_question(
+        self,
+        question: str,
+        language: str = 'en',
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> str:
         """
         Answer a question using OpenAI with conversation context
         
@@ -348,6 +356,7 @@ class LLMClient:
             question: The users question
             language: Response language
             conversation_history: List of recent exchanges (optional)
+            cancel_event: When set, generation stops and an empty answer is returned (barge-in)
         
         Returns:
             Answer string
@@ -374,14 +383,27 @@ class LLMClient:
             
             messages.append({"role": "user", "content": question})
             
-            response = self.client.chat.completions.create(
+            # Stream so a barge-in can abandon the request mid-generation
+            stream = self.client.chat.completions.create(
                 model=config.openai_model,
                 messages=messages,
                 temperature=0.7,
-                max_tokens=config.openai_max_tokens
+                max_tokens=config.openai_max_tokens,
+                stream=True
             )
             
-            answer = response.choices[0].message.content
+            parts: List[str] = []
+            try:
+                for chunk in stream:
+                    if cancel_event is not None and cancel_event.is_set():
+                        logger.info("Answer generation cancelled")
+                        return ""
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+            finally:
+                stream.close()
+            
+            answer = ''.join(parts)
             logger.info(f"Generated context-aware answer for: {question[:50]}...")
             return answer if answer else "I'm having trouble answering that right now."
             
@@ -0,0 +1,213 @@
+"""
+Local Whisper STT using faster-whisper (CTranslate2)
+Offline, quantized CPU inference - no API key or network round trip
+"""
+
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Tuple
+import numpy as np
+import psutil
+from faster_whisper import WhisperModel
+from chatur.core.vad import NoiseFloorTracker, record_utterance, trim_silence
+from chatur.models.transcription import Transcription
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+
+logger = setup_logger('chatur.local_whisper_stt')
+
+# Keep one warm model per (path, compute type, threads) for the whole process
+_models: Dict[Tuple[str, str, int], WhisperModel] = {}
+_models_lock = threading.Lock()
+
+
+def load_model(model_path: str, compute_type: str = 'int8', cpu_threads: int = 4) -> WhisperModel:
+    """Load a CTranslate2 Whisper model once per process"""
+    key = (str(Path(model_path).resolve()), compute_type, cpu_threads)
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            model = WhisperModel(
+                key[0],
+                device='cpu',
+                compute_type=compute_type,
+                cpu_threads=cpu_threads,
+                local_files_only=True
+            )
+            _models[key] = model
+        return model
+
+
+class LocalWhisperSTT:
+    """Whisper-family model running locally on the CPU"""
+
+    def __init__(self, model_path: Optional[str] = None, noise_tracker: Optional[NoiseFloorTracker] = None):
+        """
+        Initialize local Whisper
+
+        Args:
+            model_path: CTranslate2 model directory (default: stt.local_whisper_model_path)
+            noise_tracker: Tracker owned by the caller (e.g. the racing engine); it is
+                          not started here. Default: start one on the shared stream
+        """
+        self.sample_rate = 16000
+        self.compute_type = config.get('stt.local_whisper_compute_type', 'int8')
+        # 0 = one thread per physical core (hyper-threads don't help GEMM-bound decoding)
+        self.cpu_threads = (
+            config.get_int('stt.local_whisper_threads', 0)
+            or psutil.cpu_count(logical=False)
+            or os.cpu_count()
+            or 4
+        )
+        self.beam_size = config.get_int('stt.local_whisper_beam_size', 1)
+        self.language = config.get('stt.local_whisper_language', 'en')
+        self.vad_trim = config.get_bool('stt.local_whisper_vad_trim', True)
+        self.model: Optional[WhisperModel] = None
+
+        model_path = model_path or config.get('stt.local_whisper_model_path', 'models/whisper-base.en-ct2')
+        path = Path(model_path)
+        if not path.is_absolute():
+            path = Path(__file__).parent.parent.parent / path
+
+        if not path.exists():
+            logger.error(f"Local Whisper model not found at {path}")
+            logger.error("Convert one with ct2-transformers-converter or download a faster-whisper model")
+            return
+
+        try:
+            logger.info(f"Loading local Whisper model from {path} ({self.compute_type})...")
+            self.model = load_model(str(path), self.compute_type, self.cpu_threads)
+            logger.info(f"Local Whisper STT initialized ({self.compute_type}, {self.cpu_threads} threads)")
+        except Exception as e:
+            logger.error(f"Failed to initialize local Whisper: {e}")
+            self.model = None
+            return
+
+        if noise_tracker is None:
+            noise_tracker = NoiseFloorTracker()
+            noise_tracker.start()
+        self.noise_tracker = noise_tracker
+
+    def is_available(self) -> bool:
+        return self.model is not None
+
+    def warm_up(self) -> None:
+        """Run one decode so the first real utterance does not pay allocation cost"""
+        if self.model:
+            self._decode(np.zeros(self.sample_rate // 2, dtype=np.float32), self.language)
+
+    def _energy_threshold(self) -> float:
+        tracker = getattr(self, 'noise_tracker', None)
+        if tracker and tracker.calibrated:
+            return tracker.energy_threshold
+        return 300.0
+
+    def _decode(self, samples: np.ndarray, language: Optional[str]) -> Tuple[str, Optional[float], str]:
+        """Returns (text, confidence, detected language)"""
+        segments, info = self.model.transcribe(
+            samples,
+            language=language,
+            beam_size=self.beam_size,
+            condition_on_previous_text=False,
+            without_timestamps=True
+        )
+        segments = list(segments)
+        text = ' '.join(segment.text.strip() for segment in segments).strip()
+
+        confidence = None
+        if segments:
+            mean_logprob = sum(segment.avg_logprob for segment in segments) / len(segments)
+            confidence = math.exp(mean_logprob)
+        return text, confidence, info.language
+
+    def transcribe(self, audio: bytes, language: Optional[str] = "en") -> Optional[Transcription]:
+        """
+        Transcribe already captured audio
+
+        Args:
+            audio: Raw 16-bit mono PCM at 16 kHz
+            language: Language hint, or None to auto-detect
+
+        Returns:
+            Transcription or None if nothing was recognized
+        """
+        if not self.model:
+            return None
+
+        if self.vad_trim:
+            # Whisper's cost grows with input length; don't spend it on silence
+            audio = trim_silence(audio, energy_threshold=self._energy_threshold())
+            if not audio:
+                return None
+
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        text, confidence, _ = self._decode(samples, language)
+        if not text:
+            return None
+        return Transcription(text=text, engine='local_whisper', confidence=confidence)
+
+    def recognize_once(self, timeout_seconds: int = 10) -> Optional[str]:
+        """
+        Capture one utterance from the shared stream and transcribe it
+
+        Args:
+            timeout_seconds: Maximum time to wait for speech
+
+        Returns:
+            Recognized text or None if recognition failed
+        """
+        if not self.model:
+            logger.error("Local Whisper STT not available - model not loaded")
+            return None
+
+        logger.info("Listening for speech...")
+        print("🎤 Listening... (speak clearly)")
+
+        with self.noise_tracker.paused():
+            audio = record_utterance(
+                energy_threshold=self._energy_threshold(),
+                timeout_seconds=timeout_seconds
+            )
+
+        if not audio:
+            logger.warning("No speech detected")
+            print("⚠️  No speech detected")
+            return None
+
+        print("🔄 Processing...")
+        result = self.transcribe(audio, language=self.language)
+        if not result:
+            return None
+
+        logger.info(f"Recognized: {result.text}")
+        print(f"✅ Recognized: {result.text}")
+        return result.text
+
+    def listen(self) -> Optional[str]:
+        """Alias for recognize_once for compatibility"""
+        return self.recognize_once()
+
+    def recognize_with_language_detection(self) -> Optional[tuple[str, str]]:
+        """
+        Recognize speech with Whisper's own language identification
+
+        Returns:
+            Tuple of (recognized_text, detected_language) or None
+        """
+        if not self.model:
+            return None
+
+        with self.noise_tracker.paused():
+            audio = record_utterance(energy_threshold=self._energy_threshold())
+        if not audio:
+            return None
+
+        if self.vad_trim:
+            audio = trim_silence(audio, energy_threshold=self._energy_threshold()) or audio
+        samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+        text, _, language = self._decode(samples, None)
+        if not text:
+            return None
+        return (text, 'hi' if language == 'hi' else 'en')
@@ -0,0 +1,211 @@
+"""
+Composite STT engine that races several engines on the same audio
+First acceptable transcript wins; slow or failing providers never block the user
+"""
+
+import time
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from typing import Dict, Optional, Any
+from chatur.core.vad import NoiseFloorTracker, record_utterance
+from chatur.models.transcription import Transcription
+from chatur.utils.logger import setup_logger
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.racing_stt')
+
+
+class RacingSTT:
+    """Feeds one captured utterance to several engines in parallel"""
+
+    def __init__(
+        self,
+        engines: Dict[str, Any],
+        min_confidence: float = 0.6,
+        min_chars: int = 2,
+        deadline_seconds: float = 8.0,
+        noise_tracker: Optional[NoiseFloorTracker] = None
+    ):
+        """
+        Args:
+            engines: Engine name -> instance, in priority order (each must implement transcribe)
+            min_confidence: Lowest acceptable confidence (engines without scores skip this check)
+            min_chars: Shortest acceptable transcript
+            deadline_seconds: Give up on the race after this long
+            noise_tracker: Tracker already started and shared with the engines
+                          (default: start one on the shared stream)
+        """
+        self.engines = {
+            name: engine for name, engine in engines.items()
+            if hasattr(engine, 'transcribe') and engine.is_available()
+        }
+        self.min_confidence = min_confidence
+        self.min_chars = min_chars
+        self.deadline_seconds = deadline_seconds
+
+        # Losing engines keep running after a win, so allow two races in flight
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, 2 * len(self.engines)),
+            thread_name_prefix='stt-race'
+        )
+
+        if noise_tracker is None:
+            noise_tracker = NoiseFloorTracker()
+            noise_tracker.start()
+        self.noise_tracker = noise_tracker
+
+        # Partial transcripts come from the first engine that streams them
+        self._partial_engine = next(
+            (
+                engine for engine in self.engines.values()
+                if getattr(engine, 'on_partial', None) and hasattr(engine, 'partial_stream')
+            ),
+            None
+        )
+
+        self._warm_up()
+        logger.info(f"Racing STT initialized with engines: {list(self.engines)}")
+
+    def _warm_up(self) -> None:
+        """Prime local engines in the background so the first race is not cold"""
+        def warm(name, engine):
+            started = time.perf_counter()
+            try:
+                engine.warm_up()
+                logger.info(f"Warmed up {name} in {time.perf_counter() - started:.2f}s")
+            except Exception as e:
+                logger.warning(f"Warm-up failed for {name}: {e}")
+
+        for name, engine in self.engines.items():
+            if hasattr(engine, 'warm_up'):
+                threading.Thread(target=warm, args=(name, engine), daemon=True).start()
+
+    def is_available(self) -> bool:
+        return bool(self.engines)
+
+    def _run_engine(self, name: str, engine: Any, audio: bytes) -> Optional[Transcription]:
+        """Run one engine and record its latency"""
+        started = time.perf_counter()
+        try:
+            return engine.transcribe(audio)
+        except Exception as e:
+            metrics.increment(f'stt.race.{name}.errors')
+            logger.warning(f"{name} failed during race: {e}")
+            return None
+        finally:
+            metrics.latency(f'stt.{name}').record(time.perf_counter() - started)
+
+    def _accept(self, result: Optional[Transcription]) -> bool:
+        """Confidence / length check for a candidate transcript"""
+        if not result or len(result.text.strip()) < self.min_chars:
+            return False
+        return result.confidence is None or result.confidence >= self.min_confidence
+
+    def transcribe(self, audio: bytes) -> Optional[Transcription]:
+        """
+        Race all engines on one utterance
+
+        Returns:
+            First transcript passing the acceptance check, else the best
+            rejected candidate, else None
+        """
+        if not self.engines:
+            return None
+
+        metrics.increment('stt.race.total')
+        futures = {
+            self._executor.submit(self._run_engine, name, engine, audio): name
+            for name, engine in self.engines.items()
+        }
+        for name in self.engines:
+            metrics.increment(f'stt.race.{name}.attempts')
+
+        fallback: Optional[Transcription] = None
+        try:
+            for future in as_completed(futures, timeout=self.deadline_seconds):
+                result = future.result()
+                if self._accept(result):
+                    metrics.increment(f'stt.race.{futures[future]}.wins')
+                    logger.info(f"{futures[future]} won the race: {result.text}")
+                    return result
+                if result and (fallback is None or (result.confidence or 0) > (fallback.confidence or 0)):
+                    fallback = result
+        except FuturesTimeout:
+            metrics.increment('stt.race.timeouts')
+            logger.warning(f"No engine finished within {self.deadline_seconds}s")
+
+        if fallback:
+            logger.info(f"No confident result - using {fallback.engine}: {fallback.text}")
+        return fallback
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-engine latency and win rate"""
+        stats = {}
+        for name in self.engines:
+            attempts = metrics.counter(f'stt.race.{name}.attempts')
+            wins = metrics.counter(f'stt.race.{name}.wins')
+            stats[name] = {
+                'latency': metrics.latency(f'stt.{name}').snapshot(),
+                'attempts': attempts,
+                'wins': wins,
+                'win_rate': round(wins / attempts, 3) if attempts else 0.0,
+                'errors': metrics.counter(f'stt.race.{name}.errors'),
+            }
+        return stats
+
+    def recognize_once(self, timeout_seconds: int = 10) -> Optional[str]:
+        """
+        Capture one utterance from the shared stream and race it
+
+        Args:
+            timeout_seconds: Maximum time to wait for speech
+
+        Returns:
+            Recognized text or None if recognition failed
+        """
+        if not self.engines:
+            logger.error("Racing STT has no available engines")
+            return None
+
+        logger.info("Listening for speech...")
+        print("🎤 Listening... (speak clearly)")
+
+        partials = self._partial_engine.partial_stream() if self._partial_engine else nullcontext()
+        with self.noise_tracker.paused(), partials as on_frame:
+            audio = record_utterance(
+                energy_threshold=self.noise_tracker.energy_threshold or 300.0,
+                timeout_seconds=timeout_seconds,
+                on_frame=on_frame
+            )
+
+        if not audio:
+            logger.warning("No speech detected")
+            print("⚠️  No speech detected")
+            return None
+
+        print("🔄 Processing...")
+        result = self.transcribe(audio)
+        if not result:
+            return None
+
+        print(f"✅ Recognized: {result.text}")
+        return result.text
+
+    def listen(self) -> Optional[str]:
+        """Alias for recognize_once for compatibility"""
+        return self.recognize_once()
+
+    def recognize_with_language_detection(self) -> Optional[tuple[str, str]]:
+        """
+        Recognize speech with language detection
+
+        Returns:
+            Tuple of (recognized_text, detected_language) or None
+        """
+        text = self.recognize_once()
+        if text:
+            hindi_chars = sum(1 for c in text if '\u0900' <= c <= '\u097F')
+            language = 'hi' if hindi_chars > len(text) * 0.3 else 'en'
+            return (text, language)
+        return None
@@ -107,6 +107,9 @@ class SpeechToText:
         """Alias for recognize_once for compatibility"""
         return self.recognize_once()
     
+    def is_available(self) -> bool:
+        return self.recognizer is not None
+    
     def recognize_with_language_detection(self) -> Optional[tuple[str, str]]:
         """
         Recognize speech with automatic language detection
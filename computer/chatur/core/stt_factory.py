@@ -3,7 +3,8 @@ STT Engine Factory
 Provides unified interface for all speech-to-text engines
 """
 
-from typing import Optional
+import importlib.util
+from typing import Optional, Callable
 from chatur.utils.logger import setup_logger
 from chatur.utils.config import config
 
@@ -14,13 +15,22 @@ class STTFactory:
     """Factory for creating STT engine instances"""
     
     @staticmethod
-    def create(engine_name: Optional[str] = None):
+    def create(
+        engine_name: Optional[str] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+        fallback: bool = True,
+        noise_tracker=None
+    ):
         """
         Create an STT engine instance
         
         Args:
-            engine_name: Name of engine ('google', 'whisper', 'vosk', 'azure')
+            engine_name: Name of engine ('google', 'whisper', 'local_whisper', 'vosk', 'azure', 'race')
                         If None, reads from config
+            on_partial: Callback for partial transcripts (engines that stream them)
+            fallback: Fall back to Google if the engine's dependencies are missing
+            noise_tracker: NoiseFloorTracker owned by the caller, used instead of each
+                          engine starting its own (e.g. an unstarted one keeps the mic closed)
         
         Returns:
             STT engine instance
@@ -37,77 +47,125 @@ class STTFactory:
         logger.info(f"Creating STT engine: {engine_name}")
         
         try:
-            if engine_name == 'google':
-                from chatur.core.google_stt import GoogleSTT
-                return GoogleSTT()
-            
-            elif engine_name == 'whisper':
-                from chatur.core.whisper_stt import WhisperSTT
-                return WhisperSTT()
-            
-            elif engine_name == 'vosk':
-                from chatur.core.vosk_stt import VoskSTT
-                return VoskSTT()
-            
-            elif engine_name == 'azure':
-                from chatur.core.stt import SpeechToText
-                return SpeechToText()
-            
-            else:
-                raise ValueError(f"Unknown STT engine: {engine_name}")
+            return STTFactory._build(engine_name, on_partial, noise_tracker)
         
         except ImportError as e:
             logger.error(f"Failed to import {engine_name} STT: {e}")
+            if not fallback:
+                raise
             logger.info("Attempting fallback to Google STT...")
             
             # Fallback to Google if available
             try:
                 from chatur.core.google_stt import GoogleSTT
                 logger.info("Using Google STT as fallback")
-                return GoogleSTT()
+                return GoogleSTT(noise_tracker=noise_tracker)
             except ImportError:
                 raise ImportError(
                     f"Could not load {engine_name} STT and fallback failed. "
                     f"Please install required dependencies."
                 )
     
+    @staticmethod
+    def _build(
+        engine_name: str,
+        on_partial: Optional[Callable[[str], None]] = None,
+        noise_tracker=None
+    ):
+        """
+        Instantiate an engine without any fallback (raises ImportError)
+        
+        Args:
+            engine_name: Engine to build
+            on_partial: Callback for partial transcripts (engines that stream them)
+            noise_tracker: Started NoiseFloorTracker to share instead of each engine starting its own
+        """
+        if engine_name == 'google':
+            from chatur.core.google_stt import GoogleSTT
+            return GoogleSTT(noise_tracker=noise_tracker)
+        
+        elif engine_name == 'whisper':
+            from chatur.core.whisper_stt import WhisperSTT
+            return WhisperSTT()
+        
+        elif engine_name == 'local_whisper':
+            from chatur.core.local_whisper_stt import LocalWhisperSTT
+            return LocalWhisperSTT(noise_tracker=noise_tracker)
+        
+        elif engine_name == 'vosk':
+            from chatur.core.vosk_stt import VoskSTT
+            return VoskSTT(on_partial=on_partial)
+        
+        elif engine_name == 'azure':
+            from chatur.core.stt import SpeechToText
+            return SpeechToText()
+        
+        elif engine_name == 'race':
+            return STTFactory._build_race(on_partial, noise_tracker)
+        
+        else:
+            raise ValueError(f"Unknown STT engine: {engine_name}")
+    
+    @staticmethod
+    def _build_race(on_partial: Optional[Callable[[str], None]] = None, noise_tracker=None):
+        """Build the racing engine from stt.race_engines, skipping any that fail to load"""
+        from chatur.core.racing_stt import RacingSTT
+        from chatur.core.vad import NoiseFloorTracker
+        
+        # One tracker on the shared stream for the racer and every engine in it
+        owns_tracker = noise_tracker is None
+        if owns_tracker:
+            noise_tracker = NoiseFloorTracker()
+            noise_tracker.start()
+        
+        engines = {}
+        for name in config.get_list('stt.race_engines', ['vosk', 'whisper']):
+            name = name.lower()
+            if name == 'race' or name in engines:
+                continue
+            try:
+                engines[name] = STTFactory._build(name, on_partial, noise_tracker)
+            except (ImportError, ValueError) as e:
+                logger.warning(f"Skipping {name} in race: {e}")
+        
+        racer = RacingSTT(
+            engines,
+            min_confidence=config.get_float('stt.race_min_confidence', 0.6),
+            min_chars=config.get_int('stt.race_min_chars', 2),
+            deadline_seconds=config.get_float('stt.race_deadline_seconds', 8.0),
+            noise_tracker=noise_tracker
+        )
+        if not racer.is_available():
+            if owns_tracker:
+                noise_tracker.stop()
+            raise ImportError("No raceable STT engines are available")
+        return racer
+    
     @staticmethod
     def list_available_engines():
         """
         List all available STT engines
         
+        Only checks that each engine's package is installed; nothing is imported
+        
         Returns:
             List of available engine names
         """
-        available = []
-        
-        # Check Google
-        try:
-            import speech_recognition
-            available.append('google')
-        except ImportError:
-            pass
-        
-        # Check Whisper
-        try:
-            import openai
-            available.append('whisper')
-        except ImportError:
-            pass
-        
-        # Check Vosk
-        try:
-            import vosk
-            available.append('vosk')
-        except ImportError:
-            pass
+        packages = {
+            'google': 'speech_recognition',
+            'whisper': 'openai',
+            'local_whisper': 'faster_whisper',
+            'vosk': 'vosk',
+            'azure': 'azure.cognitiveservices.speech',
+        }
         
-        # Check Azure
-        try:
-            import azure.cognitiveservices.speech
-            available.append('azure')
-        except ImportError:
-            pass
+        available = []
+        for engine_name, package in packages.items():
+            try:
+                if importlib.util.find_spec(package) is not None:
+                    available.append(engine_name)
+            except ModuleNotFoundError:
+                pass
         
         return available
     
@@ -139,6 +197,14 @@ class STTFactory:
                 'accuracy': 'Very High',
                 'languages': ['en', 'multilingual'],
             },
+            'local_whisper': {
+                'name': 'Local Whisper (faster-whisper, int8 CPU)',
+                'requires_internet': False,
+                'requires_api_key': False,
+                'cost': 'Free',
+                'accuracy': 'High',
+                'languages': ['en', 'multilingual'],
+            },
             'vosk': {
                 'name': 'Vosk Offline STT',
                 'requires_internet': False,
@@ -155,6 +221,14 @@ class STTFactory:
                 'accuracy': 'Very High',
                 'languages': ['en-US', 'en-IN', 'en-GB'],
             },
+            'race': {
+                'name': 'Racing (first confident result of stt.race_engines)',
+                'requires_internet': False,
+                'requires_api_key': False,
+                'cost': 'Sum of raced engines',
+                'accuracy': 'Best of raced engines',
+                'languages': ['en'],
+            },
         }
         
         return engines.get(engine_name.lower(), {})
@@ -1,86 +1,419 @@
 """Text-to-Speech engine with Hindi transliteration fallback"""
 
-from typing import Optional, List
-import pyttsx3
+import os
+import re
+import time
+import queue
+import tempfile
+import itertools
+import threading
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+from chatur.core.audio_playback import get_player
+from chatur.core.tts_backends import TTSBackend
+from chatur.core.tts_cache import SpeechCache
+from chatur.core.tts_factory import TTSFactory
 from chatur.utils.logger import setup_logger
 from chatur.utils.config import config
+from chatur.utils.metrics import metrics
+from chatur.utils.transliteration import has_devanagari, transliterate
 
 logger = setup_logger('chatur.tts')
 
+# Sentence ends (including the Devanagari danda) and line breaks
+_CHUNK_BOUNDARY = re.compile(r'(?<=[.!?\u0964])\s+|\n+')
+
+
+def split_into_chunks(text: str, min_chars: int = 20) -> List[str]:
+    """
+    Split a response into sentences / lines for pipelined synthesis
+    
+    Args:
+        text: Response text
+        min_chars: Shorter pieces (e.g. "1.") are joined to the next one
+    
+    Returns:
+        Non-empty chunks in speaking order
+    """
+    chunks: List[str] = []
+    for piece in _CHUNK_BOUNDARY.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if chunks and len(chunks[-1]) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+class SpeechPriority:
+    """Speech queue priorities - lower values are spoken first"""
+    
+    INTERACTIVE = 0
+    REMINDER = 1
+    TIMER = 2
+    BACKGROUND = 3  # Cache pre-synthesis, never audible
+    
+    NAMES = {INTERACTIVE: 'interactive', REMINDER: 'reminder', TIMER: 'timer', BACKGROUND: 'background'}
+
+
+class _SpeechItem:
+    """One queued utterance; callers that asked to wait block on done"""
+    
+    def __init__(self, text: str, language: str, priority: int, generation: int, cache_only: bool = False):
+        self.text = text
+        self.language = language
+        self.priority = priority
+        self.generation = generation
+        self.cache_only = cache_only
+        self.queued_at = time.perf_counter()
+        self.done = threading.Event()
+
+
 class TextToSpeech:
-    """Text-to-Speech wrapper using pyttsx3"""
+    """
+    Text-to-Speech front end over a pluggable synthesis backend (see TTSFactory)
     
-    def __init__(self) -> None:
-        self.engine = pyttsx3.init()
+    Backends such as pyttsx3 are not thread-safe, so a single worker thread
+    creates and owns the backend and speaks queued items in priority order.
+    """
+    
+    def __init__(self, output: Optional[str] = None) -> None:
+        """
+        Args:
+            output: speaker, file or null (default: tts.output)
+        """
+        # Barge-in: interrupt() bumps the generation; speech from an older generation stops
+        self._generation = 0
+        self._speaking_generation: Optional[int] = None
+        self._interrupted_at: Optional[float] = None
+        
+        # Output sink: speaker, file (one WAV per utterance) or null (headless runs)
+        self.output = output or config.get('tts.output', 'speaker')
+        self.output_dir = Path(config.get('tts.output_dir', 'tts_output')).expanduser()
+        self.last_output_path: Optional[Path] = None
+        self._utterance_count = 0
         
-        voices = self.engine.getProperty('voices')
+        # Chunked mode: synthesize sentence N+1 while sentence N plays
+        self.chunked = config.get_bool('tts.chunked', True)
+        self.chunk_min_chars = config.get_int('tts.chunk_min_chars', 20)
+        self._chunk_dir: Optional[Path] = None
+        
+        # Short replies are synthesized once to WAV and replayed from the cache
+        self.rate = config.tts_rate
+        self.volume = config.tts_volume
+        self.cache: Optional[SpeechCache] = None
+        self.cache_max_chars = config.get_int('tts.cache_max_chars', 120)
+        if self.output == 'speaker' and config.get_bool('tts.cache_enabled', True):
+            cache_dir = config.get('tts.cache_dir') or Path(os.getenv('APPDATA') or tempfile.gettempdir()) / 'Computer' / 'tts_cache'
+            self.cache = SpeechCache(
+                Path(cache_dir).expanduser(),
+                max_bytes=config.get_int('tts.cache_max_mb', 50) * 1024 * 1024
+            )
+        
+        self.backend: Optional[TTSBackend] = None
         self.hindi_voice: Optional[str] = None
+        self.default_voice: Optional[str] = None
         
-        for voice in voices:
-            if 'hindi' in voice.name.lower() or 'hemant' in voice.name.lower() or 'kalpana' in voice.name.lower():
-                self.hindi_voice = voice.id
-                break
+        # Speech queue: (priority, sequence, item); pending items are merged by their key()
+        self._queue: queue.PriorityQueue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending: Dict[Tuple[str, str, int, bool], _SpeechItem] = {}
+        self._pending_lock = threading.Lock()
+        
+        self._ready = threading.Event()
+        self._init_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._worker_loop, name="TTSWorker", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._init_error:
+            raise self._init_error
+    
+    def _init_engine(self) -> None:
+        """Runs on the worker thread so the backend never leaves it"""
+        self.backend = TTSFactory.create('null' if self.output == 'null' else None, self.rate, self.volume)
+        if self.output == 'null':
+            logger.info("TTS output disabled (null sink)")
+            return
+        
+        # Voices come from the catalogue the backend read once at startup
+        self.hindi_voice = self.backend.find_voice('hi')
+        self.default_voice = self.backend.default_voice
         
         if self.hindi_voice:
             logger.info("TTS engine initialized with Hindi voice support")
         else:
             logger.info("TTS engine initialized (Hindi voice not available - will use transliteration)")
         
-        self.engine.setProperty('rate', config.tts_rate)
-        self.engine.setProperty('volume', config.tts_volume)
-    
-    def _transliterate_hindi(self, text: str) -> str:
-        """Convert Devanagari to Roman script for English TTS"""
-        transliteration_map: dict = {
-            'क': 'ka', 'ख': 'kha', 'ग': 'ga', 'घ': 'gha', 'ङ': 'nga',
-            'च': 'cha', 'छ': 'chha', 'ज': 'ja', 'झ': 'jha', 'ञ': 'nya',
-            'ट': 'ta', 'ठ': 'tha', 'ड': 'da', 'ढ': 'dha', 'ण': 'na',
-            'त': 'ta', 'थ': 'tha', 'द': 'da', 'ध': 'dha', 'न': 'na',
-            'प': 'pa', 'फ': 'pha', 'ब': 'ba', 'भ': 'bha', 'म': 'ma',
-            'य': 'ya', 'र': 'ra', 'ल': 'la', 'व': 'va', 'श': 'sha',
-            'ष': 'sha', 'स': 'sa', 'ह': 'ha',
-            'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo',
-            'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ं': 'n', 'ः': 'h',
-            '्': '', 'ँ': 'n'
-        }
-        
-        result: List[str] = []
-        for char in text:
-            if char in transliteration_map:
-                result.append(transliteration_map[char])
+        if self.output == 'file':
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"TTS output written to {self.output_dir}")
+    
+    def _cancelled(self) -> bool:
+        return self._speaking_generation is not None and self._speaking_generation != self._generation
+    
+    def is_speaking(self) -> bool:
+        return self._speaking_generation is not None
+    
+    def interrupt(self) -> None:
+        """
+        Stop current playback and drop interactive speak() calls already waiting (thread-safe)
+        
+        Queued reminders and timers are kept: they are fire-and-forget and
+        would otherwise never be heard. Only bumps the generation; the engine
+        belongs to the worker, which notices through _cancelled() and stops it
+        on its own thread.
+        """
+        with self._pending_lock:
+            self._generation += 1
+        if self._speaking_generation is None:
+            return
+        
+        logger.info("Speech interrupted")
+        self._interrupted_at = time.perf_counter()
+    
+    def speak(
+        self,
+        text: str,
+        language: str = 'en',
+        priority: int = SpeechPriority.INTERACTIVE,
+        wait: bool = True,
+        merge: bool = True
+    ) -> None:
+        """
+        Queue text for the TTS worker
+        
+        Args:
+            text: Text to speak
+            language: Language code ('en' or 'hi')
+            priority: SpeechPriority value; interactive replies go before reminders and timers
+            wait: Block until the text has been spoken (or, for interactive text, dropped by an interrupt)
+            merge: Fold into an identical request that is still queued
+        """
+        if threading.current_thread() is self._thread:
+            # Called from an engine callback - queueing would deadlock
+            self._speak(text, language)
+            return
+        
+        item = self._enqueue(text, language, priority, merge=merge)
+        if wait:
+            item.done.wait()
+    
+    def flush(self, priority: int = SpeechPriority.INTERACTIVE) -> None:
+        """Block until everything queued so far at this priority (or above) has been spoken"""
+        if threading.current_thread() is not self._thread:
+            self._enqueue('', 'en', priority, merge=False).done.wait()
+    
+    def presynthesize(self, text: str, language: str = 'en', priority: int = SpeechPriority.BACKGROUND) -> bool:
+        """
+        Queue text for synthesis into the cache (no audio)
+        
+        Args:
+            text: Text a later speak() is expected to use
+            language: Language code ('en' or 'hi')
+            priority: BACKGROUND for warm-up; INTERACTIVE to speculate on the reply being prepared
+        
+        Returns:
+            True if queued (False if the cache is off or the text is too long to cache)
+        """
+        if self.cache is None or len(text) > self.cache_max_chars:
+            return False
+        self._enqueue(text, language, priority, cache_only=True)
+        return True
+    
+    def _enqueue(
+        self,
+        text: str,
+        language: str,
+        priority: int,
+        cache_only: bool = False,
+        merge: bool = True
+    ) -> _SpeechItem:
+        key = (text, language, priority, cache_only)
+        with self._pending_lock:
+            item = self._pending.get(key) if merge else None
+            if item and item.generation == self._generation:
+                metrics.increment('tts.merged')
+                logger.debug("Merged duplicate speech request")
             else:
-                result.append(char)
+                item = _SpeechItem(text, language, priority, self._generation, cache_only)
+                if merge:
+                    self._pending[key] = item
+                self._queue.put((priority, next(self._sequence), item))
+        return item
+    
+    def _worker_loop(self) -> None:
+        try:
+            self._init_engine()
+        except BaseException as e:
+            self._init_error = e
+            return
+        finally:
+            self._ready.set()
         
-        return ''.join(result)
+        while True:
+            _, _, item = self._queue.get()
+            if item is None:
+                break
+            
+            with self._pending_lock:
+                key = (item.text, item.language, item.priority, item.cache_only)
+                if self._pending.get(key) is item:
+                    del self._pending[key]
+            
+            name = SpeechPriority.NAMES.get(item.priority, str(item.priority))
+            metrics.latency(f'tts.queue_wait.{name}').record(time.perf_counter() - item.queued_at)
+            
+            try:
+                with self._pending_lock:
+                    generation = self._generation
+                if item.priority == SpeechPriority.INTERACTIVE and item.generation != generation:
+                    logger.info("Skipping speech queued before an interrupt")
+                    continue
+                if not item.text:  # flush() marker
+                    continue
+                if item.cache_only:
+                    if item.priority == SpeechPriority.INTERACTIVE and self._other_reply_queued(item.text):
+                        # The handler already answered differently; don't hold its reply up
+                        metrics.increment('tts.speculation_skipped')
+                        continue
+                    self._presynthesize(item.text, item.language)
+                    continue
+                # Lower-priority items may predate the last interrupt; only a newer one cuts them off
+                self._speaking_generation = generation
+                self._speak(item.text, item.language)
+            finally:
+                self._speaking_generation = None
+                if self._interrupted_at is not None:
+                    metrics.latency('tts.barge_in').record(time.perf_counter() - self._interrupted_at)
+                    self._interrupted_at = None
+                item.done.set()
+        
+        logger.info("TTS worker stopped")
+    
+    def _other_reply_queued(self, text: str) -> bool:
+        """Whether replies are waiting behind a speculative synthesis and none of them is its text"""
+        with self._pending_lock:
+            replies = {
+                queued for queued, _, priority, cache_only in self._pending
+                if priority == SpeechPriority.INTERACTIVE and not cache_only and queued
+            }
+        return bool(replies) and text not in replies
     
-    def speak(self, text: str, language: str = 'en') -> None:
-        """Speak text using TTS"""
+    def _speak(self, text: str, language: str) -> None:
         try:
             safe_text = text.encode('ascii', 'replace').decode('ascii')
             logger.info(f"Speaking: {safe_text} (language: {language})")
             
-            if language == 'hi' and not self.hindi_voice:
-                has_devanagari = any('\u0900' <= char <= '\u097F' for char in text)
-                if has_devanagari:
-                    text = self._transliterate_hindi(text)
-                    logger.info(f"Transliterated to: {text}")
+            text, voice_id = self._prepare(text, language)
             
-            if language == 'hi' and self.hindi_voice:
-                self.engine.setProperty('voice', self.hindi_voice)
-            else:
-                voices = self.engine.getProperty('voices')
-                if voices:
-                    self.engine.setProperty('voice', voices[0].id)
+            self._utterance_count += 1
+            metrics.increment('tts.utterances')
+            if self.output == 'null':
+                return
+            
+            if self.cache is not None and len(text) <= self.cache_max_chars:
+                self._speak_cached(text, voice_id)
+                return
+            
+            if self.chunked and self.output == 'speaker' and not self.backend.streaming:
+                chunks = split_into_chunks(text, self.chunk_min_chars)
+                if len(chunks) > 1:
+                    self._speak_chunked(chunks)
+                    return
             
-            self.engine.say(text)
-            self.engine.runAndWait()
+            if self.output == 'file':
+                self.last_output_path = self.output_dir / f'tts_{self._utterance_count:05d}.wav'
+                self.backend.synthesize_to_file(text, str(self.last_output_path))
+            else:
+                self.backend.speak(text, should_stop=self._cancelled)
             
         except Exception as e:
             logger.error(f"TTS error: {e}")
     
-    def speak_async(self, text: str, language: str = 'en') -> None:
+    def _prepare(self, text: str, language: str) -> Tuple[str, Optional[str]]:
+        """Transliterate if needed and select the voice; returns (text, voice id)"""
+        if language == 'hi' and not self.hindi_voice:
+            if has_devanagari(text):
+                text = transliterate(text)
+                logger.info(f"Transliterated to: {text}")
+        
+        voice_id = self.hindi_voice if language == 'hi' and self.hindi_voice else self.default_voice
+        self.backend.set_voice(voice_id)
+        return text, voice_id
+    
+    def _synthesize_to_cache(self, text: str, key: str) -> Optional[Path]:
+        partial = self.cache.path_for(key).with_suffix('.part')
+        self.backend.synthesize_to_file(text, str(partial))
+        return self.cache.put(key, partial)
+    
+    def _speak_cached(self, text: str, voice_id: Optional[str]) -> None:
+        """Play the cached clip, synthesizing it into the cache on a miss"""
+        key = self.cache.key(text, voice_id, self.rate, self.volume)
+        path = self.cache.get(key) or self._synthesize_to_cache(text, key)
+        if path is None:
+            self.backend.speak(text, should_stop=self._cancelled)
+            return
+        if not self._cancelled():
+            get_player().play(str(path), should_stop=self._cancelled)
+    
+    def _presynthesize(self, text: str, language: str) -> None:
+        try:
+            text, voice_id = self._prepare(text, language)
+            key = self.cache.key(text, voice_id, self.rate, self.volume)
+            if key not in self.cache and self._synthesize_to_cache(text, key):
+                metrics.increment('tts_cache.presynthesized')
+        except Exception as e:
+            logger.error(f"Pre-synthesis failed: {e}")
+    
+    def _speak_chunked(self, chunks: List[str]) -> None:
+        """
+        Synthesize chunks to WAV on this (the backend's) thread while a playback
+        thread plays the previous one; an interrupt stops both between blocks
+        """
+        if self._chunk_dir is None:
+            self._chunk_dir = Path(tempfile.mkdtemp(prefix='chatur_tts_'))
+        
+        started = time.perf_counter()
+        clips: queue.Queue = queue.Queue(maxsize=2)
+        player = threading.Thread(target=self._play_clips, args=(clips, started), name="TTSPlayback", daemon=True)
+        player.start()
+        
+        try:
+            for index, chunk in enumerate(chunks):
+                if self._cancelled():
+                    break
+                path = self._chunk_dir / f'chunk_{index:03d}.wav'
+                self.backend.synthesize_to_file(chunk, str(path))
+                clips.put(path)
+        finally:
+            clips.put(None)
+            player.join()
+    
+    def _play_clips(self, clips: queue.Queue, started: float) -> None:
+        first = True
+        while True:
+            path = clips.get()
+            if path is None:
+                break
+            try:
+                if self._cancelled():
+                    continue
+                if first:
+                    metrics.latency('tts.first_audio').record(time.perf_counter() - started)
+                    first = False
+                get_player().play(str(path), should_stop=self._cancelled)
+            finally:
+                path.unlink(missing_ok=True)
+    
+    def speak_async(self, text: str, language: str = 'en', priority: int = SpeechPriority.INTERACTIVE) -> None:
         """Speak text asynchronously (non-blocking)"""
-        import threading
-        thread = threading.Thread(target=self.speak, args=(text, language))
-        thread.daemon = True
-        thread.start()
+        self.speak(text, language, priority=priority, wait=False)
+    
+    def stop(self) -> None:
+        """Stop the worker after the utterance in progress; queued speech is dropped"""
+        self.interrupt()
+        self._queue.put((-1, next(self._sequence), None))
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
@@ -0,0 +1,215 @@
+"""
+Speech synthesis backends
+pyttsx3 (SAPI / NSSpeech / espeak driver), an espeak-ng subprocess and a null sink
+"""
+
+import wave
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+from chatur.core.audio_playback import get_player
+from chatur.utils.logger import setup_logger
+
+logger = setup_logger('chatur.tts_backends')
+
+HINDI_VOICE_HINTS = ('hindi', 'hemant', 'kalpana')
+
+
+@dataclass
+class Voice:
+    """One entry of a backend's voice catalogue"""
+    id: str
+    name: str
+    languages: List[str] = field(default_factory=list)
+
+
+class TTSBackend(ABC):
+    """
+    Abstract synthesis backend
+
+    Backends are created and used on the TTS worker thread only. Nothing is
+    called on them from other threads: speak() stops itself when its
+    should_stop callback returns True.
+    """
+
+    name = "base"
+    streaming = False  # speak() starts playing before the whole text is synthesized
+
+    def __init__(self, rate: int = 150, volume: float = 0.9):
+        self.rate = rate
+        self.volume = volume
+        self.voice_id: Optional[str] = None
+        self.voices: List[Voice] = []  # Queried once at startup
+
+    def find_voice(self, language: str) -> Optional[str]:
+        """Catalogue voice for a language code ('hi', 'en'), or None"""
+        for voice in self.voices:
+            if language in voice.languages:
+                return voice.id
+        if language == 'hi':
+            for voice in self.voices:
+                if any(hint in voice.name.lower() for hint in HINDI_VOICE_HINTS):
+                    return voice.id
+        return None
+
+    @property
+    def default_voice(self) -> Optional[str]:
+        return self.voices[0].id if self.voices else None
+
+    def set_voice(self, voice_id: Optional[str]) -> None:
+        self.voice_id = voice_id
+
+    @abstractmethod
+    def speak(self, text: str, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Synthesize and play text, blocking until done or should_stop() returns True
+
+        Backends are only used from the TTS worker thread, so stopping is
+        always driven by polling should_stop, never by another thread.
+        """
+        pass
+
+    @abstractmethod
+    def synthesize_to_file(self, text: str, path: str) -> None:
+        """Write text as a WAV file"""
+        pass
+
+
+class Pyttsx3Backend(TTSBackend):
+    """pyttsx3 - the platform's native voices"""
+
+    name = "pyttsx3"
+
+    def __init__(self, rate: int = 150, volume: float = 0.9):
+        """
+        Raises:
+            ImportError: pyttsx3 not installed
+        """
+        super().__init__(rate, volume)
+        import pyttsx3
+
+        self.engine = pyttsx3.init()
+        self.engine.setProperty('rate', rate)
+        self.engine.setProperty('volume', volume)
+        self.engine.connect('started-word', self._on_word)
+        self._should_stop: Optional[Callable[[], bool]] = None
+
+        # getProperty('voices') is slow under SAPI and espeak - ask once
+        self.voices = [
+            Voice(
+                id=voice.id,
+                name=voice.name,
+                languages=[self._language_code(language) for language in (voice.languages or [])]
+            )
+            for voice in self.engine.getProperty('voices')
+        ]
+
+    @staticmethod
+    def _language_code(language) -> str:
+        """'en_US', 'en-us' or the espeak driver's b'\\x05en-us' -> 'en'"""
+        if isinstance(language, bytes):
+            language = language[1:].decode('ascii', 'ignore')
+        return str(language).lower()[:2]
+
+    def set_voice(self, voice_id: Optional[str]) -> None:
+        if voice_id and voice_id != self.voice_id:
+            self.engine.setProperty('voice', voice_id)
+            self.voice_id = voice_id
+
+    def _on_word(self, name, location, length) -> None:
+        """Runs inside the engine loop - stops playback that has been interrupted"""
+        if self._should_stop and self._should_stop():
+            self.engine.stop()
+
+    def speak(self, text: str, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        self._should_stop = should_stop
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            self._should_stop = None
+
+    def synthesize_to_file(self, text: str, path: str) -> None:
+        self.engine.save_to_file(text, path)
+        self.engine.runAndWait()
+
+
+class EspeakBackend(TTSBackend):
+    """
+    espeak-ng as a subprocess
+
+    speak() plays the WAV stream from espeak-ng's stdout as it is produced, so
+    audio starts after the first clause rather than after the whole text.
+    """
+
+    name = "espeak"
+    streaming = True
+
+    def __init__(self, rate: int = 150, volume: float = 0.9):
+        """
+        Raises:
+            ImportError: espeak-ng / espeak executable not found
+        """
+        super().__init__(rate, volume)
+        self.executable = shutil.which('espeak-ng') or shutil.which('espeak')
+        if not self.executable:
+            raise ImportError("espeak-ng not found on PATH")
+        self.voices = self._list_voices()
+
+    def _list_voices(self) -> List[Voice]:
+        """Parse `espeak-ng --voices`: Pty Language Age/Gender VoiceName File Other"""
+        try:
+            output = subprocess.run(
+                [self.executable, '--voices'], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Could not list espeak voices: {e}")
+            return []
+
+        voices = []
+        for line in output.splitlines()[1:]:
+            parts = line.split()
+            if len(parts) >= 4:
+                voices.append(Voice(id=parts[1], name=parts[3], languages=[parts[1].split('-')[0]]))
+        # Prefer English as the default voice
+        voices.sort(key=lambda voice: voice.id not in ('en', 'en-us'))
+        return voices
+
+    def _command(self, text: str, *output: str) -> List[str]:
+        command = [self.executable, '-s', str(self.rate), '-a', str(int(self.volume * 100))]
+        if self.voice_id:
+            command += ['-v', self.voice_id]
+        return command + list(output) + ['--', text]
+
+    def speak(self, text: str, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        process = subprocess.Popen(
+            self._command(text, '--stdout'), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        try:
+            get_player().play(process.stdout, should_stop=should_stop)
+        finally:
+            # Stopped early: don't leave espeak blocked on a full pipe
+            if process.poll() is None:
+                process.kill()
+            process.wait()
+
+    def synthesize_to_file(self, text: str, path: str) -> None:
+        subprocess.run(self._command(text, '-w', path), check=True, stderr=subprocess.DEVNULL)
+
+
+class NullBackend(TTSBackend):
+    """No audio - for headless runs and tests"""
+
+    name = "null"
+
+    def speak(self, text: str, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        pass
+
+    def synthesize_to_file(self, text: str, path: str) -> None:
+        # Valid, empty WAV so file consumers still find one per utterance
+        with wave.open(path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
@@ -0,0 +1,108 @@
+"""
+On-disk cache of synthesized speech
+Recurring replies ("Okay", "Timer started for 5 minutes") are played from WAV
+instead of going through the synthesis engine again
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+from chatur.utils.logger import setup_logger
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.tts_cache')
+
+
+class SpeechCache:
+    """Size-bounded LRU cache of WAV clips keyed by (text, voice, rate, volume)"""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        """
+        Args:
+            directory: Where clips are stored (created if missing)
+            max_bytes: Least recently played clips are evicted above this size
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # key -> clip size, least recently used first; file mtimes carry recency across restarts
+        self._clips: 'OrderedDict[str, int]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        for path in sorted(self.directory.glob('*.wav'), key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self._clips[path.stem] = size
+            self._total_bytes += size
+        logger.info(f"Speech cache: {len(self._clips)} clips, {self._total_bytes // 1024} KB in {self.directory}")
+
+    @staticmethod
+    def key(text: str, voice: Optional[str], rate: int, volume: float) -> str:
+        raw = f"{voice}\0{rate}\0{volume:.2f}\0{text.strip()}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f'{key}.wav'
+
+    def get(self, key: str) -> Optional[Path]:
+        """Cached clip for key, or None (marks the clip as recently used)"""
+        with self._lock:
+            if key not in self._clips:
+                metrics.increment('tts_cache.miss')
+                return None
+            self._clips.move_to_end(key)
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back
+            with self._lock:
+                self._total_bytes -= self._clips.pop(key, 0)
+            metrics.increment('tts_cache.miss')
+            return None
+
+        metrics.increment('tts_cache.hit')
+        return path
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._clips
+
+    def put(self, key: str, clip: Path) -> Optional[Path]:
+        """
+        Move a freshly synthesized clip into the cache
+
+        Returns:
+            Cached path, or None if the clip is empty or too large to keep
+        """
+        size = clip.stat().st_size if clip.exists() else 0
+        if size == 0 or size > self.max_bytes:
+            clip.unlink(missing_ok=True)
+            return None
+
+        path = self.path_for(key)
+        os.replace(clip, path)
+        with self._lock:
+            self._total_bytes += size - self._clips.pop(key, 0)
+            self._clips[key] = size
+            self._evict()
+        return path
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._clips:
+            key, size = self._clips.popitem(last=False)
+            self._total_bytes -= size
+            self.path_for(key).unlink(missing_ok=True)
+            metrics.increment('tts_cache.evicted')
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._clips)
@@ -0,0 +1,141 @@
+"""
+TTS Backend Factory
+Provides unified interface for all speech synthesis backends
+"""
+
+import shutil
+import importlib.util
+from typing import Optional
+from chatur.core.tts_backends import TTSBackend
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+
+logger = setup_logger('chatur.tts_factory')
+
+
+class TTSFactory:
+    """Factory for creating TTS backend instances"""
+
+    @staticmethod
+    def create(
+        backend_name: Optional[str] = None,
+        rate: Optional[int] = None,
+        volume: Optional[float] = None,
+        fallback: bool = True
+    ) -> TTSBackend:
+        """
+        Create a TTS backend instance
+
+        Args:
+            backend_name: Name of backend ('pyttsx3', 'espeak', 'null', 'auto')
+                         If None, reads from config; auto picks the first available
+            rate: Words per minute (default: tts.rate)
+            volume: 0.0 to 1.0 (default: tts.volume)
+            fallback: Try the other installed backends if this one's dependencies are missing
+
+        Returns:
+            TTS backend instance
+
+        Raises:
+            ValueError: If backend name is invalid
+            ImportError: If no usable backend is installed
+        """
+        if backend_name is None:
+            backend_name = config.get('tts.backend', 'auto')
+
+        backend_name = backend_name.lower()
+        rate = rate if rate is not None else config.tts_rate
+        volume = volume if volume is not None else config.tts_volume
+
+        if backend_name == 'auto':
+            candidates = TTSFactory.list_available_backends() or ['pyttsx3']
+        else:
+            candidates = [backend_name]
+            if fallback:
+                candidates += [name for name in TTSFactory.list_available_backends() if name != backend_name]
+
+        logger.info(f"Creating TTS backend: {backend_name}")
+
+        for candidate in candidates:
+            try:
+                backend = TTSFactory._build(candidate, rate, volume)
+                logger.info(f"TTS backend: {backend.name} ({len(backend.voices)} voices)")
+                return backend
+            except ImportError as e:
+                logger.error(f"Failed to load {candidate} TTS: {e}")
+                if not fallback:
+                    raise
+
+        raise ImportError(
+            f"Could not load {backend_name} TTS and fallback failed. "
+            f"Please install pyttsx3 or espeak-ng."
+        )
+
+    @staticmethod
+    def _build(backend_name: str, rate: int, volume: float) -> TTSBackend:
+        """Instantiate a backend without any fallback (raises ImportError)"""
+        if backend_name == 'pyttsx3':
+            from chatur.core.tts_backends import Pyttsx3Backend
+            return Pyttsx3Backend(rate, volume)
+
+        elif backend_name == 'espeak':
+            from chatur.core.tts_backends import EspeakBackend
+            return EspeakBackend(rate, volume)
+
+        elif backend_name == 'null':
+            from chatur.core.tts_backends import NullBackend
+            return NullBackend(rate, volume)
+
+        else:
+            raise ValueError(f"Unknown TTS backend: {backend_name}")
+
+    @staticmethod
+    def list_available_backends():
+        """
+        List all available TTS backends (the null sink is not listed)
+
+        Only checks that each backend's package or executable exists; nothing is imported
+
+        Returns:
+            List of available backend names, preferred first
+        """
+        available = []
+        if importlib.util.find_spec('pyttsx3') is not None:
+            available.append('pyttsx3')
+        if shutil.which('espeak-ng') or shutil.which('espeak'):
+            available.append('espeak')
+        return available
+
+    @staticmethod
+    def get_backend_info(backend_name: str) -> dict:
+        """
+        Get information about a TTS backend
+
+        Args:
+            backend_name: Name of the backend
+
+        Returns:
+            Dictionary with backend information
+        """
+        backends = {
+            'pyttsx3': {
+                'name': 'pyttsx3 (SAPI5 / NSSpeechSynthesizer / espeak)',
+                'requires_internet': False,
+                'streaming': False,
+                'hindi': 'Only with an installed Hindi voice',
+            },
+            'espeak': {
+                'name': 'espeak-ng subprocess (streams WAV from stdout)',
+                'requires_internet': False,
+                'streaming': True,
+                'hindi': 'Built-in hi voice',
+            },
+            'null': {
+                'name': 'Null sink (no audio)',
+                'requires_internet': False,
+                'streaming': False,
+                'hindi': 'n/a',
+            },
+        }
+
+        return backends.get(backend_name.lower(), {})
@@ -0,0 +1,326 @@
+"""Energy-based voice activity helpers on top of the shared capture stream"""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional, Callable, List
+import numpy as np
+from chatur.core.audio_capture import AudioCapture, get_audio_capture
+from chatur.utils.logger import setup_logger
+
+logger = setup_logger('chatur.vad')
+
+
+def frame_rms(frame: bytes) -> float:
+    """Root-mean-square energy of a 16-bit PCM frame"""
+    samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+    if samples.size == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(samples * samples)))
+
+
+def trim_silence(
+    audio: bytes,
+    energy_threshold: float = 300.0,
+    frame_length: int = 512,
+    padding_frames: int = 3
+) -> bytes:
+    """
+    Drop leading and trailing frames below the energy threshold
+
+    Args:
+        audio: Raw 16-bit mono PCM
+        energy_threshold: RMS above which a frame counts as speech
+        frame_length: Samples per analysis frame
+        padding_frames: Quiet frames kept on each side of the speech
+
+    Returns:
+        Trimmed PCM, or b'' if no frame reaches the threshold
+    """
+    samples = np.frombuffer(audio[:len(audio) - len(audio) % 2], dtype=np.int16)
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return audio
+
+    # One vectorized RMS per frame
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length).astype(np.float32)
+    energy = np.sqrt(np.mean(frames * frames, axis=1))
+    voiced = np.flatnonzero(energy > energy_threshold)
+    if voiced.size == 0:
+        return b''
+
+    first = max(0, voiced[0] - padding_frames)
+    last = min(frame_count, voiced[-1] + 1 + padding_frames)
+    end = len(samples) if last == frame_count else last * frame_length
+    return samples[first * frame_length:end].tobytes()
+
+
+class NoiseFloorTracker:
+    """
+    Tracks the ambient noise floor in the background while the assistant is idle
+
+    Uses the same damped update as speech_recognition's dynamic energy
+    threshold, so the published threshold can be handed straight to
+    sr.Recognizer.energy_threshold.
+    """
+
+    def __init__(
+        self,
+        on_threshold: Optional[Callable[[float], None]] = None,
+        capture: Optional[AudioCapture] = None,
+        ratio: float = 1.5,
+        damping: float = 0.15,
+        min_threshold: float = 300.0,
+        calibration_seconds: float = 0.5
+    ):
+        """
+        Args:
+            on_threshold: Called with every new energy threshold
+            capture: Capture stream to sample (default: shared stream)
+            ratio: Threshold as a multiple of the noise floor
+            damping: Fraction of the old threshold kept after one second
+            min_threshold: Lower bound so a silent room does not trigger on hiss
+            calibration_seconds: Audio averaged for the first estimate
+        """
+        self.on_threshold = on_threshold
+        self.capture = capture or get_audio_capture()
+        self.ratio = ratio
+        self.damping = damping
+        self.min_threshold = min_threshold
+        self.calibration_seconds = calibration_seconds
+        self.update_every = 1  # Process one frame in N (raised on battery)
+
+        self.energy_threshold: Optional[float] = None
+        self._paused = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def calibrated(self) -> bool:
+        return self.energy_threshold is not None
+
+    def start(self) -> bool:
+        """Start sampling the shared stream"""
+        if self._running:
+            return True
+
+        subscription = self.capture.subscribe(max_frames=64)
+        if subscription is None:
+            logger.warning("Noise floor tracking unavailable - microphone not open")
+            return False
+
+        self._running = True
+        self._thread = threading.Thread(target=self._track_loop, args=(subscription,), daemon=True)
+        self._thread.start()
+        logger.info("Noise floor tracker started")
+        return True
+
+    def stop(self) -> None:
+        self._running = False
+
+    @contextmanager
+    def paused(self):
+        """Stop adapting while the user is speaking"""
+        self._paused.set()
+        try:
+            yield
+        finally:
+            self._paused.clear()
+
+    def _publish(self, threshold: float) -> None:
+        self.energy_threshold = max(self.min_threshold, threshold)
+        if self.on_threshold:
+            self.on_threshold(self.energy_threshold)
+
+    def _track_loop(self, subscription) -> None:
+        seconds_per_frame = self.capture.frame_length / self.capture.sample_rate
+        calibration_frames = max(1, int(self.calibration_seconds / seconds_per_frame))
+        calibration_energy = []
+        frame_index = 0
+
+        try:
+            while self._running:
+                frame = subscription.read(timeout=1.0)
+                if frame is None or self._paused.is_set():
+                    continue
+
+                frame_index += 1
+                if frame_index % self.update_every:
+                    continue
+
+                energy = frame_rms(frame)
+
+                if not self.calibrated:
+                    calibration_energy.append(energy)
+                    if len(calibration_energy) >= calibration_frames:
+                        floor = sum(calibration_energy) / len(calibration_energy)
+                        self._publish(floor * self.ratio)
+                        logger.info(f"Noise floor calibrated (energy threshold: {self.energy_threshold:.0f})")
+                    continue
+
+                damping = self.damping ** (seconds_per_frame * self.update_every)
+                target = energy * self.ratio
+                self._publish(self.energy_threshold * damping + target * (1 - damping))
+
+        finally:
+            subscription.close()
+            logger.info("Noise floor tracker stopped")
+
+
+class EnergyGate:
+    """
+    Cheap speech gate placed in front of an expensive per-frame model
+
+    Opens when a frame's energy rises well above the tracked noise floor and
+    stays open for a hang time after it falls back (hysteresis). On opening,
+    the look-back buffer is released first so the model also sees the onset.
+    """
+
+    def __init__(
+        self,
+        frame_seconds: float = 512 / 16000,
+        open_ratio: float = 2.5,
+        close_ratio: float = 1.5,
+        min_threshold: float = 200.0,
+        hang_seconds: float = 1.0,
+        lookback_seconds: float = 0.3,
+        floor_adaptation: float = 0.05
+    ):
+        """
+        Args:
+            frame_seconds: Duration of one frame
+            open_ratio: Open when energy exceeds noise floor x this
+            close_ratio: Frames above noise floor x this keep the gate open
+            min_threshold: Lower bound on the open threshold
+            hang_seconds: How long the gate stays open after energy drops
+            lookback_seconds: Audio released from before the onset
+            floor_adaptation: Per-frame weight of new energy in the noise floor
+        """
+        self.open_ratio = open_ratio
+        self.close_ratio = close_ratio
+        self.min_threshold = min_threshold
+        self.hang_frames = max(1, int(hang_seconds / frame_seconds))
+        self.floor_adaptation = floor_adaptation
+
+        self.noise_floor: Optional[float] = None
+        self.is_open = False
+        self._hang = 0
+        self._lookback: deque = deque(maxlen=max(1, int(lookback_seconds / frame_seconds)))
+
+        self.frames_seen = 0
+        self.frames_passed = 0
+
+    @property
+    def skipped_fraction(self) -> float:
+        """Fraction of frames that never reached the model"""
+        if not self.frames_seen:
+            return 0.0
+        return 1.0 - self.frames_passed / self.frames_seen
+
+    def process(self, frame: bytes) -> List[bytes]:
+        """
+        Feed one frame through the gate
+
+        Returns:
+            Frames to hand to the model (empty while closed, look-back + frame on opening)
+        """
+        self.frames_seen += 1
+        energy = frame_rms(frame)
+
+        if self.noise_floor is None:
+            self.noise_floor = energy
+
+        if self.is_open:
+            if energy > self.noise_floor * self.close_ratio:
+                self._hang = self.hang_frames
+            else:
+                self._hang -= 1
+                if self._hang <= 0:
+                    self.is_open = False
+            self.frames_passed += 1
+            return [frame]
+
+        if energy > max(self.min_threshold, self.noise_floor * self.open_ratio):
+            self.is_open = True
+            self._hang = self.hang_frames
+            released = list(self._lookback) + [frame]
+            self._lookback.clear()
+            self.frames_passed += len(released)
+            return released
+
+        # Only adapt on frames judged to be background
+        self.noise_floor += (energy - self.noise_floor) * self.floor_adaptation
+        self._lookback.append(frame)
+        return []
+
+
+def record_utterance(
+    capture: Optional[AudioCapture] = None,
+    energy_threshold: float = 300.0,
+    timeout_seconds: float = 10,
+    max_seconds: float = 15,
+    silence_seconds: float = 0.8,
+    preroll_seconds: float = 0.3,
+    on_frame: Optional[Callable[[bytes], None]] = None
+) -> Optional[bytes]:
+    """
+    Capture one utterance from the shared stream with a simple energy endpointer
+
+    Args:
+        capture: Capture stream (default: shared stream)
+        energy_threshold: RMS above which a frame counts as speech
+        timeout_seconds: How long to wait for speech to start
+        max_seconds: Hard cap on utterance length
+        silence_seconds: Trailing silence that ends the utterance
+        preroll_seconds: Audio kept from before the onset
+        on_frame: Called with each frame of the utterance as it is captured
+
+    Returns:
+        Raw 16-bit mono PCM, or None if no speech started in time
+    """
+    capture = capture or get_audio_capture()
+    subscription = capture.subscribe()
+    if subscription is None:
+        logger.error("Cannot record - microphone not available")
+        return None
+
+    seconds_per_frame = capture.frame_length / capture.sample_rate
+    preroll: deque = deque(maxlen=max(1, int(preroll_seconds / seconds_per_frame)))
+    frames = []
+    waited = 0.0
+    silence = 0.0
+
+    try:
+        while True:
+            frame = subscription.read(timeout=1.0)
+            if frame is None:
+                logger.warning("Capture stream stalled")
+                break
+
+            is_speech = frame_rms(frame) > energy_threshold
+
+            if not frames:
+                if is_speech:
+                    frames.extend(preroll)
+                    frames.append(frame)
+                    if on_frame:
+                        for captured in frames:
+                            on_frame(captured)
+                    continue
+                preroll.append(frame)
+                waited += seconds_per_frame
+                if waited >= timeout_seconds:
+                    return None
+                continue
+
+            frames.append(frame)
+            if on_frame:
+                on_frame(frame)
+            silence = 0.0 if is_speech else silence + seconds_per_frame
+            if silence >= silence_seconds or len(frames) * seconds_per_frame >= max_seconds:
+                break
+
+    finally:
+        subscription.close()
+
+    return b''.join(frames) if frames else None
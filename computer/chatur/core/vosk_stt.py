@@ -4,67 +4,274 @@ Offline, free, no internet required
 """
 
 import json
-import pyaudio
+import mmap
+import os
+import queue
+import threading
+from contextlib import contextmanager
 from vosk import Model, KaldiRecognizer
+from chatur.core.audio_capture import get_audio_capture
+from chatur.core.command_grammar import build_command_grammar, UNKNOWN_WORD
+from chatur.models.transcription import Transcription
 from chatur.utils.logger import setup_logger
-from typing import Optional
+from chatur.utils.config import config
+from typing import Optional, Callable, Dict, List
 from pathlib import Path
 
 logger = setup_logger('chatur.vosk_stt')
 
+# Models are large; share one instance per path across engines
+_models: Dict[str, Model] = {}
+_models_lock = threading.Lock()
+
+
+def _prefault_model_files(model_path: str) -> None:
+    """
+    Memory-map the model files so the OS reads them ahead in large
+    sequential chunks before Kaldi parses them.
+    """
+    for root, _, files in os.walk(model_path):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                with open(path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+                            mapped.madvise(mmap.MADV_WILLNEED)
+                        else:
+                            # Touch one byte per page to fault the file in
+                            for offset in range(0, len(mapped), mmap.PAGESIZE):
+                                mapped[offset]
+            except (OSError, ValueError) as e:
+                logger.debug(f"Could not prefault {path}: {e}")
+
+
+def load_model(model_path: str) -> Model:
+    """Load a Vosk model once per process"""
+    model_path = str(Path(model_path).resolve())
+    with _models_lock:
+        model = _models.get(model_path)
+        if model is None:
+            _prefault_model_files(model_path)
+            model = Model(model_path)
+            _models[model_path] = model
+        return model
+
+
+def find_model_path(model_path: Optional[str] = None) -> Optional[str]:
+    """
+    Locate the Vosk model directory
+
+    Args:
+        model_path: Explicit path; if None, uses stt.vosk_model_path or common locations
+
+    Returns:
+        Existing model directory or None
+    """
+    if model_path is None:
+        base_dir = Path(__file__).parent.parent.parent
+        configured = config.get('stt.vosk_model_path')
+
+        # Look for model in common locations
+        possible_paths = []
+        if configured:
+            configured_path = Path(configured)
+            if not configured_path.is_absolute():
+                configured_path = base_dir / configured_path
+            possible_paths.append(configured_path)
+        possible_paths += [
+            base_dir / 'vosk-model',
+            base_dir / 'models' / 'vosk-model-small-en-in-0.4',
+            Path('vosk-model'),
+        ]
+
+        for path in possible_paths:
+            if path.exists():
+                model_path = str(path)
+                break
+
+    if not model_path or not Path(model_path).exists():
+        return None
+    return model_path
+
 
 class VoskSTT:
     """Vosk offline speech recognition wrapper"""
-    
-    def __init__(self, model_path: str = None):
+
+    def __init__(self, model_path: str = None, on_partial: Optional[Callable[[str], None]] = None):
         """
         Initialize Vosk Speech Recognition
-        
+
         Args:
             model_path: Path to Vosk model directory
-                       If None, looks for 'vosk-model' in project root
+                       If None, uses stt.vosk_model_path or looks for 'vosk-model' in project root
+            on_partial: Optional callback receiving partial transcripts while the user speaks
         """
+        self.on_partial = on_partial
+
+        # Audio settings
+        self.sample_rate = 16000
+        self.frames_per_chunk = 4  # Capture frames fed to Kaldi per call (~128 ms)
+
+        # Command mode decodes against a restricted vocabulary first
+        self.command_mode = config.get_bool('stt.vosk_command_mode', False)
+        self.min_command_confidence = config.get_float('stt.vosk_command_min_confidence', 0.7)
+        self._grammar: Optional[str] = None
+
+        self._pool: queue.Queue = queue.Queue()
+        self._command_pool: queue.Queue = queue.Queue()
+
         try:
-            # Find model path
-            if model_path is None:
-                # Look for model in common locations
-                possible_paths = [
-                    Path(__file__).parent.parent.parent / 'vosk-model',
-                    Path(__file__).parent.parent.parent / 'models' / 'vosk-model-small-en-in-0.4',
-                    Path('vosk-model'),
-                ]
-                
-                for path in possible_paths:
-                    if path.exists():
-                        model_path = str(path)
-                        break
-            
-            if not model_path or not Path(model_path).exists():
+            model_path = find_model_path(model_path)
+            if not model_path:
                 logger.error("Vosk model not found. Please download from https://alphacephei.com/vosk/models")
                 logger.error("Extract to project root as 'vosk-model' folder")
                 self.model = None
                 return
-            
+
             logger.info(f"Loading Vosk model from {model_path}...")
-            self.model = Model(model_path)
-            
-            # Audio settings
-            self.sample_rate = 16000
-            self.chunk_size = 4000
-            
-            logger.info("Vosk STT engine initialized (offline mode)")
-            
+            self.model = load_model(model_path)
+
+            # Keep recognizers warm so an utterance never pays graph setup cost
+            pool_size = max(1, config.get_int('stt.vosk_pool_size', 2))
+            for _ in range(pool_size):
+                self._pool.put(self._create_recognizer())
+
+            if self.command_mode:
+                self._grammar = build_command_grammar()
+                for _ in range(pool_size):
+                    self._command_pool.put(self._create_recognizer(self._grammar))
+
+            mode = "command grammar + open fallback" if self.command_mode else "open vocabulary"
+            logger.info(f"Vosk STT engine initialized (offline mode, {mode}, {pool_size} warm recognizers)")
+
         except Exception as e:
             logger.error(f"Failed to initialize Vosk: {e}")
             self.model = None
-    
-    def recognize_once(self, timeout_seconds: int = 10) -> Optional[str]:
+
+    def _create_recognizer(self, grammar: Optional[str] = None) -> KaldiRecognizer:
+        if grammar:
+            recognizer = KaldiRecognizer(self.model, self.sample_rate, grammar)
+        else:
+            recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        recognizer.SetWords(True)
+        return recognizer
+
+    def _acquire_recognizer(self, constrained: bool = False) -> KaldiRecognizer:
+        """Take a warm recognizer from the pool, building one if all are busy"""
+        pool = self._command_pool if constrained else self._pool
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            logger.debug("Recognizer pool exhausted - creating an extra recognizer")
+            return self._create_recognizer(self._grammar if constrained else None)
+
+    def _release_recognizer(self, recognizer: KaldiRecognizer, constrained: bool = False) -> None:
+        """Reset a recognizer and return it to the pool"""
+        pool = self._command_pool if constrained else self._pool
+        try:
+            recognizer.Reset()
+            pool.put_nowait(recognizer)
+        except Exception as e:
+            logger.warning(f"Discarding recognizer that failed to reset: {e}")
+
+    @staticmethod
+    def _confidence(result: dict) -> float:
+        """Mean word confidence of a decode (0 if it hit an unknown word)"""
+        words = result.get('result', [])
+        if not words or UNKNOWN_WORD in result.get('text', ''):
+            return 0.0
+        return sum(word.get('conf', 0.0) for word in words) / len(words)
+
+    def _decode(self, audio: bytes, constrained: bool = False) -> dict:
+        """Decode a complete buffer of audio with a pooled recognizer"""
+        recognizer = self._acquire_recognizer(constrained)
+        try:
+            recognizer.AcceptWaveform(audio)
+            return json.loads(recognizer.FinalResult())
+        finally:
+            self._release_recognizer(recognizer, constrained)
+
+    def is_available(self) -> bool:
+        return self.model is not None
+
+    def warm_up(self) -> None:
+        """Run a short buffer of silence through the decoder to fault in the graph"""
+        if self.model:
+            silence = b'\x00\x00' * (self.sample_rate // 2)
+            self._decode(silence, constrained=self.command_mode)
+
+    def transcribe(self, audio: bytes) -> Optional[Transcription]:
+        """
+        Transcribe already captured audio
+
+        Args:
+            audio: Raw 16-bit mono PCM at 16 kHz
+
+        Returns:
+            Transcription or None if nothing was recognized
+        """
+        if not self.model:
+            return None
+
+        result = self._decode(audio, constrained=self.command_mode)
+        confidence = self._confidence(result)
+        if self.command_mode and result.get('text') and confidence < self.min_command_confidence:
+            result = self._decode(audio)
+            confidence = self._confidence(result)
+
+        text = result.get('text', '').replace(UNKNOWN_WORD, '').strip()
+        if not text:
+            return None
+        return Transcription(text=text, engine='vosk', confidence=confidence)
+
+    def _emit_partial(self, recognizer: KaldiRecognizer, last_partial: str) -> str:
+        """Push the current partial transcript if it changed"""
+        partial = json.loads(recognizer.PartialResult()).get('partial', '')
+        if partial and partial != last_partial and self.on_partial:
+            try:
+                self.on_partial(partial)
+            except Exception as e:
+                logger.error(f"Partial result callback failed: {e}")
+        return partial or last_partial
+
+    @contextmanager
+    def partial_stream(self):
+        """
+        Decode audio recorded elsewhere as it arrives, pushing partial transcripts to on_partial
+
+        Yields:
+            Callable taking one captured frame
+        """
+        recognizer = self._acquire_recognizer()
+        pending: List[bytes] = []
+        last_partial = ''
+
+        def feed(frame: bytes) -> None:
+            nonlocal last_partial
+            pending.append(frame)
+            if len(pending) < self.frames_per_chunk:
+                return
+            data = b''.join(pending)
+            pending.clear()
+            if not recognizer.AcceptWaveform(data):
+                last_partial = self._emit_partial(recognizer, last_partial)
+
+        try:
+            yield feed
+        finally:
+            self._release_recognizer(recognizer)
+
+    def recognize_once(self, timeout_seconds: int = 10, preroll: Optional[List[bytes]] = None) -> Optional[str]:
         """
         Recognize speech from microphone using Vosk
-        
+
         Args:
             timeout_seconds: Maximum time to wait for speech
-            
+            preroll: Already captured frames to decode before live audio
+
         Returns:
             Recognized text or None if recognition failed
         """
@@ -74,55 +281,68 @@ class VoskSTT:
             print("💡 Download from: https://alphacephei.com/vosk/models")
             print("   Extract to project root as 'vosk-model' folder")
             return None
-        
+
+        capture = get_audio_capture()
+        subscription = capture.subscribe()
+        if subscription is None:
+            print("❌ Microphone not available")
+            return None
+
+        constrained = self.command_mode
+        recognizer = self._acquire_recognizer(constrained)
+
         try:
             logger.info("Listening for speech...")
             print("🎤 Listening... (speak clearly)")
-            
-            # Create recognizer
-            recognizer = KaldiRecognizer(self.model, self.sample_rate)
-            recognizer.SetWords(True)
-            
-            # Open microphone
-            p = pyaudio.PyAudio()
-            stream = p.open(
-                format=pyaudio.paInt16,
-                channels=1,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=self.chunk_size
-            )
-            stream.start_stream()
-            
-            logger.info("Recording...")
-            
-            # Record and recognize
-            frames_recorded = 0
-            max_frames = int(self.sample_rate / self.chunk_size * timeout_seconds)
-            
-            final_result = None
-            
-            while frames_recorded < max_frames:
-                data = stream.read(self.chunk_size, exception_on_overflow=False)
-                frames_recorded += 1
-                
+
+            frames_needed = int(self.sample_rate / capture.frame_length * timeout_seconds)
+            frames_read = 0
+            result: dict = {}
+            last_partial = ''
+            pending: List[bytes] = list(preroll or [])
+            utterance: List[bytes] = []
+
+            while frames_read < frames_needed:
+                frame = subscription.read(timeout=1.0)
+                if frame is None:
+                    logger.warning("Capture stream stalled")
+                    break
+                frames_read += 1
+                pending.append(frame)
+
+                if len(pending) < self.frames_per_chunk:
+                    continue
+
+                data = b''.join(pending)
+                pending = []
+                if constrained:
+                    utterance.append(data)
+
                 if recognizer.AcceptWaveform(data):
                     # Got a complete phrase
                     result = json.loads(recognizer.Result())
                     if result.get('text'):
-                        final_result = result['text']
                         break
-            
+                else:
+                    last_partial = self._emit_partial(recognizer, last_partial)
+
             # Get final result if nothing was captured yet
-            if not final_result:
+            if not result.get('text'):
+                if pending:
+                    data = b''.join(pending)
+                    if constrained:
+                        utterance.append(data)
+                    recognizer.AcceptWaveform(data)
                 result = json.loads(recognizer.FinalResult())
-                final_result = result.get('text', '')
-            
-            # Cleanup
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-            
+
+            if constrained and utterance and result.get('text'):
+                confidence = self._confidence(result)
+                if confidence < self.min_command_confidence:
+                    logger.info(f"Command decode confidence {confidence:.2f} too low - falling back to open vocabulary")
+                    result = self._decode(b''.join(utterance))
+
+            final_result = result.get('text', '').replace(UNKNOWN_WORD, '').strip()
+
             if final_result:
                 logger.info(f"Recognized: {final_result}")
                 print(f"✅ Recognized: {final_result}")
@@ -131,16 +351,24 @@ class VoskSTT:
                 logger.warning("No speech detected")
                 print("⚠️  No speech detected")
                 return None
-                
+
         except Exception as e:
             logger.error(f"Vosk STT error: {e}", exc_info=True)
             print(f"❌ Error: {e}")
             return None
-    
+
+        finally:
+            subscription.close()
+            self._release_recognizer(recognizer, constrained)
+
+    def listen(self) -> Optional[str]:
+        """Alias for recognize_once for compatibility"""
+        return self.recognize_once()
+
     def recognize_with_language_detection(self) -> Optional[tuple[str, str]]:
         """
         Recognize speech with language detection
-        
+
         Returns:
             Tuple of (recognized_text, detected_language) or None
         """
@@ -1,25 +1,27 @@
-"""Wake word detection using Picovoice Porcupine"""
+"""Wake word detection on the shared capture stream with a pluggable keyword backend"""
 
-import os
+import time
 import threading
-from typing import Callable, Optional, List
-from pathlib import Path
-import pvporcupine
-import pyaudio
+from typing import Callable, Optional, List, Any, Dict
+from chatur.core.audio_capture import AudioSubscription, SAMPLE_WIDTH, get_audio_capture
+from chatur.core.keyword_backends import KeywordBackend, BuiltInKeywords, create_keyword_backend
+from chatur.core.vad import EnergyGate
 from chatur.utils.logger import setup_logger
 from chatur.utils.config import config
+from chatur.utils.metrics import metrics
 
 logger = setup_logger('chatur.wake_word')
 
 
 class WakeWordDetector:
-    """Wake word detection using Porcupine"""
+    """Wake word detection using a keyword backend (Porcupine or Vosk)"""
     
     def __init__(
         self,
         on_wake_word: Callable,
         keywords: Optional[List[str]] = None,
-        sensitivity: float = 0.5
+        sensitivity: float = 0.5,
+        backend: Optional[KeywordBackend] = None
     ):
         """
         Initialize wake word detector
@@ -27,156 +29,143 @@ class WakeWordDetector:
         Args:
             on_wake_word: Callback function to call when wake word is detected
             keywords: List of wake words to detect (default: ['computer'])
-            sensitivity: Detection sensitivity (0.0 to 1.0, lower is more sensitive)
+            sensitivity: Detection sensitivity (0.0 to 1.0, higher detects more readily with either backend)
+            backend: Keyword backend (default: created from wake_word.backend)
         """
         self.on_wake_word = on_wake_word
         self.keywords = keywords or ['computer']
         self.sensitivity = sensitivity
         
-        self.porcupine: Optional[pvporcupine.Porcupine] = None
-        self.audio_stream: Optional[pyAudio.PyAudio] = None
-        self.stream: Optional[pvporcupine._onnxruntime.OrtIO] = None
+        # Frames arrive from the shared capture stream; the PyAudio callback only enqueues
+        self.capture = get_audio_capture()
+        self.queue_frames = config.get_int('wake_word.queue_frames', 64)
+        self._subscription: Optional[AudioSubscription] = None
+        
+        # Skip the keyword model on frames that are clearly background noise
+        self.gate: Optional[EnergyGate] = None
+        if config.get_bool('wake_word.energy_gate', True):
+            self.gate = EnergyGate(
+                frame_seconds=self.capture.frame_length / self.capture.sample_rate,
+                open_ratio=config.get_float('wake_word.gate_open_ratio', 2.5),
+                min_threshold=config.get_float('wake_word.gate_min_threshold', 200.0),
+                hang_seconds=config.get_float('wake_word.gate_hang_seconds', 1.0),
+                lookback_seconds=config.get_float('wake_word.gate_lookback_seconds', 0.3)
+            )
         
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self.frames_processed = 0
         
-        self._init_porcupine()
-    
-    def _init_porcupine(self) -> None:
-        """Initialize Porcupine engine"""
-        try:
-            access_key = os.getenv('PORCUPINE_ACCESS_KEY')
-            if not access_key:
-                logger.warning("PORCUPINE_ACCESS_KEY not set - wake word detection disabled")
-                return
-            
-            keyword_paths = []
-            for keyword in self.keywords:
-                keyword_path = self._get_keyword_path(keyword)
-                if keyword_path:
-                    keyword_paths.append(keyword_path)
-            
-            if not keyword_paths:
-                logger.warning("No valid keyword paths found - wake word disabled")
-                return
-            
-            self.porcupine = pvporcupine.create(
-                access_key=access_key,
-                keyword_paths=keyword_paths,
-                sensitivities=[self.sensitivity]
-            )
-            
-            logger.info(f"Wake word detector initialized for: {self.keywords}")
-            
-        except pvporcupine.PorcupineInvalidArgumentError as e:
-            logger.error(f"Invalid arguments for Porcupine: {e}")
-        except pvporcupine.PorcupineActivationError as e:
-            logger.error(f"Porcupine activation error: {e}")
-        except Exception as e:
-            logger.error(f"Failed to initialize wake word detector: {e}")
-    
-    def _get_keyword_path(self, keyword: str) -> Optional[str]:
-        """Get the path to the keyword .ppn file"""
-        keyword_lower = keyword.lower().replace(' ', '_')
-        
-        base_dir = Path(__file__).parent.parent.parent
-        
-        search_paths = [
-            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}_windows.ppn',
-            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}.ppn',
-            base_dir / 'resources' / 'wake_words' / f'{keyword_lower}_linux.ppn',
-            base_dir / 'config' / 'wake_words' / f'{keyword_lower}_windows.ppn',
-        ]
-        
-        for path in search_paths:
-            if path.exists():
-                logger.info(f"Found keyword file: {path}")
-                return str(path)
-        
-        logger.warning(f"Keyword file not found for: {keyword}")
-        return None
+        self.backend = backend or create_keyword_backend(
+            keywords=self.keywords,
+            sensitivity=self.sensitivity
+        )
     
     def start(self) -> bool:
         """Start listening for wake word"""
-        if not self.porcupine:
-            logger.error("Cannot start - Porcupine not initialized")
+        if not self.backend:
+            logger.error("Cannot start - no keyword backend available")
             return False
         
         if self._running:
             logger.warning("Wake word detector already running")
             return True
         
-        try:
-            self.audio_stream = pyaudio.PyAudio()
-            
-            self.stream = self.audio_stream.open(
-                rate=self.porcupine.sample_rate,
-                channels=1,
-                format=pyaudio.paInt16,
-                input=True,
-                frames_per_buffer=self.porcupine.frame_length,
-                stream_callback=self._audio_callback
+        if self.capture.sample_rate != self.backend.sample_rate:
+            logger.error(
+                f"Capture rate {self.capture.sample_rate} Hz does not match "
+                f"{self.backend.name} rate {self.backend.sample_rate} Hz"
             )
-            
-            self._running = True
-            self._thread = threading.Thread(target=self._listen_loop, daemon=True)
-            self._thread.start()
-            
-            logger.info("Wake word detection started")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to start wake word detection: {e}")
             return False
-    
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Audio stream callback - called by PyAudio"""
-        if not self._running:
-            return (None, pyaudio.paComplete)
         
-        try:
-            keyword_index = self.porcupine.process(in_data)
-            
-            if keyword_index >= 0:
-                logger.info(f"Wake word detected! (keyword index: {keyword_index})")
-                if self.on_wake_word:
-                    self.on_wake_word()
-                    
-        except Exception as e:
-            logger.error(f"Error processing audio: {e}")
-        
-        return (None, pyaudio.paContinue)
+        self._subscription = self.capture.subscribe(max_frames=self.queue_frames)
+        if self._subscription is None:
+            logger.error("Failed to start wake word detection - microphone not available")
+            return False
+        
+        self._running = True
+        self._thread = threading.Thread(target=self._detect_loop, name="WakeWordWorker", daemon=True)
+        self._thread.start()
+        
+        logger.info("Wake word detection started")
+        return True
     
-    def _listen_loop(self):
-        """Main listening loop (runs in separate thread)"""
-        logger.info("Wake word listening thread started")
+    def _detect_loop(self):
+        """Worker thread: blocks on the frame queue and runs detection"""
+        logger.info("Wake word worker thread started")
+        
+        frame_bytes = self.backend.frame_length * SAMPLE_WIDTH
+        frame_timer = metrics.latency('wake_word.frame')
+        buffer = b''
+        reported_drops = 0
         
         while self._running:
-            if self.stream and self.stream.is_active():
-                pass
-            else:
-                break
+            chunk = self._subscription.read(timeout=0.5)
+            if chunk is None:
+                continue
+            
+            if self.gate:
+                passed = self.gate.process(chunk)
+                if not passed:
+                    metrics.increment('wake_word.gated_frames')
+                    continue
+                chunk = b''.join(passed)
+            
+            # Re-chunk in case the capture frame size differs from the backend's
+            buffer += chunk
+            while len(buffer) >= frame_bytes:
+                frame, buffer = buffer[:frame_bytes], buffer[frame_bytes:]
+                
+                started = time.perf_counter()
+                try:
+                    keyword_index = self.backend.process(frame)
+                except Exception as e:
+                    logger.error(f"Error processing audio: {e}")
+                    continue
+                finally:
+                    frame_timer.record(time.perf_counter() - started)
+                    self.frames_processed += 1
+                
+                if keyword_index >= 0:
+                    logger.info(f"Wake word detected! (keyword index: {keyword_index})")
+                    if self.on_wake_word:
+                        try:
+                            self.on_wake_word()
+                        except Exception as e:
+                            logger.error(f"Error in wake word callback: {e}", exc_info=True)
+            
+            # A closed gate means a gap in the audio; don't let the decoder stitch across it
+            if self.gate and not self.gate.is_open:
+                self.backend.reset()
+                buffer = b''
+            
+            dropped = self._subscription.dropped_frames
+            if dropped != reported_drops:
+                metrics.increment('wake_word.dropped_frames', dropped - reported_drops)
+                reported_drops = dropped
         
-        logger.info("Wake word listening thread stopped")
+        logger.info("Wake word worker thread stopped")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Dropped-frame, gating and per-frame processing-time metrics"""
+        return {
+            'backend': self.backend.name if self.backend else None,
+            'frames_processed': self.frames_processed,
+            'dropped_frames': self._subscription.dropped_frames if self._subscription else 0,
+            'gate_skipped_fraction': round(self.gate.skipped_fraction, 3) if self.gate else 0.0,
+            'frame_processing': metrics.latency('wake_word.frame').snapshot(),
+        }
     
     def stop(self) -> None:
         """Stop listening for wake word"""
         self._running = False
         
-        if self.stream:
-            try:
-                self.stream.stop_stream()
-                self.stream.close()
-            except Exception as e:
-                logger.error(f"Error stopping stream: {e}")
-            self.stream = None
-        
-        if self.audio_stream:
-            try:
-                self.audio_stream.terminate()
-            except Exception as e:
-                logger.error(f"Error terminating audio: {e}")
-            self.audio_stream = None
+        if self._subscription:
+            self._subscription.close()
+        
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
         
         logger.info("Wake word detection stopped")
     
@@ -185,35 +174,6 @@ class WakeWordDetector:
         return self._running
 
 
-class BuiltInKeywords:
-    """Built-in Porcupine keywords that don't require custom .ppn files"""
-    
-    ALEXA = "alexa"
-    AMAZON = "amazon"
-    COMPUTER = "computer"
-    BLUEBERRY = "blueberry"
-    BUMBLEBEE = "bumblebee"
-    CORNFLOWER = "cornflower"
-    GRASSHOPPER = "grasshopper"
-    HEY_GOOGLE = "hey google"
-    HEY_SIRI = "hey siri"
-    JARVIS = "jarvis"
-    OK_GOOGLE = "ok google"
-    PICOVOICE = "picovoice"
-    PORCUPINE = "porcupine"
-    TERMINATOR = "terminator"
-    
-    @classmethod
-    def all(cls) -> List[str]:
-        """Get all built-in keywords"""
-        return [
-            cls.ALEXA, cls.AMAZON, cls.COMPUTER, cls.BLUEBERRY,
-            cls.BUMBLEBEE, cls.CORNFLOWER, cls.GRASSHOPPER,
-            cls.HEY_GOOGLE, cls.HEY_SIRI, cls.JARVIS, cls.OK_GOOGLE,
-            cls.PICOVOICE, cls.PORCUPINE, cls.TERMINATOR
-        ]
-
-
 def create_wake_word_detector(
     on_wake_word: Callable,
     config_override: Optional[dict] = None
@@ -226,7 +186,7 @@ def create_wake_word_detector(
         config_override: Optional config dict to override defaults
         
     Returns:
-        WakeWordDetector instance or None if disabled
+        WakeWordDetector instance or None if disabled or no backend is available
     """
     cfg = config_override or {}
     
@@ -238,8 +198,17 @@ def create_wake_word_detector(
     keywords = cfg.get('keywords', [config.get('wake_word.keyword', 'computer')])
     sensitivity = cfg.get('sensitivity', config.get_float('wake_word.sensitivity', 0.5))
     
+    backend = create_keyword_backend(
+        name=cfg.get('backend', config.get('wake_word.backend', 'auto')),
+        keywords=keywords,
+        sensitivity=sensitivity
+    )
+    if backend is None:
+        return None
+    
     return WakeWordDetector(
         on_wake_word=on_wake_word,
         keywords=keywords,
-        sensitivity=sensitivity
+        sensitivity=sensitivity,
+        backend=backend
     )
@@ -6,8 +6,9 @@ More reliable for local microphone access
 import os
 import io
 import wave
-import pyaudio
 from openai import OpenAI
+from chatur.core.audio_capture import SAMPLE_WIDTH, get_audio_capture
+from chatur.models.transcription import Transcription
 from chatur.utils.logger import setup_logger
 from typing import Optional
 
@@ -27,60 +28,54 @@ class WhisperSTT:
         self.client = OpenAI(api_key=api_key)
         
         # Audio recording settings
-        self.CHUNK = 1024
-        self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 1
         self.RATE = 16000
         
         logger.info("Whisper STT engine initialized")
     
+    def is_available(self) -> bool:
+        return self.client is not None
+    
+    def _to_wav(self, pcm: bytes) -> bytes:
+        """Wrap raw 16-bit PCM in a WAV container"""
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wf:
+            wf.setnchannels(self.CHANNELS)
+            wf.setsampwidth(SAMPLE_WIDTH)
+            wf.setframerate(self.RATE)
+            wf.writeframes(pcm)
+        return wav_buffer.getvalue()
+    
     def record_audio(self, duration_seconds: int = 5) -> Optional[bytes]:
         """
-        Record audio from microphone
+        Record audio from the shared microphone stream
         
         Args:
             duration_seconds: How long to record
             
         Returns:
-            Audio data as bytes or None if failed
+            Audio data as WAV bytes or None if failed
         """
+        capture = get_audio_capture()
+        subscription = capture.subscribe(max_frames=1024)
+        
         try:
-            p = pyaudio.PyAudio()
-            
-            # Open microphone stream
-            stream = p.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.RATE,
-                input=True,
-                frames_per_buffer=self.CHUNK
-            )
+            if subscription is None:
+                raise OSError("Microphone not available")
             
             logger.info(f"Recording for {duration_seconds} seconds...")
             print(f"🎤 Recording for {duration_seconds} seconds... Speak now!")
             
             frames = []
-            for i in range(0, int(self.RATE / self.CHUNK * duration_seconds)):
-                data = stream.read(self.CHUNK)
+            for i in range(0, int(self.RATE / capture.frame_length * duration_seconds)):
+                data = subscription.read(timeout=1.0)
+                if data is None:
+                    break
                 frames.append(data)
             
             print("✅ Recording complete!")
             
-            # Stop and close stream
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-            
-            # Convert to WAV format
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wf:
-                wf.setnchannels(self.CHANNELS)
-                wf.setsampwidth(p.get_sample_size(self.FORMAT))
-                wf.setframerate(self.RATE)
-                wf.writeframes(b''.join(frames))
-            
-            wav_buffer.seek(0)
-            return wav_buffer.read()
+            return self._to_wav(b''.join(frames))
             
         except Exception as e:
             logger.error(f"Recording error: {e}", exc_info=True)
@@ -90,6 +85,40 @@ class WhisperSTT:
             print("   2. Ensure microphone is not being used by another app")
             print("   3. Try a different microphone")
             return None
+        
+        finally:
+            if subscription:
+                subscription.close()
+    
+    def transcribe(self, audio: bytes, language: Optional[str] = "en") -> Optional[Transcription]:
+        """
+        Transcribe already captured audio
+        
+        Args:
+            audio: Raw 16-bit mono PCM at 16 kHz
+            language: Language hint, or None to auto-detect
+            
+        Returns:
+            Transcription or None if nothing was recognized
+        """
+        if not self.client:
+            return None
+        
+        return self._transcribe_wav(self._to_wav(audio), language)
+    
+    def _transcribe_wav(self, wav_data: bytes, language: Optional[str]) -> Optional[Transcription]:
+        """Send a WAV buffer to the Whisper API (no temporary file needed)"""
+        params = {'model': "whisper-1", 'file': ("audio.wav", wav_data)}
+        if language:
+            params['language'] = language
+        
+        transcript = self.client.audio.transcriptions.create(**params)
+        text = transcript.text.strip()
+        if not text:
+            return None
+        
+        # Whisper API does not return a confidence score
+        return Transcription(text=text, engine='whisper')
     
     def recognize_once(self, duration_seconds: int = 5) -> Optional[str]:
         """
@@ -111,26 +140,15 @@ class WhisperSTT:
             return None
         
         try:
-            # Save to temporary file (Whisper API requires a file)
-            temp_file = "temp_audio.wav"
-            with open(temp_file, 'wb') as f:
-                f.write(audio_data)
-            
             logger.info("Transcribing with Whisper...")
             print("🔄 Transcribing...")
             
-            # Transcribe using Whisper
-            with open(temp_file, 'rb') as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"  # Can be "hi" for Hindi or None for auto-detect
-                )
-            
-            # Clean up temp file
-            os.remove(temp_file)
+            # Transcribe using Whisper ("hi" for Hindi or None for auto-detect)
+            result = self._transcribe_wav(audio_data, language="en")
+            if not result:
+                return None
             
-            text = transcript.text.strip()
+            text = result.text
             logger.info(f"Recognized: {text}")
             print(f"✅ Recognized: {text}")
             
@@ -141,6 +159,10 @@ class WhisperSTT:
             print(f"❌ Transcription error: {e}")
             return None
     
+    def listen(self) -> Optional[str]:
+        """Alias for recognize_once for compatibility"""
+        return self.recognize_once()
+    
     def recognize_with_language_detection(self, duration_seconds: int = 5) -> Optional[tuple[str, str]]:
         """
         Record and transcribe with automatic language detection
@@ -158,25 +180,14 @@ class WhisperSTT:
             return None
         
         try:
-            # Save to temporary file
-            temp_file = "temp_audio.wav"
-            with open(temp_file, 'wb') as f:
-                f.write(audio_data)
-            
             logger.info("Transcribing with language detection...")
             
-            # Transcribe with auto language detection
-            with open(temp_file, 'rb') as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file
-                    # No language specified = auto-detect
-                )
-            
-            # Clean up
-            os.remove(temp_file)
+            # No language specified = auto-detect
+            result = self._transcribe_wav(audio_data, language=None)
+            if not result:
+                return None
             
-            text = transcript.text.strip()
+            text = result.text
             # Whisper doesn't return detected language in API response
             # We'll detect it ourselves based on text
             language = self._detect_language(text)
@@ -4,6 +4,7 @@ import os
 import subprocess
 import webbrowser
 import psutil
+from typing import Optional
 from chatur.handlers.base import BaseHandler
 from chatur.models.intent import Intent, IntentType
 from chatur.storage.app_repository import AppRepository
@@ -22,6 +23,19 @@ class AppLauncherHandler(BaseHandler):
         """Check if this is an app launch intent"""
         return intent.type == IntentType.APP_LAUNCH
     
+    def predict_response(self, intent: Intent) -> Optional[str]:
+        """Confirmation for a known app (URLs and unknown apps are not predicted)"""
+        app_name = intent.parameters.get('app_name', '').lower()
+        if not app_name or intent.parameters.get('url'):
+            return None
+        
+        app = self.repo.get_by_name(app_name)
+        if not app:
+            return None
+        
+        action = "Closed" if intent.parameters.get('action', 'open') == 'close' else "Opening"
+        return ResponseBuilder.success(intent.response_language, action, app['display_name'])
+    
     def handle(self, intent: Intent) -> str:
         """Launch or close an application"""
         try:
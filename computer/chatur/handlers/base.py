@@ -1,11 +1,15 @@
 """Base handler interface"""
 
 from abc import ABC, abstractmethod
+from typing import Iterator, Optional
 from chatur.models.intent import Intent
 
 class BaseHandler(ABC):
     """Abstract base class for all action handlers"""
     
+    # Streaming handlers implement handle_stream(); CommandProcessor speaks each chunk as it arrives
+    streaming = False
+    
     @abstractmethod
     def can_handle(self, intent: Intent) -> bool:
         """Check if this handler can process the intent"""
@@ -15,3 +19,16 @@ class BaseHandler(ABC):
     def handle(self, intent: Intent) -> str:
         """Process the intent and return response text"""
         pass
+    
+    def handle_stream(self, intent: Intent) -> Iterator[str]:
+        """Process the intent, yielding response chunks as they become available"""
+        yield self.handle(intent)
+    
+    def predict_response(self, intent: Intent) -> Optional[str]:
+        """
+        Reply handle() is expected to return on success, if known up front
+        
+        Lets the reply be synthesized while the handler runs. Must be cheap
+        and side-effect free; None means the reply is not predictable.
+        """
+        return None
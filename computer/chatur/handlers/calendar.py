@@ -3,6 +3,7 @@
 import os
 import datetime
 from pathlib import Path
+from typing import Iterator
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -22,6 +23,8 @@ TOKEN_PATH = Path(os.getenv('APPDATA')) / 'Computer' / 'token.json'
 class CalendarHandler(BaseHandler):
     """Handler for Google Calendar interactions"""
     
+    streaming = True  # Events are spoken page by page while later pages are fetched
+    
     def __init__(self):
         self.service = None
         self._authenticate()
@@ -64,67 +67,88 @@ class CalendarHandler(BaseHandler):
         
     def handle(self, intent: Intent) -> str:
         """Process calendar intent"""
+        return "\n".join(self.handle_stream(intent))
+    
+    def handle_stream(self, intent: Intent) -> Iterator[str]:
+        """Process calendar intent, yielding one line per event when listing"""
         if not self.service:
              # Attempt re-auth locally just in case
             if CREDENTIALS_PATH.exists():
-                 return "I found your credentials but need you to authorize me first. Run the setup wizard."
-            return "I need Google Calendar credentials to access your schedule. Please add credentials.json to your Computer folder."
+                 yield "I found your credentials but need you to authorize me first. Run the setup wizard."
+                 return
+            yield "I need Google Calendar credentials to access your schedule. Please add credentials.json to your Computer folder."
+            return
             
         action = intent.parameters.get('action', 'list')
         
         try:
             if action == 'list':
-                return self._list_events(intent.parameters)
+                yield from self._list_events(intent.parameters)
             elif action == 'create':
-                return self._create_event(intent.parameters)
+                yield self._create_event(intent.parameters)
             else:
-                return "I'm not sure what you want to do with your calendar."
+                yield "I'm not sure what you want to do with your calendar."
         except Exception as e:
             logger.error(f"Calendar operation failed: {e}")
-            return "Sorry, something went wrong accessing your calendar."
+            yield "Sorry, something went wrong accessing your calendar."
 
-    def _list_events(self, params: dict) -> str:
+    def _list_events(self, params: dict) -> Iterator[str]:
         """List upcoming events"""
         try:
             now = datetime.datetime.utcnow().isoformat() + 'Z'
             
-            # Default to 5 events
+            # Default to 5 events, fetched in small pages so the first ones can be spoken early
             max_results = 5
+            page_size = 2
+            page_token = None
+            listed = 0
             
-            events_result = self.service.events().list(
-                calendarId='primary', 
-                timeMin=now,
-                maxResults=max_results, 
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            
-            if not events:
-                return "You have no upcoming events."
+            while listed < max_results:
+                events_result = self.service.events().list(
+                    calendarId='primary', 
+                    timeMin=now,
+                    maxResults=min(page_size, max_results - listed), 
+                    singleEvents=True,
+                    orderBy='startTime',
+                    pageToken=page_token
+                ).execute()
                 
-            response_lines = ["Here are your upcoming events:"]
-            for event in events:
-                start = event['start'].get('dateTime', event['start'].get('date'))
+                events = events_result.get('items', [])
                 
-                # Format time nicely
-                try:
-                    dt = dateutil.parser.parse(start)
-                    # If today, say "Today at X", else "Tomorrow/Day at X"
-                    # For now simply standard string
-                    time_str = dt.strftime("%A at %I:%M %p")
-                except:
-                    time_str = start
-                    
-                response_lines.append(f"- {event['summary']} on {time_str}")
+                if not events:
+                    if listed == 0:
+                        yield "You have no upcoming events."
+                    return
                 
-            return "\n".join(response_lines)
+                if listed == 0:
+                    yield "Here are your upcoming events:"
+                for event in events:
+                    yield self._describe_event(event)
+                listed += len(events)
+                
+                page_token = events_result.get('nextPageToken')
+                if not page_token:
+                    return
             
         except Exception as e:
             logger.error(f"Error listing events: {e}")
             raise e
 
+    def _describe_event(self, event: dict) -> str:
+        """One spoken line for an event"""
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        
+        # Format time nicely
+        try:
+            dt = dateutil.parser.parse(start)
+            # If today, say "Today at X", else "Tomorrow/Day at X"
+            # For now simply standard string
+            time_str = dt.strftime("%A at %I:%M %p")
+        except:
+            time_str = start
+            
+        return f"- {event['summary']} on {time_str}"
+
     def _create_event(self, params: dict) -> str:
         """Create a new event"""
         summary = params.get('summary', 'New Event')
@@ -3,6 +3,7 @@
 import os
 import base64
 from pathlib import Path
+from typing import Iterator
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -22,6 +23,8 @@ TOKEN_PATH = Path(os.getenv('APPDATA')) / 'Computer' / 'token.json'
 class GmailHandler(BaseHandler):
     """Handler for Gmail interactions"""
     
+    streaming = True  # Each email is spoken while the next one is fetched
+    
     def __init__(self):
         self.service = None
         self._authenticate()
@@ -61,29 +64,36 @@ class GmailHandler(BaseHandler):
         
     def handle(self, intent: Intent) -> str:
         """Process email intent"""
+        return "\n".join(self.handle_stream(intent))
+    
+    def handle_stream(self, intent: Intent) -> Iterator[str]:
+        """Process email intent, yielding the summary line and then one line per email"""
         if not self.service:
             if CREDENTIALS_PATH.exists():
-                 return "I have your credentials but need authorization. Please run the setup again or check permissions."
-            return "I need Google credentials to access your emails. Please setup credentials.json."
+                 yield "I have your credentials but need authorization. Please run the setup again or check permissions."
+                 return
+            yield "I need Google credentials to access your emails. Please setup credentials.json."
+            return
             
         action = intent.parameters.get('action', 'read')
         
         try:
             if action == 'read' or action == 'check':
                 count = intent.parameters.get('count', 3)
-                return self._read_emails(count)
+                yield from self._read_emails(count)
             elif action == 'search':
                 query = intent.parameters.get('query')
                 if not query:
-                    return "What emails should I look for?"
-                return self._search_emails(query)
+                    yield "What emails should I look for?"
+                    return
+                yield from self._search_emails(query)
             else:
-                return "I'm not sure what you want to do with your email."
+                yield "I'm not sure what you want to do with your email."
         except Exception as e:
             logger.error(f"Email operation failed: {e}")
-            return "Sorry, something went wrong accessing your emails."
+            yield "Sorry, something went wrong accessing your emails."
 
-    def _read_emails(self, max_results: int = 3) -> str:
+    def _read_emails(self, max_results: int = 3) -> Iterator[str]:
         """Read latest unread emails"""
         try:
             # List messages in INBOX that are UNREAD
@@ -96,9 +106,10 @@ class GmailHandler(BaseHandler):
             messages = results.get('messages', [])
             
             if not messages:
-                return "You have no unread emails."
+                yield "You have no unread emails."
+                return
                 
-            response_lines = [f"Here are your last {len(messages)} unread emails:"]
+            yield f"Here are your last {len(messages)} unread emails:"
             
             for msg in messages:
                 txt = self.service.users().messages().get(userId='me', id=msg['id']).execute()
@@ -117,15 +128,13 @@ class GmailHandler(BaseHandler):
                         if '<' in sender:
                             sender = sender.split('<')[0].strip().replace('"', '')
                 
-                response_lines.append(f"- From {sender}: {subject}")
-                
-            return "\n".join(response_lines)
+                yield f"- From {sender}: {subject}"
             
         except Exception as e:
             logger.error(f"Error reading emails: {e}")
             raise e
 
-    def _search_emails(self, query: str) -> str:
+    def _search_emails(self, query: str) -> Iterator[str]:
         """Search emails"""
         try:
             # Search query
@@ -138,9 +147,10 @@ class GmailHandler(BaseHandler):
             messages = results.get('messages', [])
             
             if not messages:
-                return f"I couldn't find any emails matching '{query}'."
+                yield f"I couldn't find any emails matching '{query}'."
+                return
                 
-            response_lines = [f"Found {len(messages)} recent emails properly matching '{query}':"]
+            yield f"Found {len(messages)} recent emails properly matching '{query}':"
             
             for msg in messages:
                 txt = self.service.users().messages().get(userId='me', id=msg['id']).execute()
@@ -158,9 +168,7 @@ class GmailHandler(BaseHandler):
                         if '<' in sender:
                             sender = sender.split('<')[0].strip().replace('"', '')
 
-                response_lines.append(f"- {sender}: {subject}")
-                
-            return "\n".join(response_lines)
+                yield f"- {sender}: {subject}"
             
         except Exception as e:
             logger.error(f"Error searching emails: {e}")
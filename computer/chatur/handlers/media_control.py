@@ -10,6 +10,18 @@ from chatur.utils.responses import ResponseBuilder
 
 logger = setup_logger('chatur.handlers.media_control')
 
+# Key-press actions: media key, log message and spoken confirmation
+# (shared by handle() and predict_response() so a prediction always matches)
+KEY_ACTIONS = {
+    'play': ('playpause', "Toggled play/pause", lambda language: ResponseBuilder.confirm(language, "Okay")),
+    'pause': ('playpause', "Toggled play/pause", lambda language: ResponseBuilder.confirm(language, "Okay")),
+    'next': ('nexttrack', "Next track", lambda language: ResponseBuilder.success(language, "Playing next track")),
+    'previous': ('prevtrack', "Previous track", lambda language: ResponseBuilder.success(language, "Playing previous track")),
+    'volume_up': ('volumeup', "Volume up", lambda language: ResponseBuilder.success(language, "Increasing volume")),
+    'volume_down': ('volumedown', "Volume down", lambda language: ResponseBuilder.success(language, "Decreasing volume")),
+    'mute': ('volumemute', "Toggled mute", lambda language: ResponseBuilder.get(language, {'en': "Muted", 'hi': "म्यूट किया"})),
+}
+
 class MediaControlHandler(BaseHandler):
     """Handler for media playback control"""
     
@@ -56,6 +68,14 @@ class MediaControlHandler(BaseHandler):
         """Check if this is a media control intent"""
         return intent.type == IntentType.MEDIA_CONTROL
     
+    def predict_response(self, intent: Intent) -> Optional[str]:
+        """Fixed confirmations for key-press actions (set_volume depends on the device)"""
+        action = intent.parameters.get('action', 'play')
+        if action not in KEY_ACTIONS:
+            return None
+        _, _, confirmation = KEY_ACTIONS[action]
+        return confirmation(intent.response_language)
+    
     def handle(self, intent: Intent) -> str:
         """Control media playback"""
         try:
@@ -63,35 +83,12 @@ class MediaControlHandler(BaseHandler):
             volume_level = intent.parameters.get('volume_level')
             language = intent.response_language
             
-            if action == 'play' or action == 'pause':
-                pyautogui.press('playpause')
-                time.sleep(0.1)
-                logger.info("Toggled play/pause")
-                return ResponseBuilder.confirm(language, "Okay")
-                
-            elif action == 'next':
-                pyautogui.press('nexttrack')
-                time.sleep(0.1)
-                logger.info("Next track")
-                return ResponseBuilder.success(language, "Playing next track")
-                
-            elif action == 'previous':
-                pyautogui.press('prevtrack')
-                time.sleep(0.1)
-                logger.info("Previous track")
-                return ResponseBuilder.success(language, "Playing previous track")
-            
-            elif action == 'volume_up':
-                pyautogui.press('volumeup')
-                time.sleep(0.1)
-                logger.info("Volume up")
-                return ResponseBuilder.success(language, "Increasing volume")
-            
-            elif action == 'volume_down':
-                pyautogui.press('volumedown')
+            if action in KEY_ACTIONS:
+                key, log_message, confirmation = KEY_ACTIONS[action]
+                pyautogui.press(key)
                 time.sleep(0.1)
-                logger.info("Volume down")
-                return ResponseBuilder.success(language, "Decreasing volume")
+                logger.info(log_message)
+                return confirmation(language)
             
             elif action == 'set_volume':
                 if not self.has_volume_control or not self.volume:
@@ -120,12 +117,6 @@ class MediaControlHandler(BaseHandler):
                     logger.error(f"Error setting volume: {e}")
                     return ResponseBuilder.error(language, "set the volume")
             
-            elif action == 'mute':
-                pyautogui.press('volumemute')
-                time.sleep(0.1)
-                logger.info("Toggled mute")
-                return ResponseBuilder.get(language, {'en': "Muted", 'hi': "म्यूट किया"})
-            
             return ResponseBuilder.error(language, "control media playback")
             
         except Exception as e:
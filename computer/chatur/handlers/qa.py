@@ -9,9 +9,10 @@ logger = setup_logger('chatur.handlers.qa')
 class QAHandler(BaseHandler):
     """Handler for question answering"""
     
-    def __init__(self, llm_client, conversation_repo=None):
+    def __init__(self, llm_client, conversation_repo=None, cancel_event=None):
         self.llm = llm_client
         self.conversation_repo = conversation_repo
+        self.cancel_event = cancel_event  # Set on barge-in to abandon the answer
     
     def can_handle(self, intent: Intent) -> bool:
         """Check if this is a question intent"""
@@ -36,7 +37,12 @@ class QAHandler(BaseHandler):
                 # Get last 5 exchanges
                 history = self.conversation_repo.get_recent_exchanges(limit=5)
             
-            answer = self.llm.answer_question(question, intent.response_language, conversation_history=history)
+            answer = self.llm.answer_question(
+                question,
+                intent.response_language,
+                conversation_history=history,
+                cancel_event=self.cancel_event
+            )
             
             return answer
             
@@ -3,6 +3,7 @@
 import threading
 import time
 from datetime import datetime, timedelta
+from chatur.core.tts import SpeechPriority
 from chatur.handlers.base import BaseHandler
 from chatur.models.intent import Intent, IntentType
 from chatur.utils.time_parser import parse_duration
@@ -70,13 +71,16 @@ class TimerHandler(BaseHandler):
         # Timer complete
         logger.info(f"Timer complete: {label}")
         
-        # Print notification (avoid TTS threading issues)
         if language == 'hi':
-            message = f"⏰ टाइमर पूरा हो गया: {label}"
+            message = f"टाइमर पूरा हो गया: {label}"
         else:
-            message = f"⏰ Timer complete: {label}"
+            message = f"Timer complete: {label}"
         
-        print(f"\n{message}\n")
+        print(f"\n⏰ {message}\n")
+        
+        # Lowest speech priority - never talks over a reply or a reminder
+        if self.tts_engine:
+            self.tts_engine.speak(message, language, priority=SpeechPriority.TIMER, wait=False)
         
         # Show toast notification if callback provided
         if self.notification_callback:
@@ -10,20 +10,36 @@ load_dotenv()
 from chatur.utils.logger import setup_logger
 from chatur.storage.init_db import init_database
 from chatur.core.tts import TextToSpeech
-from chatur.core.stt import SpeechToText
+from chatur.core.stt_factory import STTFactory
 from chatur.core.llm import LLMClient
 from chatur.core.wake_word import WakeWordDetector, create_wake_word_detector
 from chatur.service.command_processor import CommandProcessor
 from chatur.service.scheduler import ReminderScheduler
 from chatur.ui.system_tray import create_tray
 from chatur.ui.webview_overlay import WebViewOverlay
-from chatur.api.socket_server import run_api_server, broadcast_message_sync
+from chatur.api.socket_server import run_api_server, broadcast_message_sync, broadcast_transcript
 from chatur.core.assistant_state import AssistantStateMachine, AssistantState
 from chatur.core.activation import ActivationListener
+from chatur.core.activation_dispatcher import ActivationDispatcher
+from chatur.core.audio_capture import get_audio_capture
+from chatur.core.follow_up import listen_for_follow_up
+from chatur.service.power_policy import power_policy, PowerProfile
 from chatur.utils.config import config
+from chatur.utils.metrics import StartupTimer
+from chatur.utils.transliteration import has_devanagari
 
 logger = setup_logger('chatur')
 
+# Optional engine modules - reported at startup to confirm only the configured ones were imported
+ENGINE_MODULES = [
+    'azure.cognitiveservices.speech',
+    'speech_recognition',
+    'vosk',
+    'faster_whisper',
+    'pvporcupine',
+    'pyaudio',
+]
+
 tts = None
 stt = None
 llm = None
@@ -32,28 +48,37 @@ scheduler = None
 state_machine = None
 activation_listener = None
 wake_word_detector = None
+activation_dispatcher = None
 native_overlay = None
 
 
 def initialize_components():
     """Initialize all core components"""
     global tts, stt, llm, processor, scheduler, state_machine, native_overlay, wake_word_detector
+    global activation_dispatcher
     
     logger.info("=" * 60)
     logger.info("Computer Voice Assistant - Initializing")
     logger.info("=" * 60)
     
+    timer = StartupTimer()
+    
     logger.info("Initializing database...")
-    init_database()
+    with timer.stage('database'):
+        init_database()
     
     logger.info("Initializing TTS engine...")
-    tts = TextToSpeech()
+    with timer.stage('tts'):
+        tts = TextToSpeech()
     
     logger.info("Initializing STT engine...")
-    stt = SpeechToText()
+    with timer.stage('stt'):
+        # Partial transcripts stream to the overlay while the user speaks
+        stt = STTFactory.create(on_partial=broadcast_transcript)
     
     logger.info("Initializing LLM client...")
-    llm = LLMClient()
+    with timer.stage('llm'):
+        llm = LLMClient()
     
     logger.info("Starting API server...")
     api_thread = threading.Thread(target=run_api_server, daemon=True)
@@ -65,8 +90,9 @@ def initialize_components():
     else:
         static_dir = Path(__file__).parent.parent / "ui" / "dist"
     
-    native_overlay = WebViewOverlay(static_dir=static_dir)
-    native_overlay.create_window()
+    with timer.stage('overlay'):
+        native_overlay = WebViewOverlay(static_dir=static_dir)
+        native_overlay.create_window()
 
     logger.info("Initializing state machine...")
     def on_state_change(event_type, data):
@@ -77,37 +103,97 @@ def initialize_components():
             native_overlay.update_state(state)
     
     state_machine = AssistantStateMachine(broadcast_callback=on_state_change)
+    
+    # Triggers only enqueue; the interaction cycle runs on the dispatcher's worker
+    activation_dispatcher = ActivationDispatcher(
+        on_activate=handle_user_activation,
+        debounce_seconds=config.get_float('activation.debounce_seconds', 0.5),
+        on_busy=barge_in
+    )
+    activation_dispatcher.start()
 
     logger.info("Initializing command processor...")
-    processor = CommandProcessor(llm, tts, broadcast_callback=broadcast_message_sync)
+    with timer.stage('command_processor'):
+        processor = CommandProcessor(llm, tts, broadcast_callback=broadcast_message_sync)
     
     logger.info("Initializing reminder scheduler...")
-    scheduler = ReminderScheduler(tts_engine=tts)
-    scheduler.start()
+    with timer.stage('scheduler'):
+        scheduler = ReminderScheduler(tts_engine=tts)
+        scheduler.start()
     
     wake_word_enabled = config.get_bool('wake_word.enabled', False)
     if wake_word_enabled:
         logger.info("Initializing wake word detector...")
-        wake_word_detector = create_wake_word_detector(
-            on_wake_word=handle_user_activation
-        )
-        if wake_word_detector:
-            wake_word_detector.start()
-            logger.info("Wake word detection started")
-        else:
-            logger.warning("Wake word detector failed to initialize")
+        with timer.stage('wake_word'):
+            wake_word_detector = create_wake_word_detector(
+                on_wake_word=lambda: activation_dispatcher.trigger('wake_word')
+            )
+            if wake_word_detector:
+                wake_word_detector.start()
+                logger.info("Wake word detection started")
+            else:
+                logger.warning("Wake word detector failed to initialize")
     else:
         logger.info("Wake word detection is disabled")
         wake_word_detector = None
     
+    logger.info("Starting power policy...")
+    power_policy.register(apply_power_profile)
+    power_policy.start()
+    
+    timer.report(logger, watch_modules=ENGINE_MODULES)
+    
+    # Handlers build in the background so "ready" never waits on Google OAuth or pint
+    threading.Thread(target=processor.warm_up_handlers, name="HandlerWarmup", daemon=True).start()
+    
     logger.info("=" * 60)
     logger.info("Initialization complete!")
     logger.info("=" * 60)
 
 
+def apply_power_profile(profile: PowerProfile):
+    """Retune the always-on audio path and background jobs for the power source"""
+    get_audio_capture().set_buffer_frames(profile.capture_buffer_frames)
+    
+    if wake_word_detector and wake_word_detector.gate:
+        wake_word_detector.gate.open_ratio = profile.gate_open_ratio
+        wake_word_detector.gate.min_threshold = profile.gate_min_threshold
+    
+    noise_tracker = getattr(stt, 'noise_tracker', None)
+    if noise_tracker:
+        noise_tracker.update_every = profile.noise_update_every
+    
+    if scheduler:
+        scheduler.set_interval(profile.scheduler_interval_seconds)
+    
+    if profile.background_work and tts and tts.cache is not None:
+        threading.Thread(target=warm_speech_cache, name="SpeechCacheWarmup", daemon=True).start()
+
+
+def warm_speech_cache():
+    """Queue the most frequent past replies for synthesis into the TTS cache"""
+    if not processor:
+        return
+    
+    try:
+        responses = processor.conversation_repo.get_frequent_responses(
+            limit=config.get_int('tts.presynthesize_count', 30)
+        )
+    except Exception as e:
+        logger.error(f"Could not read frequent responses: {e}")
+        return
+    
+    for response in responses:
+        if not power_policy.allow_background_work():
+            break
+        language = 'hi' if has_devanagari(response) else 'en'
+        tts.presynthesize(response, language)
+    logger.info(f"Queued {len(responses)} frequent replies for pre-synthesis")
+
+
 def shutdown_components():
     """Shutdown all components gracefully"""
-    global scheduler, activation_listener, native_overlay, wake_word_detector
+    global scheduler, activation_listener, native_overlay, wake_word_detector, activation_dispatcher, tts
     
     logger.info("Shutting down components...")
     
@@ -117,30 +203,45 @@ def shutdown_components():
     if activation_listener:
         activation_listener.stop()
     
+    if activation_dispatcher:
+        activation_dispatcher.stop()
+    
     if native_overlay:
         native_overlay.stop()
     
     if scheduler:
         scheduler.stop()
     
+    if processor:
+        processor.shutdown()
+    
+    if tts:
+        tts.stop()
+    
+    power_policy.stop()
+    get_audio_capture().stop()
+    
     logger.info("Shutdown complete")
 
 
 
 def handle_user_activation():
     """
-    Called when user presses Ctrl+Space
-    Triggers one complete interaction cycle: Listen → Process → Speak → Idle
+    Runs on the activation dispatcher's worker (Ctrl+Space or wake word)
+    Triggers one conversation: Listen → Process → Speak → (follow-up window) → Idle
     """
     global state_machine, stt, processor
     
-    if not state_machine.is_idle():
+    # Transition to LISTENING state
+    if not state_machine.transition_if(AssistantState.IDLE, AssistantState.LISTENING):
         logger.warning("Activation ignored - assistant already active")
         return
     
+    # Cut off a reminder or timer announcement that is still playing
+    if tts.is_speaking():
+        tts.interrupt()
+    
     try:
-        # Transition to LISTENING state
-        state_machine.transition_to(AssistantState.LISTENING)
         logger.info("Listening for user input...")
         
         # Capture voice input
@@ -151,16 +252,28 @@ def handle_user_activation():
             state_machine.transition_to(AssistantState.IDLE)
             return
         
-        logger.info(f"User said: {user_input}")
-        
-        # Transition to PROCESSING state
-        state_machine.transition_to(AssistantState.PROCESSING)
-        
-        # Process command (this will transition to SPEAKING internally via processor)
-        response = processor.process_command(user_input)
-        logger.info(f"Response: {response}")
+        while user_input:
+            logger.info(f"User said: {user_input}")
+            
+            # Re-arm barge-in before PROCESSING makes barge_in() accept triggers
+            processor.begin_command()
+            state_machine.transition_to(AssistantState.PROCESSING)
+            
+            # Process command (this will transition to SPEAKING internally via processor)
+            response = processor.process_command(user_input)
+            logger.info(f"Response: {response}")
+            
+            if processor.interrupted:
+                # Barge-in: go straight back to listening for the new command
+                state_machine.transition_to(AssistantState.LISTENING)
+                user_input = stt.listen()
+            else:
+                # Speech right after the reply starts the next turn without re-activation
+                user_input = listen_for_follow_up(
+                    stt, on_listening=lambda: state_machine.transition_to(AssistantState.LISTENING)
+                )
         
-        # Return to IDLE after speaking completes
+        # Return to IDLE once the follow-up window passes in silence
         state_machine.transition_to(AssistantState.IDLE)
         
     except Exception as e:
@@ -168,6 +281,21 @@ def handle_user_activation():
         state_machine.transition_to(AssistantState.IDLE)
 
 
+def barge_in(source: str) -> bool:
+    """
+    Wake word or hotkey during an activation: stop the reply and listen again
+    
+    Returns:
+        True if the reply was interrupted, False if the trigger should be ignored
+    """
+    if state_machine.state not in (AssistantState.PROCESSING, AssistantState.SPEAKING):
+        return False
+    
+    logger.info(f"Barge-in from {source}")
+    processor.interrupt()
+    return True
+
+
 def run_idle_loop(stop_event: threading.Event):
     """
     IDLE loop - waits for wake word OR keyboard activation
@@ -183,7 +311,9 @@ def run_idle_loop(stop_event: threading.Event):
         logger.info("Assistant running in IDLE mode")
         logger.info("Press Ctrl+Space to activate")
         
-        activation_listener = ActivationListener(on_activate=handle_user_activation)
+        activation_listener = ActivationListener(
+            on_activate=lambda: activation_dispatcher.trigger('hotkey')
+        )
         activation_listener.start()
     
     while not stop_event.is_set():
@@ -204,7 +334,7 @@ def run_assistant_loop(stop_event: threading.Event):
     logger.info("Assistant loop started")
     
     # Check if STT is available
-    use_voice = stt.recognizer is not None
+    use_voice = stt.is_available()
     
     if not use_voice:
         logger.warning("STT not available - text mode only")
@@ -226,6 +356,7 @@ def run_assistant_loop(stop_event: threading.Event):
                 break
             
             # Process command
+            processor.begin_command()
             response = processor.process_command(command)
             print(f"Computer: {response}\n")
             
@@ -252,8 +383,8 @@ def main_console():
         tts.speak("Hello, I am Computer. I'm ready to help you.", 'en')
         
         # Check if STT is available
-        if not stt.recognizer:
-            print("\n⚠️  Azure Speech-to-Text not configured")
+        if not stt.is_available():
+            print("\n⚠️  Speech-to-Text not configured")
             print("Running in TEXT MODE - type your commands\n")
         else:
             print("\n" + "=" * 60)
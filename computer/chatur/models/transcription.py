@@ -0,0 +1,11 @@
+"""Speech recognition result models"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class Transcription:
+    """Text recognized from one utterance"""
+    text: str
+    engine: str
+    confidence: Optional[float] = None  # None when the engine does not report one
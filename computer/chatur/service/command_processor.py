@@ -1,56 +1,209 @@
 """Command processor - integrates all handlers"""
 
+import time
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Dict, Optional
 from chatur.core.llm import LLMClient
-from chatur.core.tts import TextToSpeech
-from chatur.handlers.reminder import ReminderHandler
-from chatur.handlers.timer import TimerHandler
-from chatur.handlers.notes import NotesHandler
-from chatur.handlers.qa import QAHandler
-from chatur.handlers.app_launcher import AppLauncherHandler
-from chatur.handlers.media_control import MediaControlHandler
-from chatur.handlers.file_search import FileSearchHandler
-from chatur.handlers.weather import WeatherHandler
-from chatur.handlers.system_info import SystemInfoHandler
-from chatur.handlers.math import MathHandler
-from chatur.handlers.calendar import CalendarHandler
-from chatur.handlers.email import GmailHandler
-from chatur.handlers.tasks import GoogleTasksHandler
-from chatur.storage.conversation_repository import ConversationRepository
+from chatur.core.tts import TextToSpeech, SpeechPriority
+from chatur.service.handler_executor import HandlerExecutor, HandlerTimeout
+from chatur.service.lazy_handler import LazyHandler
+from chatur.storage.conversation_repository import ConversationRepository, get_conversation_repository
 from chatur.models.intent import IntentType
 from chatur.utils.logger import setup_logger
+from chatur.utils.metrics import metrics
+from chatur.utils.responses import ResponseBuilder
 
 logger = setup_logger('chatur.command_processor')
 
 class CommandProcessor:
     """Process voice commands and execute actions"""
     
-    def __init__(self, llm_client: LLMClient, tts_engine: TextToSpeech, broadcast_callback=None):
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        tts_engine: TextToSpeech,
+        broadcast_callback=None,
+        conversation_repo: Optional[ConversationRepository] = None
+    ):
         self.llm = llm_client
         self.tts = tts_engine
         self.broadcast = broadcast_callback
-        self.conversation_repo = ConversationRepository()
-        
-        # Initialize handlers
-        self.handlers = {
-            IntentType.REMINDER: ReminderHandler(),
-            IntentType.TIMER: TimerHandler(tts_engine=tts_engine),
-            IntentType.NOTE: NotesHandler(),
-            IntentType.QUESTION: QAHandler(llm_client, self.conversation_repo),
-            IntentType.APP_LAUNCH: AppLauncherHandler(),
-            IntentType.MEDIA_CONTROL: MediaControlHandler(),
-            IntentType.FILE_SEARCH: FileSearchHandler(),
-            IntentType.WEATHER: WeatherHandler(),
-            IntentType.SYSTEM_INFO: SystemInfoHandler(),
-            IntentType.MATH: MathHandler(),
-            IntentType.CALENDAR: CalendarHandler(),
-            IntentType.EMAIL: GmailHandler(),
-            IntentType.TASK: GoogleTasksHandler(),
+        # Write-behind: history commits happen off the path between handler result and speech.
+        # The default instance is shared with /api/history so it sees queued exchanges too.
+        self.conversation_repo = conversation_repo if conversation_repo is not None else get_conversation_repository()
+        
+        # Set by interrupt() to cancel in-flight LLM streaming and speech
+        self.cancel_event = threading.Event()
+        
+        # Handlers run on a bounded pool with deadlines (performance.* in config.yaml)
+        self.executor = HandlerExecutor()
+        
+        # Handlers are built on first use or by warm_up_handlers(), never here:
+        # Google OAuth, pint and COM setup would otherwise delay start-up
+        self.handlers: Dict[IntentType, LazyHandler] = {
+            IntentType.REMINDER: LazyHandler('reminder', 'chatur.handlers.reminder', 'ReminderHandler'),
+            IntentType.TIMER: LazyHandler('timer', 'chatur.handlers.timer', 'TimerHandler', tts_engine=tts_engine),
+            IntentType.NOTE: LazyHandler('note', 'chatur.handlers.notes', 'NotesHandler'),
+            IntentType.QUESTION: LazyHandler(
+                'question', 'chatur.handlers.qa', 'QAHandler',
+                llm_client, self.conversation_repo, cancel_event=self.cancel_event
+            ),
+            IntentType.APP_LAUNCH: LazyHandler('app_launch', 'chatur.handlers.app_launcher', 'AppLauncherHandler'),
+            IntentType.MEDIA_CONTROL: LazyHandler('media_control', 'chatur.handlers.media_control', 'MediaControlHandler'),
+            IntentType.FILE_SEARCH: LazyHandler('file_search', 'chatur.handlers.file_search', 'FileSearchHandler'),
+            IntentType.WEATHER: LazyHandler('weather', 'chatur.handlers.weather', 'WeatherHandler'),
+            IntentType.SYSTEM_INFO: LazyHandler('system_info', 'chatur.handlers.system_info', 'SystemInfoHandler'),
+            IntentType.MATH: LazyHandler('math', 'chatur.handlers.math', 'MathHandler'),
+            IntentType.CALENDAR: LazyHandler('calendar', 'chatur.handlers.calendar', 'CalendarHandler'),
+            IntentType.EMAIL: LazyHandler('email', 'chatur.handlers.email', 'GmailHandler'),
+            IntentType.TASK: LazyHandler('task', 'chatur.handlers.tasks', 'GoogleTasksHandler'),
         }
         
-        logger.info("Command processor initialized with all handlers")
+        logger.info(f"Command processor initialized ({len(self.handlers)} handlers deferred)")
+    
+    @property
+    def interrupted(self) -> bool:
+        """Whether the last command was cut short by a barge-in"""
+        return self.cancel_event.is_set()
+    
+    def begin_command(self) -> None:
+        """
+        Re-arm barge-in for the next command
+        
+        Call before the state leaves LISTENING: a barge-in accepted after that
+        point must not be wiped out when process_command() starts.
+        """
+        self.cancel_event.clear()
+    
+    def interrupt(self) -> None:
+        """Barge-in: cancel LLM streaming and stop the spoken response"""
+        self.cancel_event.set()
+        self.tts.interrupt()
+    
+    def _speculate(self, handler, intent):
+        """Queue the handler's predicted reply for synthesis; returns the prediction or None"""
+        try:
+            predicted = handler.predict_response(intent)
+        except Exception as e:
+            logger.debug(f"Response prediction failed: {e}")
+            return None
+        
+        if predicted and self.tts.presynthesize(predicted, intent.response_language, priority=SpeechPriority.INTERACTIVE):
+            return predicted
+        return None
+    
+    def _timeout_response(self, language: str) -> str:
+        return ResponseBuilder.get(language, {
+            'en': "Sorry, that is taking too long. Please try again.",
+            'hi': "माफ़ करें, इसमें बहुत समय लग रहा है। कृपया दोबारा कोशिश करें।"
+        })
+    
+    def _process_stream(self, command_text: str, handler, intent) -> str:
+        """Speak and broadcast each chunk of a streaming handler as soon as it is produced"""
+        language = intent.response_language
+        chunks = []
+        timed_out = False
+        
+        if self.broadcast: self.broadcast('speaking')
+        stream = self.executor.run_stream(intent.type.value, handler.handle_stream(intent), cancel_event=self.cancel_event)
+        try:
+            for chunk in stream:
+                if self.interrupted:
+                    break
+                chunks.append(chunk)
+                if self.broadcast: self.broadcast('response_chunk', {'text': chunk})
+                # Queued in order; the handler keeps fetching while earlier chunks play
+                self.tts.speak(chunk, language, wait=False, merge=False)
+        except HandlerTimeout:
+            timed_out = True
+            self.tts.speak(self._timeout_response(language), language, wait=False, merge=False)
+        except CancelledError:
+            pass
+        self.tts.flush()
+        
+        response = "\n".join(chunks)
+        logger.info(f"Handler response: {response}")
+        
+        if self.interrupted:
+            logger.info("Command interrupted while streaming")
+            return response
+        
+        # Store what the handler produced; the timeout apology is not an answer
+        if response:
+            self.conversation_repo.add_exchange(
+                user_input=command_text,
+                assistant_response=response,
+                intent_type=intent.type.value
+            )
+        if timed_out:
+            response = "\n".join(chunks + [self._timeout_response(language)])
+        
+        if self.broadcast: self.broadcast('idle')
+        return response
+    
+    def _finish(self, command_text: str, intent, response: str, remember: bool = True) -> str:
+        """
+        Store the exchange and speak the reply, keeping the overlay state in step
+        
+        Args:
+            remember: Add to conversation history (False for replies that are not
+                      answers, so they never reach the LLM as context)
+        """
+        if remember:
+            self.conversation_repo.add_exchange(
+                user_input=command_text,
+                assistant_response=response,
+                intent_type=intent.type.value
+            )
+        
+        if self.broadcast: self.broadcast('speaking')
+        self.tts.speak(response, intent.response_language)
+        
+        if self.broadcast: self.broadcast('idle')
+        return response
+    
+    def warm_up_handlers(self) -> Dict[str, float]:
+        """
+        Build every handler in parallel and log how long each took
+        
+        Meant for a background thread once the UI is up. A command arriving
+        meanwhile only waits for its own handler.
+        
+        Returns:
+            Init seconds per handler name (failed handlers are left out)
+        """
+        pending = [handler for handler in self.handlers.values() if not handler.ready]
+        if not pending:
+            return {}
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='HandlerWarmup') as pool:
+            futures = {handler.name: pool.submit(handler.get) for handler in pending}
+        
+        timings = {}
+        logger.info("Handler warm-up report:")
+        for handler in pending:
+            error = futures[handler.name].exception()
+            if error:
+                logger.warning(f"  {handler.name:<24} failed: {error}")
+            else:
+                timings[handler.name] = handler.init_seconds
+                logger.info(f"  {handler.name:<24} {handler.init_seconds * 1000:9.1f} ms")
+        logger.info(f"  {'total (parallel)':<24} {(time.perf_counter() - started) * 1000:9.1f} ms")
+        return timings
+    
+    def shutdown(self) -> None:
+        """Stop accepting handler work and flush queued conversation history"""
+        self.executor.shutdown()
+        self.conversation_repo.close()
     
     def process_command(self, command_text: str) -> str:
-        """Process a voice command and return response"""
+        """
+        Process a voice command and return response
+        
+        Callers run begin_command() first; an interrupt() since then cancels this command.
+        """
         try:
             logger.info(f"Processing command: {command_text}")
             
@@ -62,25 +215,45 @@ class CommandProcessor:
             
             # Find appropriate handler
             handler = self.handlers.get(intent.type)
+            if handler and not handler.ready:
+                # Needed before warm-up reached it: build it under the handler's deadline
+                try:
+                    self.executor.run(intent.type.value, handler.get, cancel_event=self.cancel_event)
+                except HandlerTimeout:
+                    return self._finish(
+                        command_text, intent, self._timeout_response(intent.response_language), remember=False
+                    )
+                except CancelledError:
+                    return ""
             
             if handler and handler.can_handle(intent):
+                if handler.streaming:
+                    return self._process_stream(command_text, handler, intent)
+                
+                # Synthesize the expected confirmation while the handler runs
+                predicted = self._speculate(handler, intent)
+                
                 # Execute handler
-                response = handler.handle(intent)
+                timed_out = False
+                try:
+                    response = self.executor.run(
+                        intent.type.value, handler.handle, intent, cancel_event=self.cancel_event
+                    )
+                except HandlerTimeout:
+                    timed_out = True
+                    response = self._timeout_response(intent.response_language)
+                except CancelledError:
+                    logger.info("Command interrupted while the handler was running")
+                    return ""
                 logger.info(f"Handler response: {response}")
+                if predicted:
+                    metrics.increment('tts.speculation_hit' if response == predicted else 'tts.speculation_miss')
                 
-                # Store in conversation history
-                self.conversation_repo.add_exchange(
-                    user_input=command_text,
-                    assistant_response=response,
-                    intent_type=intent.type.value
-                )
-                
-                # Speak response
-                if self.broadcast: self.broadcast('speaking')
-                self.tts.speak(response, intent.response_language)
+                if self.interrupted:
+                    logger.info("Command interrupted before speaking")
+                    return response
                 
-                if self.broadcast: self.broadcast('idle')
-                return response
+                return self._finish(command_text, intent, response, remember=not timed_out)
             else:
                 # Unknown intent
                 logger.warning(f"No handler for intent: {intent.type.value}")
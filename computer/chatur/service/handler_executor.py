@@ -0,0 +1,141 @@
+"""
+Bounded executor for intent handlers
+Handlers run on a fixed-size pool with a deadline, so a hung Google API call or
+a slow file search cannot block the activation thread
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Iterator, Optional
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.handler_executor')
+
+_STREAM_END = object()
+
+
+class HandlerTimeout(Exception):
+    """A handler missed its deadline (it may still be running on its worker)"""
+
+    def __init__(self, name: str, timeout: float):
+        super().__init__(f"{name} handler timed out after {timeout:.0f}s")
+        self.name = name
+        self.timeout = timeout
+
+
+class HandlerExecutor:
+    """Runs handler calls on a bounded thread pool with per-handler deadlines"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        timeouts: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            max_workers: Handlers allowed to run at once (default: performance.max_concurrent_handlers)
+            timeout_seconds: Default deadline (default: performance.command_timeout_seconds)
+            timeouts: Per-handler deadlines by name (default: performance.handler_timeouts)
+        """
+        self.max_workers = max_workers or config.get_int('performance.max_concurrent_handlers', 5)
+        self.timeout_seconds = timeout_seconds or config.get_float('performance.command_timeout_seconds', 30.0)
+        self.timeouts = timeouts if timeouts is not None else (config.get('performance.handler_timeouts') or {})
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='Handler')
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def timeout_for(self, name: str) -> float:
+        return float(self.timeouts.get(name, self.timeout_seconds))
+
+    def _call(self, name: str, func: Callable, *args) -> Any:
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _wait(self, future, name: str, deadline: float, timeout: float, cancel_event: Optional[threading.Event]) -> Any:
+        """Wait for a future until the deadline, giving up early on cancel_event"""
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                future.cancel()  # Only helps if it never started; a running call is abandoned
+                metrics.increment(f'handler.{name}.timeouts')
+                logger.warning(f"{name} handler timed out after {timeout:.0f}s")
+                raise HandlerTimeout(name, timeout)
+            try:
+                return future.result(timeout=min(remaining, 0.25) if cancel_event else remaining)
+            except FutureTimeout:
+                if cancel_event and cancel_event.is_set():
+                    future.cancel()
+                    raise CancelledError(f"{name} handler cancelled")
+
+    def run(self, name: str, func: Callable, *args, cancel_event: Optional[threading.Event] = None) -> Any:
+        """
+        Run func(*args) on the pool and wait for the result
+
+        Args:
+            name: Handler name for deadlines and metrics
+            func: Callable to run, e.g. handler.handle
+            cancel_event: Stop waiting as soon as this is set (barge-in)
+
+        Returns:
+            Whatever func returns (its exceptions are re-raised)
+
+        Raises:
+            HandlerTimeout: Deadline passed
+            CancelledError: cancel_event was set
+        """
+        timeout = self.timeout_for(name)
+        started = time.monotonic()
+        future = self._executor.submit(self._call, name, func, *args)
+        try:
+            return self._wait(future, name, started + timeout, timeout, cancel_event)
+        finally:
+            metrics.latency(f'handler.{name}').record(time.monotonic() - started)
+
+    def run_stream(
+        self,
+        name: str,
+        chunks: Iterator[str],
+        cancel_event: Optional[threading.Event] = None
+    ) -> Iterator[str]:
+        """
+        Pull a streaming handler's chunks on the pool under one overall deadline
+
+        Raises:
+            HandlerTimeout: Deadline passed before the stream ended
+            CancelledError: cancel_event was set
+        """
+        timeout = self.timeout_for(name)
+        started = time.monotonic()
+        deadline = started + timeout
+        try:
+            while True:
+                future = self._executor.submit(self._call, name, next, chunks, _STREAM_END)
+                chunk = self._wait(future, name, deadline, timeout, cancel_event)
+                if chunk is _STREAM_END:
+                    return
+                yield chunk
+        finally:
+            metrics.latency(f'handler.{name}').record(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            'max_workers': self.max_workers,
+            'in_flight': in_flight,
+            'timeout_seconds': self.timeout_seconds,
+        }
+
+    def shutdown(self) -> None:
+        """Drop queued calls without waiting for the ones already running"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
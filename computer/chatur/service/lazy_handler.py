@@ -0,0 +1,70 @@
+"""
+Lazily constructed intent handlers
+The handler's module is imported and its class instantiated on first use, so
+Google OAuth, pint's unit registry and COM setup stay off the start-up path
+"""
+
+import time
+import importlib
+import threading
+from typing import Any, Optional
+from chatur.handlers.base import BaseHandler
+from chatur.utils.logger import setup_logger
+from chatur.utils.metrics import metrics
+
+logger = setup_logger('chatur.lazy_handler')
+
+
+class LazyHandler:
+    """Stands in for a handler and builds it on first attribute access"""
+
+    def __init__(self, name: str, module: str, class_name: str, *args, **kwargs):
+        """
+        Args:
+            name: Handler name for logs and metrics (the intent type value)
+            module: Module that defines the handler, e.g. 'chatur.handlers.math'
+            class_name: Handler class in that module
+            *args, **kwargs: Passed to the handler's constructor
+        """
+        self.name = name
+        self.init_seconds: Optional[float] = None
+        self._module = module
+        self._class_name = class_name
+        self._args = args
+        self._kwargs = kwargs
+        self._handler: Optional[BaseHandler] = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the handler has been built"""
+        return self._handler is not None
+
+    def get(self) -> BaseHandler:
+        """
+        Build the handler if needed and return it
+
+        Concurrent callers wait for one construction. A failed construction
+        raises and is retried on the next call.
+        """
+        if self._handler is not None:
+            return self._handler
+
+        with self._lock:
+            if self._handler is None:
+                started = time.perf_counter()
+                handler_class = getattr(importlib.import_module(self._module), self._class_name)
+                handler = handler_class(*self._args, **self._kwargs)
+                self.init_seconds = time.perf_counter() - started
+                metrics.latency(f'handler_init.{self.name}').record(self.init_seconds)
+                logger.debug(f"{self.name} handler ready in {self.init_seconds * 1000:.1f} ms")
+                self._handler = handler
+            return self._handler
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only reached for attributes not set in __init__, i.e. the handler's own
+        return getattr(self.get(), attr)
+
+    def __repr__(self) -> str:
+        state = 'ready' if self.ready else 'pending'
+        return f"<LazyHandler {self.name} ({self._class_name}, {state})>"
@@ -0,0 +1,153 @@
+"""
+Power-aware duty cycling for the always-on audio path
+On battery the assistant wakes less often, gates harder and defers background work
+"""
+
+import threading
+from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional, Dict, Any
+import psutil
+from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+
+logger = setup_logger('chatur.power')
+
+
+@dataclass
+class PowerProfile:
+    """Tuning applied to background components for one power source"""
+    mode: str  # "ac" or "battery"
+    capture_buffer_frames: int  # Capture frames delivered per audio callback
+    gate_open_ratio: float  # Wake word energy gate: multiple of the noise floor
+    gate_min_threshold: float  # Wake word energy gate: absolute lower bound
+    noise_update_every: int  # Noise floor tracker processes one frame in N
+    scheduler_interval_seconds: int  # Reminder check interval
+    background_work: bool  # Whether prefetchers / pre-synthesis may run
+
+
+def _ac_profile() -> PowerProfile:
+    return PowerProfile(
+        mode='ac',
+        capture_buffer_frames=1,
+        gate_open_ratio=config.get_float('wake_word.gate_open_ratio', 2.5),
+        gate_min_threshold=config.get_float('wake_word.gate_min_threshold', 200.0),
+        noise_update_every=1,
+        scheduler_interval_seconds=config.scheduler_interval,
+        background_work=True
+    )
+
+
+def _battery_profile() -> PowerProfile:
+    return PowerProfile(
+        mode='battery',
+        capture_buffer_frames=config.get_int('power.battery_capture_buffer_frames', 4),
+        gate_open_ratio=config.get_float('power.battery_gate_open_ratio', 4.0),
+        gate_min_threshold=config.get_float('power.battery_gate_min_threshold', 400.0),
+        noise_update_every=config.get_int('power.battery_noise_update_every', 8),
+        scheduler_interval_seconds=config.get_int('power.battery_scheduler_interval_seconds', 60),
+        background_work=False
+    )
+
+
+class PowerPolicy:
+    """Watches the power source and pushes the matching profile to listeners"""
+
+    def __init__(
+        self,
+        poll_seconds: Optional[float] = None,
+        battery_reader: Callable = psutil.sensors_battery
+    ):
+        """
+        Args:
+            poll_seconds: How often to check the power source (default: power.poll_seconds)
+            battery_reader: Returns a psutil battery tuple or None (no battery)
+        """
+        self.poll_seconds = poll_seconds or config.get_float('power.poll_seconds', 30.0)
+        self.battery_reader = battery_reader
+
+        self._listeners: List[Callable[[PowerProfile], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.battery_percent: Optional[float] = None
+        self.profile = _ac_profile()
+
+    def _detect_mode(self) -> str:
+        override = config.get('power.mode', 'auto')
+        if override in ('ac', 'battery'):
+            return override
+
+        try:
+            battery = self.battery_reader()
+        except Exception as e:
+            logger.debug(f"Battery status unavailable: {e}")
+            return 'ac'
+
+        if battery is None:  # Desktop
+            self.battery_percent = None
+            return 'ac'
+
+        self.battery_percent = battery.percent
+        return 'ac' if battery.power_plugged else 'battery'
+
+    def refresh(self) -> PowerProfile:
+        """Re-read the power source and notify listeners if the mode changed"""
+        mode = self._detect_mode()
+        with self._lock:
+            if mode == self.profile.mode:
+                return self.profile
+            self.profile = _battery_profile() if mode == 'battery' else _ac_profile()
+            listeners = list(self._listeners)
+
+        logger.info(f"Power source changed - applying {mode} profile")
+        for listener in listeners:
+            self._notify(listener, self.profile)
+        return self.profile
+
+    def _notify(self, listener: Callable[[PowerProfile], None], profile: PowerProfile) -> None:
+        try:
+            listener(profile)
+        except Exception as e:
+            logger.error(f"Error applying power profile: {e}", exc_info=True)
+
+    def register(self, listener: Callable[[PowerProfile], None]) -> None:
+        """Add a listener; it is called right away with the current profile"""
+        with self._lock:
+            self._listeners.append(listener)
+            profile = self.profile
+        self._notify(listener, profile)
+
+    def allow_background_work(self) -> bool:
+        """Whether optional background work (prefetching, pre-synthesis) should run"""
+        return self.profile.background_work
+
+    def start(self) -> None:
+        """Start polling the power source"""
+        if self._thread:
+            return
+
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll_loop, name="PowerPolicy", daemon=True)
+        self._thread.start()
+        logger.info(f"Power policy started ({self.profile.mode} profile)")
+
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.poll_seconds):
+            self.refresh()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current policy as a JSON-serializable dict"""
+        return {
+            'battery_percent': self.battery_percent,
+            'profile': asdict(self.profile),
+        }
+
+
+# Global power policy instance
+power_policy = PowerPolicy()
@@ -1,9 +1,9 @@
 """Background scheduler for reminders and timers"""
 
-import threading
 import time
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
+from chatur.core.tts import SpeechPriority
 from chatur.storage.reminder_repository import ReminderRepository
 from chatur.utils.logger import setup_logger
 from chatur.utils.config import config
@@ -42,6 +42,16 @@ class ReminderScheduler:
         self.running = True
         logger.info(f"Reminder scheduler started (checking every {interval} seconds)")
     
+    def set_interval(self, seconds: int):
+        """Change how often reminders are checked (kept within the trigger window)"""
+        # Checks further apart than the ±window would let reminders slip through
+        seconds = max(1, min(seconds, 2 * config.reminder_window))
+        if not self.running:
+            return
+        
+        self.scheduler.reschedule_job('check_reminders', trigger='interval', seconds=seconds)
+        logger.info(f"Reminder check interval set to {seconds} seconds")
+    
     def stop(self):
         """Stop the scheduler"""
         if not self.running:
@@ -89,12 +99,8 @@ class ReminderScheduler:
                 else:
                     message = f"Reminder: {text}"
                 
-                # Speak in a separate thread to avoid blocking
-                threading.Thread(
-                    target=self.tts_engine.speak,
-                    args=(message, language),
-                    daemon=True
-                ).start()
+                # Queued behind any interactive reply; the TTS worker speaks it
+                self.tts_engine.speak(message, language, priority=SpeechPriority.REMINDER, wait=False)
             
             # Show notification
             if self.notification_callback:
@@ -1,10 +1,14 @@
 """Conversation history repository"""
 
 import sqlite3
-from datetime import datetime
+import threading
+from collections import deque
+from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from chatur.storage.repository import BaseRepository
 from chatur.utils.logger import setup_logger
+from chatur.utils.config import config
+from chatur.utils.metrics import metrics
 
 logger = setup_logger('chatur.storage.conversation')
 
@@ -12,9 +16,30 @@ logger = setup_logger('chatur.storage.conversation')
 class ConversationRepository(BaseRepository):
     """Repository for conversation history"""
     
-    def __init__(self):
+    def __init__(self, write_behind: bool = False):
+        """
+        Args:
+            write_behind: Queue add_exchange() writes for a background writer
+                          instead of committing on the caller's thread. Reads
+                          from this instance still see queued exchanges.
+        """
         super().__init__()
         self._create_table()
+        
+        self.write_behind = write_behind
+        if write_behind:
+            self.flush_interval = config.get_int('performance.history_flush_ms', 250) / 1000.0
+            self.max_pending = config.get_int('performance.history_max_pending', 100)
+            
+            # Exchanges not yet committed, oldest first; also the read overlay
+            self._pending = deque()
+            self._lock = threading.Lock()
+            # Held for a whole commit and by reads, so no exchange is seen twice or missed
+            self._write_lock = threading.Lock()
+            self._wakeup = threading.Event()
+            self._stop = threading.Event()
+            self._writer = threading.Thread(target=self._writer_loop, name="HistoryWriter", daemon=True)
+            self._writer.start()
     
     def _create_table(self):
         """Create conversation history table"""
@@ -42,7 +67,7 @@ class ConversationRepository(BaseRepository):
             ''')
     
     def add_exchange(self, user_input: str, assistant_response: str, 
-                    intent_type: str = None, session_id: str = None) -> int:
+                    intent_type: str = None, session_id: str = None) -> Optional[int]:
         """
         Add a conversation exchange
         
@@ -53,8 +78,19 @@ class ConversationRepository(BaseRepository):
             session_id: Session identifier (optional)
         
         Returns:
-            ID of the created record
+            ID of the created record (None when queued for write-behind)
         """
+        if self.write_behind and not self._stop.is_set():
+            self._enqueue({
+                'id': None,
+                'user_input': user_input,
+                'assistant_response': assistant_response,
+                'intent_type': intent_type,
+                'session_id': session_id,
+                'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            })
+            return None
+        
         with self._get_connection() as conn:
             cursor = conn.execute('''
                 INSERT INTO conversation_history 
@@ -64,6 +100,77 @@ class ConversationRepository(BaseRepository):
             
             return cursor.lastrowid
     
+    def _enqueue(self, exchange: Dict):
+        """Queue an exchange for the writer, flushing on this thread if the backlog is full"""
+        if len(self._pending) >= self.max_pending:
+            metrics.increment('history.backlog_full')
+            self.flush()
+            
+            with self._write_lock, self._lock:
+                while len(self._pending) >= self.max_pending:
+                    # Flush failed (e.g. database locked); keep the newest exchanges
+                    self._pending.popleft()
+                    metrics.increment('history.dropped')
+                    logger.warning("Conversation history backlog full, dropped the oldest exchange")
+        
+        with self._lock:
+            self._pending.append(exchange)
+        self._wakeup.set()
+    
+    def _writer_loop(self):
+        # Sleeps until there is something to write, so an idle assistant causes no wake-ups
+        while not self._stop.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            # Let a burst of exchanges collect into one transaction
+            self._stop.wait(self.flush_interval)
+            self.flush()
+    
+    def flush(self) -> int:
+        """
+        Commit queued exchanges in one transaction
+        
+        Returns:
+            Number of exchanges written
+        """
+        if not self.write_behind:
+            return 0
+        
+        with self._write_lock:
+            with self._lock:
+                batch = list(self._pending)
+            if not batch:
+                return 0
+            
+            try:
+                with self._get_connection() as conn:
+                    conn.executemany('''
+                        INSERT INTO conversation_history 
+                        (user_input, assistant_response, intent_type, session_id, timestamp)
+                        VALUES (:user_input, :assistant_response, :intent_type, :session_id, :timestamp)
+                    ''', batch)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to write {len(batch)} conversation exchanges: {e}")
+                return 0
+            
+            with self._lock:
+                # Only the writer removes entries, and new ones are appended behind the batch
+                for _ in batch:
+                    self._pending.popleft()
+        
+        metrics.increment('history.batches')
+        return len(batch)
+    
+    def close(self):
+        """Stop the background writer after committing everything queued"""
+        if not self.write_behind or self._stop.is_set():
+            return
+        self._stop.set()
+        self._wakeup.set()
+        self._writer.join(timeout=5)
+        written = self.flush()
+        logger.info(f"Conversation history writer stopped ({written} exchanges flushed)")
+    
     def get_recent_exchanges(self, limit: int = 10, session_id: str = None) -> List[Dict]:
         """
         Get recent conversation exchanges
@@ -75,6 +182,20 @@ class ConversationRepository(BaseRepository):
         Returns:
             List of conversation exchanges
         """
+        if self.write_behind:
+            with self._write_lock:
+                with self._lock:
+                    pending = [
+                        dict(exchange) for exchange in self._pending
+                        if not session_id or exchange['session_id'] == session_id
+                    ]
+                stored = self._query_recent_exchanges(limit, session_id)
+            # Queued exchanges are newer than anything committed
+            return (stored + pending)[-limit:] if limit > 0 else []
+        
+        return self._query_recent_exchanges(limit, session_id)
+    
+    def _query_recent_exchanges(self, limit: int, session_id: Optional[str]) -> List[Dict]:
         with self._get_connection() as conn:
             if session_id:
                 cursor = conn.execute('''
@@ -82,7 +203,7 @@ class ConversationRepository(BaseRepository):
                            session_id, timestamp
                     FROM conversation_history
                     WHERE session_id = ?
-                    ORDER BY timestamp DESC
+                    ORDER BY timestamp DESC, id DESC
                     LIMIT ?
                 ''', (session_id, limit))
             else:
@@ -90,7 +211,7 @@ class ConversationRepository(BaseRepository):
                     SELECT id, user_input, assistant_response, intent_type, 
                            session_id, timestamp
                     FROM conversation_history
-                    ORDER BY timestamp DESC
+                    ORDER BY timestamp DESC, id DESC
                     LIMIT ?
                 ''', (limit,))
             
@@ -118,6 +239,29 @@ class ConversationRepository(BaseRepository):
         exchanges = self.get_recent_exchanges(limit=1)
         return exchanges[0] if exchanges else None
     
+    def get_frequent_responses(self, limit: int = 30, min_count: int = 2) -> List[str]:
+        """
+        Get the assistant responses that recur most often
+        
+        Args:
+            limit: Maximum number of responses to return
+            min_count: Minimum number of occurrences
+        
+        Returns:
+            Responses, most frequent first
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute('''
+                SELECT assistant_response, COUNT(*) AS occurrences
+                FROM conversation_history
+                GROUP BY assistant_response
+                HAVING occurrences >= ?
+                ORDER BY occurrences DESC
+                LIMIT ?
+            ''', (min_count, limit))
+            
+            return [row[0] for row in cursor.fetchall()]
+    
     def clear_old_history(self, days: int = 30):
         """
         Clear conversation history older than specified days
@@ -155,3 +299,21 @@ class ConversationRepository(BaseRepository):
             context_lines.append(f"Assistant: {exchange['assistant_response']}")
         
         return "\n".join(context_lines)
+
+
+_repository: Optional[ConversationRepository] = None
+_repository_lock = threading.Lock()
+
+
+def get_conversation_repository() -> ConversationRepository:
+    """
+    Get the process-wide write-behind history repository
+    
+    Shared by the command processor and the API so every reader sees
+    exchanges that are still queued for the writer.
+    """
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = ConversationRepository(write_behind=True)
+        return _repository
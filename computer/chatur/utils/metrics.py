@@ -0,0 +1,160 @@
+"""Lightweight in-process metrics (latency distributions and counters)"""
+
+import re
+import sys
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, List, Tuple, Iterable
+
+
+class LatencyStats:
+    """Rolling latency distribution over the most recent samples"""
+
+    def __init__(self, window: int = 256):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Percentile (0.0 - 1.0) over the rolling window, in seconds"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(fraction * len(samples)))
+        return samples[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summary in milliseconds"""
+        return {
+            'count': self.count,
+            'mean_ms': round(1000 * self.total / self.count, 2) if self.count else 0.0,
+            'p50_ms': round(1000 * self.percentile(0.50), 2),
+            'p95_ms': round(1000 * self.percentile(0.95), 2),
+            'max_ms': round(1000 * self.max, 2),
+        }
+
+
+class MetricsRegistry:
+    """Named latency stats and counters shared across components"""
+
+    def __init__(self):
+        self._latencies: Dict[str, LatencyStats] = {}
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def latency(self, name: str) -> LatencyStats:
+        """Get (or create) the latency stats for a name"""
+        with self._lock:
+            stats = self._latencies.get(name)
+            if stats is None:
+                stats = self._latencies[name] = LatencyStats()
+            return stats
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All metrics as a JSON-serializable dict"""
+        with self._lock:
+            latencies = dict(self._latencies)
+            counters = dict(self._counters)
+        return {
+            'latency': {name: stats.snapshot() for name, stats in sorted(latencies.items())},
+            'counters': dict(sorted(counters.items())),
+        }
+
+
+# Global metrics instance
+metrics = MetricsRegistry()
+
+
+def _words(text: str) -> List[str]:
+    return re.sub(r"[^\w\s']", ' ', text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Word error rate: (substitutions + deletions + insertions) / reference words
+
+    Case and punctuation are ignored. An empty reference scores 0.0 for an
+    empty hypothesis and 1.0 otherwise.
+    """
+    ref = _words(reference)
+    hyp = _words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    # Levenshtein distance over words, one row at a time
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i]
+        for j, hyp_word in enumerate(hyp, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            ))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+class StartupTimer:
+    """Times named start-up stages and logs a summary report"""
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one start-up stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.stages.append((name, elapsed))
+            metrics.latency(f'startup.{name}').record(elapsed)
+
+    def report(self, logger, watch_modules: Iterable[str] = ()) -> None:
+        """
+        Log per-stage timings, resident memory and which optional modules got imported
+
+        Args:
+            logger: Logger to write the report to
+            watch_modules: Module names whose presence in sys.modules should be reported
+        """
+        total = time.perf_counter() - self._started
+        metrics.latency('startup.total').record(total)
+
+        logger.info("Startup timing report:")
+        for name, elapsed in self.stages:
+            logger.info(f"  {name:<24} {elapsed * 1000:9.1f} ms")
+        logger.info(f"  {'total':<24} {total * 1000:9.1f} ms")
+
+        try:
+            import psutil
+            rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+            logger.info(f"  {'resident memory':<24} {rss_mb:9.1f} MB")
+        except ImportError:
+            pass
+
+        loaded = [name for name in watch_modules if name in sys.modules]
+        logger.info(f"  {'optional modules loaded':<24} {', '.join(loaded) or 'none'}")
@@ -0,0 +1,95 @@
+"""
+Devanagari to Roman transliteration for voices without Hindi support
+
+Tables and patterns are compiled once at import and every step runs in C
+(str.translate / str.replace / re.sub with a template). Consonants carry the
+inherent 'a' unless a matra or virama follows, and a word-final inherent 'a'
+is dropped as spoken Hindi does (कमल -> kamal, नमस्ते -> namaste).
+"""
+
+import re
+from functools import lru_cache
+
+_DEVANAGARI = '\u0900-\u097F'
+_VIRAMA = '्'
+_NUKTA = '़'
+
+# Markers used between steps: a consonant's inherent vowel, and "a matra/virama follows"
+_INHERENT = '\x00'
+_NO_INHERENT = '\x01'
+
+CONSONANTS = {
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'श': 'sh',
+    'ष': 'sh', 'स': 's', 'ह': 'h',
+    # Precomposed nukta forms
+    'क़': 'q', 'ख़': 'kh', 'ग़': 'gh', 'ज़': 'z',
+    'ड़': 'r', 'ढ़': 'rh', 'फ़': 'f',
+}
+
+MATRAS = {
+    'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo', 'ृ': 'ri',
+    'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ॅ': 'e', 'ॉ': 'o',
+    _VIRAMA: '',
+}
+
+OTHERS = {
+    'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo', 'ऋ': 'ri',
+    'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ऑ': 'o',
+    'ं': 'n', 'ँ': 'n', 'ः': 'h', _NUKTA: '', 'ऽ': '',
+    '।': '.', '॥': '.',
+    '०': '0', '१': '1', '२': '2', '३': '3', '४': '4',
+    '५': '5', '६': '6', '७': '7', '८': '8', '९': '9',
+}
+
+_TABLE = str.maketrans({
+    **{consonant: roman + _INHERENT for consonant, roman in CONSONANTS.items()},
+    **{matra: _NO_INHERENT + roman for matra, roman in MATRAS.items()},
+    **OTHERS,
+})
+
+# Input text usually has nukta forms decomposed (consonant + U+093C)
+_NUKTA_PAIRS = [
+    (base + _NUKTA, composed) for base, composed in
+    zip('कखगजडढफ', 'क़ख़ग़ज़ड़ढ़फ़')
+]
+
+# Conjuncts spoken differently from their parts
+_CONJUNCTS = [('ज्ञ', 'ग्य')]
+
+# Schwa deletion: a bare consonant ending a word of two or more letters gets a virama
+_FINAL_CONSONANT = re.compile(f'(?<=[{_DEVANAGARI}][{"".join(CONSONANTS)}])(?![{_DEVANAGARI}])')
+_IS_DEVANAGARI = re.compile(f'[{_DEVANAGARI}]')
+
+
+def has_devanagari(text: str) -> bool:
+    """Whether text contains any Devanagari character"""
+    return _IS_DEVANAGARI.search(text) is not None
+
+
+@lru_cache(maxsize=1024)
+def transliterate(text: str) -> str:
+    """
+    Convert Devanagari in text to Roman script (other characters pass through)
+
+    Args:
+        text: Text that may contain Devanagari
+
+    Returns:
+        Romanized text suitable for an English voice
+    """
+    if not has_devanagari(text):
+        return text
+
+    if _NUKTA in text:
+        for decomposed, composed in _NUKTA_PAIRS:
+            text = text.replace(decomposed, composed)
+    for conjunct, spoken in _CONJUNCTS:
+        text = text.replace(conjunct, spoken)
+
+    text = _FINAL_CONSONANT.sub(_VIRAMA, text).translate(_TABLE)
+    return text.replace(_INHERENT + _NO_INHERENT, '').replace(_INHERENT, 'a').replace(_NO_INHERENT, '')
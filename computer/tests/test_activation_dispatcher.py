@@ -0,0 +1,169 @@
+"""Tests for the activation queue and thread-safe state transitions"""
+
+import sys
+import os
+import time
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.activation_dispatcher import ActivationDispatcher
+from chatur.core.assistant_state import AssistantStateMachine, AssistantState
+
+
+def test_trigger_does_not_block_caller():
+    """The interaction cycle runs on the worker, not the triggering thread"""
+    release = threading.Event()
+    threads = []
+
+    def activate():
+        threads.append(threading.current_thread().name)
+        release.wait(2.0)
+
+    dispatcher = ActivationDispatcher(on_activate=activate, debounce_seconds=0)
+    dispatcher.start()
+
+    started = time.time()
+    assert dispatcher.trigger('hotkey')
+    assert time.time() - started < 0.1
+
+    release.set()
+    dispatcher.stop()
+    assert threads == ['ActivationWorker']
+
+
+def test_duplicate_triggers_are_coalesced():
+    """Wake word and hotkey firing together run one interaction"""
+    release = threading.Event()
+    calls = []
+
+    def activate():
+        calls.append(True)
+        release.wait(2.0)
+
+    dispatcher = ActivationDispatcher(on_activate=activate, debounce_seconds=0)
+    dispatcher.start()
+
+    assert dispatcher.trigger('wake_word')
+    deadline = time.time() + 2.0
+    while not calls and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert not dispatcher.trigger('hotkey')
+    release.set()
+    dispatcher.stop()
+    assert len(calls) == 1
+
+
+def test_busy_trigger_can_barge_in():
+    """A trigger during an activation goes to on_busy instead of being dropped"""
+    release = threading.Event()
+    started = threading.Event()
+    barge_ins = []
+
+    def activate():
+        started.set()
+        release.wait(2.0)
+
+    def on_busy(source):
+        barge_ins.append(source)
+        release.set()
+        return True
+
+    dispatcher = ActivationDispatcher(on_activate=activate, debounce_seconds=0, on_busy=on_busy)
+    dispatcher.start()
+    assert dispatcher.trigger('hotkey')
+    assert started.wait(2.0)
+
+    assert dispatcher.trigger('wake_word')
+    dispatcher.stop()
+    assert barge_ins == ['wake_word']
+
+
+def test_triggers_are_debounced():
+    """A second trigger inside the debounce window is dropped"""
+    dispatcher = ActivationDispatcher(on_activate=lambda: None, debounce_seconds=10)
+    assert dispatcher.trigger('hotkey')
+    assert not dispatcher.trigger('hotkey')
+
+
+def test_barge_in_is_not_debounced():
+    """A barge-in right after the trigger that started the activation still reaches on_busy"""
+    release = threading.Event()
+    started = threading.Event()
+    barge_ins = []
+
+    def activate():
+        started.set()
+        release.wait(2.0)
+
+    def on_busy(source):
+        barge_ins.append(source)
+        release.set()
+        return True
+
+    dispatcher = ActivationDispatcher(on_activate=activate, debounce_seconds=10, on_busy=on_busy)
+    dispatcher.start()
+    assert dispatcher.trigger('hotkey')
+    assert started.wait(2.0)
+
+    assert dispatcher.trigger('hotkey')
+    dispatcher.stop()
+    assert barge_ins == ['hotkey']
+
+
+def test_broadcast_runs_outside_the_state_lock():
+    """A slow broadcast does not hold up transitions on other threads"""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_broadcast(event, data):
+        if data['state'] == 'listening':
+            entered.set()
+            release.wait(2.0)
+
+    machine = AssistantStateMachine(broadcast_callback=slow_broadcast)
+    sender = threading.Thread(target=machine.transition_to, args=(AssistantState.LISTENING,))
+    sender.start()
+    assert entered.wait(2.0)
+
+    other = threading.Thread(target=machine.transition_to, args=(AssistantState.PROCESSING,))
+    other.start()
+    other.join(timeout=1.0)
+    finished = not other.is_alive()
+    release.set()
+    sender.join()
+
+    assert finished
+    assert machine.state == AssistantState.PROCESSING
+
+
+def test_transition_if_is_atomic():
+    """Only one of many racing threads leaves IDLE"""
+    machine = AssistantStateMachine()
+    winners = []
+    barrier = threading.Barrier(8)
+
+    def race():
+        barrier.wait()
+        if machine.transition_if(AssistantState.IDLE, AssistantState.LISTENING):
+            winners.append(True)
+
+    threads = [threading.Thread(target=race) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(winners) == 1
+    assert machine.state == AssistantState.LISTENING
+
+
+if __name__ == "__main__":
+    test_trigger_does_not_block_caller()
+    test_duplicate_triggers_are_coalesced()
+    test_busy_trigger_can_barge_in()
+    test_triggers_are_debounced()
+    test_barge_in_is_not_debounced()
+    test_broadcast_runs_outside_the_state_lock()
+    test_transition_if_is_atomic()
+    print("All activation dispatcher tests passed!")
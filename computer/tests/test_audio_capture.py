@@ -0,0 +1,155 @@
+"""Tests for the shared audio capture fan-out"""
+
+import sys
+import os
+import time
+import wave
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.audio_capture import AudioCapture, AudioSubscription, FileCapture, PipeCapture, SourceCapture
+
+
+def test_subscription_fifo():
+    """Frames are delivered in capture order"""
+    sub = AudioSubscription(AudioCapture(), max_frames=4)
+    sub.push(b'a')
+    sub.push(b'b')
+    assert sub.read(timeout=0) == b'a'
+    assert sub.read(timeout=0) == b'b'
+    assert sub.read(timeout=0) is None
+
+
+def test_subscription_drops_oldest():
+    """A slow consumer loses the oldest frames, not the newest"""
+    sub = AudioSubscription(AudioCapture(), max_frames=2)
+    for frame in (b'1', b'2', b'3'):
+        sub.push(frame)
+    assert sub.dropped_frames == 1
+    assert sub.read(timeout=0) == b'2'
+    assert sub.read(timeout=0) == b'3'
+
+
+def test_callback_fans_out_to_all_subscribers():
+    """Every subscriber receives each captured frame"""
+    capture = AudioCapture()
+    first = AudioSubscription(capture)
+    second = AudioSubscription(capture)
+    capture._subscribers.extend([first, second])
+
+    for subscriber in list(capture._subscribers):
+        subscriber.push(b'frame')
+
+    first.close()
+    assert capture._subscribers == [second]
+    assert first.read(timeout=0) == b'frame'
+    assert second.read(timeout=0) == b'frame'
+
+
+def test_large_buffers_are_split_into_frames():
+    """Consumers still get frame_length frames when callbacks carry several"""
+    capture = AudioCapture(frame_length=4)
+    capture.set_buffer_frames(3)
+    sub = AudioSubscription(capture)
+    capture._subscribers.append(sub)
+
+    capture._fan_out(bytes(range(24)))
+    assert sub.read(timeout=0) == bytes(range(0, 8))
+    assert sub.read(timeout=0) == bytes(range(8, 16))
+    assert sub.read(timeout=0) == bytes(range(16, 24))
+    assert sub.read(timeout=0) is None
+
+
+def test_file_capture_replays_wav_then_silence():
+    """A WAV source is delivered frame by frame, followed by silence"""
+    path = os.path.join(tempfile.mkdtemp(), 'clip.wav')
+    audio = bytes(range(1, 201)) * 41  # 8200 bytes = 8 frames of 512 samples + a partial frame
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(audio)
+
+    capture = FileCapture(path)
+    sub = capture.subscribe()
+    assert sub is not None
+    frames = [sub.read(timeout=1.0) for _ in range(10)]
+    capture.stop()
+
+    assert all(len(frame) == 1024 for frame in frames)
+    assert b''.join(frames[:8]) == audio[:8192]
+    assert frames[8] == audio[8192:].ljust(1024, b'\0')
+    assert frames[9] == bytes(1024)
+
+
+def test_file_capture_rejects_wrong_format():
+    """Only 16 kHz mono WAVs are accepted"""
+    path = os.path.join(tempfile.mkdtemp(), 'stereo.wav')
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(bytes(400))
+
+    assert FileCapture(path).subscribe() is None
+
+
+def test_source_capture_is_abstract():
+    try:
+        SourceCapture('clip.pcm')
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+
+
+def test_buffer_change_keeps_source_position():
+    """A power profile change must not rewind a file source"""
+    path = os.path.join(tempfile.mkdtemp(), 'clip.pcm')
+    audio = bytes(range(256)) * 40  # 10240 bytes = 10 frames
+    with open(path, 'wb') as f:
+        f.write(audio)
+
+    capture = FileCapture(path)
+    sub = capture.subscribe()
+    reader = capture._stream
+    first = [sub.read(timeout=1.0) for _ in range(2)]
+    capture.set_buffer_frames(2)
+    rest = [sub.read(timeout=1.0) for _ in range(8)]
+    same_reader = capture._stream is reader
+    capture.stop()
+
+    assert capture.buffer_frames == 2
+    assert same_reader
+    assert b''.join(first + rest) == audio
+
+
+def test_pipe_capture_start_does_not_wait_for_writer():
+    if not hasattr(os, 'mkfifo'):
+        return
+    path = os.path.join(tempfile.mkdtemp(), 'mic.pipe')
+    os.mkfifo(path)
+
+    capture = PipeCapture(path)
+    started = time.monotonic()
+    sub = capture.subscribe()
+    assert sub is not None
+    assert time.monotonic() - started < 0.5
+
+    with open(path, 'wb') as writer:
+        writer.write(bytes(range(256)) * 4)
+    frame = sub.read(timeout=2.0)
+    capture.stop()
+    assert frame == bytes(range(256)) * 4
+
+
+if __name__ == "__main__":
+    test_subscription_fifo()
+    test_subscription_drops_oldest()
+    test_callback_fans_out_to_all_subscribers()
+    test_large_buffers_are_split_into_frames()
+    test_file_capture_replays_wav_then_silence()
+    test_file_capture_rejects_wrong_format()
+    test_source_capture_is_abstract()
+    test_buffer_change_keeps_source_position()
+    test_pipe_capture_start_does_not_wait_for_writer()
+    print("All audio capture tests passed!")
@@ -0,0 +1,40 @@
+"""Tests for the offline command vocabulary"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.command_grammar import build_command_vocabulary, build_command_grammar, UNKNOWN_WORD
+from chatur.utils.config import config
+
+
+def test_vocabulary_covers_intents_and_apps():
+    """Intent keywords, apps and slot words are all in the vocabulary"""
+    vocabulary = build_command_vocabulary()
+    for word in ['remind', 'timer', 'open', 'pause', 'task', 'minutes', 'tomorrow']:
+        assert word in vocabulary
+    for app in config.recognized_apps:
+        assert app in vocabulary
+
+
+def test_vocabulary_is_latin_only():
+    """Devanagari keywords and hyphenated forms are not passed to the English model"""
+    vocabulary = build_command_vocabulary()
+    assert 'याद' not in vocabulary
+    assert 'to-do' not in vocabulary
+    assert 'do' in vocabulary
+    assert vocabulary == sorted(set(vocabulary))
+
+
+def test_grammar_allows_unknown_words():
+    """The grammar keeps an [unk] slot so out-of-vocabulary speech scores low"""
+    grammar = json.loads(build_command_grammar())
+    assert grammar[-1] == UNKNOWN_WORD
+
+
+if __name__ == "__main__":
+    test_vocabulary_covers_intents_and_apps()
+    test_vocabulary_is_latin_only()
+    test_grammar_allows_unknown_words()
+    print("All command grammar tests passed!")
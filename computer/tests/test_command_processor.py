@@ -0,0 +1,246 @@
+"""Tests for CommandProcessor's handler dispatch, timeouts and history"""
+
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chatur.storage.repository
+from chatur.handlers.base import BaseHandler
+from chatur.models.intent import Intent, IntentType
+from chatur.service.command_processor import CommandProcessor
+from chatur.service.handler_executor import HandlerExecutor
+from chatur.service.lazy_handler import LazyHandler
+from chatur.storage.conversation_repository import ConversationRepository
+from chatur.utils.metrics import metrics
+
+RELEASE = threading.Event()
+BUILD_RELEASE = threading.Event()
+EMAIL_LINES = ["Here are your emails:", "- From Alice: Hi", "- From Bob: Lunch?"]
+ACTIVE = {}  # Processor under test, for handlers that barge in on it
+
+
+class SlowHandler(BaseHandler):
+    """Never answers within the test's deadline"""
+
+    def can_handle(self, intent):
+        return True
+
+    def handle(self, intent):
+        RELEASE.wait(timeout=5)
+        return "Too late"
+
+
+class QuickHandler(BaseHandler):
+    def can_handle(self, intent):
+        return True
+
+    def handle(self, intent):
+        return "It is 24 degrees"
+
+
+class PredictedHandler(QuickHandler):
+    def predict_response(self, intent):
+        return "It is 24 degrees"
+
+
+class MispredictedHandler(QuickHandler):
+    def predict_response(self, intent):
+        return "Okay"
+
+
+class StreamingHandler(QuickHandler):
+    streaming = True
+
+    def handle_stream(self, intent):
+        yield from EMAIL_LINES
+
+
+class InterruptedStreamHandler(StreamingHandler):
+    def handle_stream(self, intent):
+        yield EMAIL_LINES[0]
+        ACTIVE['processor'].interrupt()  # Barge-in while the next line is fetched
+        yield from EMAIL_LINES[1:]
+
+
+class FakeLLM:
+    def classify_intent(self, text):
+        return Intent(type=IntentType.WEATHER, language='en', parameters={}, response_language='en')
+
+
+class FakeTTS:
+    def __init__(self):
+        self.cache = False
+        self.spoken = []
+        self.calls = []
+        self.options = []
+
+    def speak(self, text, language='en', **kwargs):
+        self.spoken.append(text)
+        self.calls.append(('speak', text))
+        self.options.append(kwargs)
+
+    def presynthesize(self, text, *args, **kwargs):
+        if not self.cache:
+            return False
+        self.calls.append(('presynthesize', text))
+        return True
+
+    def flush(self, *args):
+        self.calls.append(('flush', None))
+
+    def interrupt(self):
+        pass
+
+
+def make_processor(handler_class):
+    original_path = chatur.storage.repository.DB_PATH
+    chatur.storage.repository.DB_PATH = Path(tempfile.mkdtemp()) / 'test.db'
+    try:
+        events = []
+        tts = FakeTTS()
+        processor = CommandProcessor(
+            FakeLLM(), tts,
+            broadcast_callback=lambda event, data=None: events.append(event),
+            conversation_repo=ConversationRepository(write_behind=True)
+        )
+    finally:
+        chatur.storage.repository.DB_PATH = original_path
+
+    processor.executor.shutdown()
+    processor.executor = HandlerExecutor(max_workers=2, timeout_seconds=0.2)
+    processor.handlers = {IntentType.WEATHER: LazyHandler('weather', __name__, handler_class)}
+    return processor, tts, events
+
+
+def test_reply_is_stored_and_spoken():
+    processor, tts, events = make_processor('QuickHandler')
+    try:
+        assert processor.process_command("weather") == "It is 24 degrees"
+        assert tts.spoken == ["It is 24 degrees"]
+        assert events == ['processing', 'speaking', 'idle']
+        assert processor.conversation_repo.get_last_exchange()['assistant_response'] == "It is 24 degrees"
+    finally:
+        processor.shutdown()
+
+
+def test_timeout_reply_is_spoken_but_not_remembered():
+    processor, tts, events = make_processor('SlowHandler')
+    try:
+        processor.handlers[IntentType.WEATHER].get()
+        response = processor.process_command("weather")
+        assert response == tts.spoken[0]
+        assert "too long" in response
+        assert events == ['processing', 'speaking', 'idle']
+        assert processor.conversation_repo.get_last_exchange() is None
+    finally:
+        RELEASE.set()
+        processor.shutdown()
+
+
+class SlowToBuildHandler(QuickHandler):
+    def __init__(self):
+        BUILD_RELEASE.wait(timeout=5)
+
+
+def test_cold_build_timeout_returns_overlay_to_idle():
+    """A handler still building past its deadline gets the spoken timeout reply and the full state cycle"""
+    processor, tts, events = make_processor('SlowToBuildHandler')
+    try:
+        response = processor.process_command("weather")
+        assert tts.spoken == [response]
+        assert "too long" in response
+        assert events == ['processing', 'speaking', 'idle']
+        assert processor.conversation_repo.get_last_exchange() is None
+    finally:
+        BUILD_RELEASE.set()
+        processor.shutdown()
+
+
+def test_barge_in_before_processing_starts_is_kept():
+    """A barge-in between begin_command() and process_command() cancels the reply"""
+    processor, tts, events = make_processor('QuickHandler')
+    try:
+        processor.begin_command()
+        processor.interrupt()  # Wake word lands while the state is already PROCESSING
+        processor.process_command("weather")
+        assert processor.interrupted
+        assert tts.spoken == []
+        assert 'speaking' not in events
+
+        processor.begin_command()
+        assert processor.process_command("weather") == "It is 24 degrees"
+        assert tts.spoken == ["It is 24 degrees"]
+    finally:
+        processor.shutdown()
+
+
+def test_speculation_hit_speaks_the_synthesized_reply():
+    """The predicted reply is synthesized while the handler runs and is the one spoken"""
+    processor, tts, events = make_processor('PredictedHandler')
+    tts.cache = True
+    hits = metrics.counter('tts.speculation_hit')
+    try:
+        assert processor.process_command("weather") == "It is 24 degrees"
+        assert tts.calls == [('presynthesize', "It is 24 degrees"), ('speak', "It is 24 degrees")]
+        assert metrics.counter('tts.speculation_hit') == hits + 1
+    finally:
+        processor.shutdown()
+
+
+def test_speculation_miss_does_not_hold_the_reply():
+    """A wrong prediction is counted and the real reply is spoken straight away"""
+    processor, tts, events = make_processor('MispredictedHandler')
+    tts.cache = True
+    misses = metrics.counter('tts.speculation_miss')
+    try:
+        assert processor.process_command("weather") == "It is 24 degrees"
+        # Nothing waits for the prediction's synthesis before the reply is queued
+        assert tts.calls == [('presynthesize', "Okay"), ('speak', "It is 24 degrees")]
+        assert metrics.counter('tts.speculation_miss') == misses + 1
+        assert events == ['processing', 'speaking', 'idle']
+    finally:
+        processor.shutdown()
+
+
+def test_streamed_reply_is_spoken_chunk_by_chunk():
+    """Each chunk is queued as produced, then flushed, and the whole reply is stored"""
+    processor, tts, events = make_processor('StreamingHandler')
+    try:
+        response = processor.process_command("weather")
+        assert response == "\n".join(EMAIL_LINES)
+        assert tts.calls == [('speak', line) for line in EMAIL_LINES] + [('flush', None)]
+        # Queued without blocking, and repeated lines are not merged
+        assert tts.options == [{'wait': False, 'merge': False}] * 3
+        assert events == ['processing', 'speaking'] + ['response_chunk'] * 3 + ['idle']
+        assert processor.conversation_repo.get_last_exchange()['assistant_response'] == response
+    finally:
+        processor.shutdown()
+
+
+def test_barge_in_stops_the_stream():
+    """Chunks after a barge-in are not spoken and the partial reply is not stored"""
+    processor, tts, events = make_processor('InterruptedStreamHandler')
+    ACTIVE['processor'] = processor
+    try:
+        assert processor.process_command("weather") == EMAIL_LINES[0]
+        assert tts.spoken == EMAIL_LINES[:1]
+        assert 'idle' not in events
+        assert processor.conversation_repo.get_last_exchange() is None
+    finally:
+        ACTIVE.clear()
+        processor.shutdown()
+
+
+if __name__ == "__main__":
+    test_reply_is_stored_and_spoken()
+    test_timeout_reply_is_spoken_but_not_remembered()
+    test_cold_build_timeout_returns_overlay_to_idle()
+    test_barge_in_before_processing_starts_is_kept()
+    test_speculation_hit_speaks_the_synthesized_reply()
+    test_speculation_miss_does_not_hold_the_reply()
+    test_streamed_reply_is_spoken_chunk_by_chunk()
+    test_barge_in_stops_the_stream()
+    print("All command processor tests passed!")
@@ -0,0 +1,137 @@
+"""Tests for write-behind conversation history"""
+
+import sys
+import os
+import time
+import sqlite3
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chatur.storage.repository
+import chatur.storage.conversation_repository
+from chatur.storage.conversation_repository import ConversationRepository, get_conversation_repository
+
+
+def make_repo(**kwargs):
+    """Repository backed by a fresh temporary database"""
+    original_path = chatur.storage.repository.DB_PATH
+    chatur.storage.repository.DB_PATH = Path(tempfile.mkdtemp()) / 'history.db'
+    try:
+        return ConversationRepository(**kwargs)
+    finally:
+        chatur.storage.repository.DB_PATH = original_path
+
+
+def stored_count(repo):
+    with sqlite3.connect(repo.db_path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM conversation_history').fetchone()[0]
+
+
+def test_queued_exchange_is_visible_before_commit():
+    repo = make_repo(write_behind=True)
+    repo.flush_interval = 60  # Keep the writer from committing during the test
+    try:
+        assert repo.add_exchange("what time is it", "It is 3 PM", 'question') is None
+        assert stored_count(repo) == 0
+
+        last = repo.get_last_exchange()
+        assert last['user_input'] == "what time is it"
+        assert "It is 3 PM" in repo.get_conversation_context()
+    finally:
+        repo.close()
+
+
+def test_batch_commits_in_order():
+    repo = make_repo(write_behind=True)
+    repo.flush_interval = 60
+    try:
+        for i in range(5):
+            repo.add_exchange(f"question {i}", f"answer {i}")
+        assert repo.flush() == 5
+        assert repo.flush() == 0
+        assert stored_count(repo) == 5
+
+        # Committed rows and newer queued ones are merged without duplicates
+        repo.add_exchange("question 5", "answer 5")
+        recent = repo.get_recent_exchanges(limit=3)
+        assert [exchange['user_input'] for exchange in recent] == ["question 3", "question 4", "question 5"]
+    finally:
+        repo.close()
+
+
+def test_background_writer_commits():
+    repo = make_repo(write_behind=True)
+    repo.flush_interval = 0.01
+    try:
+        repo.add_exchange("hello", "hi")
+        deadline = time.monotonic() + 5
+        while stored_count(repo) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stored_count(repo) == 1
+    finally:
+        repo.close()
+
+
+def test_close_flushes_backlog():
+    repo = make_repo(write_behind=True)
+    repo.flush_interval = 60
+    repo.add_exchange("hello", "hi")
+    repo.add_exchange("bye", "goodbye")
+    repo.close()
+    assert stored_count(repo) == 2
+
+    # After close, writes go straight to the database
+    assert repo.add_exchange("again", "hello again") is not None
+    assert stored_count(repo) == 3
+
+
+def test_full_backlog_flushes_on_caller():
+    repo = make_repo(write_behind=True)
+    repo.flush_interval = 60
+    repo.max_pending = 3
+    try:
+        for i in range(4):
+            repo.add_exchange(f"question {i}", f"answer {i}")
+        assert stored_count(repo) == 3
+        assert len(repo.get_recent_exchanges(limit=10)) == 4
+    finally:
+        repo.close()
+
+
+def test_synchronous_mode_unchanged():
+    repo = make_repo()
+    record_id = repo.add_exchange("hello", "hi")
+    assert isinstance(record_id, int)
+    assert stored_count(repo) == 1
+    assert repo.flush() == 0
+    repo.close()
+
+
+def test_shared_repository_sees_queued_exchanges():
+    """The processor and /api/history read through one instance, so queued rows are visible to both"""
+    original = chatur.storage.conversation_repository._repository
+    chatur.storage.conversation_repository._repository = make_repo(write_behind=True)
+    try:
+        writer = get_conversation_repository()
+        writer.flush_interval = 60
+        writer.add_exchange("play music", "Playing music")
+
+        reader = get_conversation_repository()
+        assert reader is writer
+        assert reader.get_last_exchange()['assistant_response'] == "Playing music"
+        assert stored_count(reader) == 0
+        writer.close()
+    finally:
+        chatur.storage.conversation_repository._repository = original
+
+
+if __name__ == "__main__":
+    test_queued_exchange_is_visible_before_commit()
+    test_batch_commits_in_order()
+    test_background_writer_commits()
+    test_close_flushes_backlog()
+    test_full_backlog_flushes_on_caller()
+    test_synchronous_mode_unchanged()
+    test_shared_repository_sees_queued_exchanges()
+    print("All conversation repository tests passed!")
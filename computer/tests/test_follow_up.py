@@ -0,0 +1,99 @@
+"""Tests for the follow-up window after a reply"""
+
+import sys
+import os
+import tempfile
+from contextlib import contextmanager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.audio_capture import FileCapture
+from chatur.core.follow_up import listen_for_follow_up
+from chatur.models.transcription import Transcription
+
+
+def tone(amplitude: int, frames: int) -> bytes:
+    return amplitude.to_bytes(2, 'little', signed=True) * 512 * frames
+
+
+def make_capture(audio: bytes) -> FileCapture:
+    path = os.path.join(tempfile.mkdtemp(), 'follow_up.pcm')
+    with open(path, 'wb') as f:
+        f.write(audio)
+    return FileCapture(path)
+
+
+class FakeTracker:
+    calibrated = True
+    energy_threshold = 500.0
+
+    def __init__(self):
+        self.events = []
+
+    @contextmanager
+    def paused(self):
+        self.events.append('pause')
+        try:
+            yield
+        finally:
+            self.events.append('resume')
+
+
+class FakeSTT:
+    def __init__(self, text='what about tomorrow'):
+        self.text = text
+        self.noise_tracker = FakeTracker()
+        self.audio = None
+
+    def transcribe(self, audio):
+        self.noise_tracker.events.append('transcribe')
+        self.audio = audio
+        return Transcription(text=self.text, engine='fake')
+
+
+def test_speech_in_window_is_transcribed():
+    capture = make_capture(tone(0, 5) + tone(3000, 10) + tone(0, 40))
+    stt = FakeSTT()
+    opened = []
+    try:
+        text = listen_for_follow_up(stt, window_seconds=2.0, on_listening=lambda: opened.append(True), capture=capture)
+    finally:
+        capture.stop()
+
+    assert text == 'what about tomorrow'
+    assert opened == [True]
+    assert tone(3000, 10) in stt.audio
+    # The noise floor is frozen while recording, not while transcribing
+    assert stt.noise_tracker.events == ['pause', 'resume', 'transcribe']
+
+
+def test_silent_window_times_out():
+    capture = make_capture(tone(0, 10))
+    stt = FakeSTT()
+    try:
+        assert listen_for_follow_up(stt, window_seconds=0.3, capture=capture) is None
+    finally:
+        capture.stop()
+    assert stt.audio is None
+    assert stt.noise_tracker.events == ['pause', 'resume']
+
+
+def test_zero_window_disables_follow_up():
+    opened = []
+    assert listen_for_follow_up(FakeSTT(), window_seconds=0, on_listening=lambda: opened.append(True)) is None
+    assert opened == []
+
+
+def test_engines_without_transcribe_use_listen():
+    class ListenOnlySTT:
+        def listen(self):
+            return 'next song'
+
+    assert listen_for_follow_up(ListenOnlySTT(), window_seconds=1.0) == 'next song'
+
+
+if __name__ == "__main__":
+    test_speech_in_window_is_transcribed()
+    test_silent_window_times_out()
+    test_zero_window_disables_follow_up()
+    test_engines_without_transcribe_use_listen()
+    print("All follow-up tests passed!")
@@ -0,0 +1,123 @@
+"""Tests for the bounded handler executor"""
+
+import sys
+import os
+import time
+import threading
+from concurrent.futures import CancelledError
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.service.handler_executor import HandlerExecutor, HandlerTimeout
+from chatur.utils.metrics import metrics
+
+
+def test_run_returns_result():
+    executor = HandlerExecutor(max_workers=2, timeout_seconds=5)
+    try:
+        assert executor.run('math', lambda a, b: a + b, 2, 3) == 5
+    finally:
+        executor.shutdown()
+
+
+def test_run_reraises_handler_errors():
+    executor = HandlerExecutor(max_workers=1, timeout_seconds=5)
+
+    def broken():
+        raise ValueError("boom")
+
+    try:
+        executor.run('math', broken)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    finally:
+        executor.shutdown()
+
+
+def test_per_handler_timeout():
+    executor = HandlerExecutor(max_workers=2, timeout_seconds=5, timeouts={'email': 0.1})
+    release = threading.Event()
+    before = metrics.counter('handler.email.timeouts')
+    started = time.monotonic()
+    try:
+        executor.run('email', release.wait)
+        assert False, "expected HandlerTimeout"
+    except HandlerTimeout as e:
+        assert e.name == 'email'
+        assert time.monotonic() - started < 2
+    finally:
+        release.set()
+        executor.shutdown()
+    assert metrics.counter('handler.email.timeouts') == before + 1
+
+
+def test_cancel_event_stops_waiting():
+    executor = HandlerExecutor(max_workers=1, timeout_seconds=30)
+    release, cancel = threading.Event(), threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    try:
+        executor.run('calendar', release.wait, cancel_event=cancel)
+        assert False, "expected CancelledError"
+    except CancelledError:
+        pass
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_queued_call_counts_against_deadline():
+    """A call waiting for a busy pool still times out on schedule"""
+    executor = HandlerExecutor(max_workers=1, timeout_seconds=0.2)
+    release = threading.Event()
+    blocker = threading.Thread(target=lambda: _ignore_timeout(executor, release.wait))
+    blocker.start()
+    time.sleep(0.05)
+    try:
+        executor.run('math', lambda: 'late')
+        assert False, "expected HandlerTimeout"
+    except HandlerTimeout:
+        pass
+    finally:
+        release.set()
+        blocker.join()
+        executor.shutdown()
+
+
+def _ignore_timeout(executor, func):
+    try:
+        executor.run('math', func)
+    except HandlerTimeout:
+        pass
+
+
+def test_run_stream_yields_chunks_then_times_out():
+    executor = HandlerExecutor(max_workers=2, timeout_seconds=5, timeouts={'calendar': 0.3})
+    release = threading.Event()
+
+    def chunks():
+        yield "first"
+        yield "second"
+        release.wait()
+        yield "never"
+
+    received = []
+    try:
+        for chunk in executor.run_stream('calendar', chunks()):
+            received.append(chunk)
+        assert False, "expected HandlerTimeout"
+    except HandlerTimeout:
+        pass
+    finally:
+        release.set()
+        executor.shutdown()
+    assert received == ["first", "second"]
+
+
+if __name__ == "__main__":
+    test_run_returns_result()
+    test_run_reraises_handler_errors()
+    test_per_handler_timeout()
+    test_cancel_event_stops_waiting()
+    test_queued_call_counts_against_deadline()
+    test_run_stream_yields_chunks_then_times_out()
+    print("All handler executor tests passed!")
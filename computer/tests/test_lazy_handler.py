@@ -0,0 +1,84 @@
+"""Tests for lazily built handlers and the processor's parallel warm-up"""
+
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.service.lazy_handler import LazyHandler
+from chatur.utils.metrics import metrics
+
+
+def test_built_on_first_attribute_access():
+    handler = LazyHandler('counter', 'collections', 'Counter', 'abca')
+    assert not handler.ready
+    assert handler.init_seconds is None
+
+    assert handler.most_common(1) == [('a', 2)]
+    assert handler.ready
+    assert handler.init_seconds >= 0
+    assert metrics.latency('handler_init.counter').snapshot()['count'] >= 1
+
+
+def test_concurrent_callers_share_one_instance():
+    handler = LazyHandler('counter', 'collections', 'Counter')
+    built = []
+    threads = [threading.Thread(target=lambda: built.append(handler.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 8
+    assert all(instance is built[0] for instance in built)
+
+
+def test_failed_construction_is_retried():
+    handler = LazyHandler('decimal', 'decimal', 'Decimal', 'not a number')
+    for _ in range(2):
+        try:
+            handler.get()
+            assert False, "expected InvalidOperation"
+        except ArithmeticError:
+            pass
+        assert not handler.ready
+
+
+def test_processor_defers_and_warms_up_handlers():
+    import chatur.storage.repository
+    from chatur.service.command_processor import CommandProcessor
+    from chatur.storage.conversation_repository import ConversationRepository
+
+    original_path = chatur.storage.repository.DB_PATH
+    chatur.storage.repository.DB_PATH = Path(tempfile.mkdtemp()) / 'test.db'
+    try:
+        processor = CommandProcessor(
+            llm_client=None, tts_engine=None, conversation_repo=ConversationRepository(write_behind=True)
+        )
+    finally:
+        chatur.storage.repository.DB_PATH = original_path
+
+    try:
+        assert processor.handlers
+        assert not any(handler.ready for handler in processor.handlers.values())
+
+        # Swap in cheap stand-ins; the real handlers need Google credentials and desktop libraries
+        processor.handlers = {
+            intent_type: LazyHandler(handler.name, 'collections', 'OrderedDict')
+            for intent_type, handler in processor.handlers.items()
+        }
+        timings = processor.warm_up_handlers()
+        assert set(timings) == {handler.name for handler in processor.handlers.values()}
+        assert all(handler.ready for handler in processor.handlers.values())
+        assert processor.warm_up_handlers() == {}
+    finally:
+        processor.shutdown()
+
+
+if __name__ == "__main__":
+    test_built_on_first_attribute_access()
+    test_concurrent_callers_share_one_instance()
+    test_failed_construction_is_retried()
+    test_processor_defers_and_warms_up_handlers()
+    print("All lazy handler tests passed!")
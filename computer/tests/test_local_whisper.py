@@ -0,0 +1,132 @@
+"""Tests for the local Whisper engine with WhisperModel stubbed out"""
+
+import sys
+import os
+import math
+import types
+import tempfile
+import importlib
+import importlib.util
+from contextlib import contextmanager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class Segment:
+    def __init__(self, text: str, avg_logprob: float):
+        self.text = text
+        self.avg_logprob = avg_logprob
+
+
+class FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel; replies with canned segments"""
+
+    segments = [Segment(' turn on ', -0.1), Segment(' the lights ', -0.3)]
+    detected_language = 'en'
+
+    def __init__(self, model_path, **kwargs):
+        self.model_path = model_path
+        self.calls = []
+
+    def transcribe(self, samples, language=None, **kwargs):
+        self.calls.append({'samples': samples, 'language': language, **kwargs})
+        return iter(self.segments), types.SimpleNamespace(language=language or self.detected_language)
+
+
+class FakeTracker:
+    calibrated = False
+    energy_threshold = 300.0
+
+    def start(self):
+        return True
+
+    @contextmanager
+    def paused(self):
+        yield
+
+
+def import_local_whisper():
+    """Import the engine module, standing in for faster_whisper when it is not installed"""
+    if importlib.util.find_spec('faster_whisper') is not None:
+        module = importlib.import_module('chatur.core.local_whisper_stt')
+    else:
+        sys.modules['faster_whisper'] = types.SimpleNamespace(WhisperModel=FakeWhisperModel)
+        try:
+            module = importlib.import_module('chatur.core.local_whisper_stt')
+        finally:
+            del sys.modules['faster_whisper']
+    module.WhisperModel = FakeWhisperModel
+    module.NoiseFloorTracker = FakeTracker
+    return module
+
+
+local_whisper_stt = import_local_whisper()
+
+
+def tone(amplitude: int, frames: int) -> bytes:
+    return amplitude.to_bytes(2, 'little', signed=True) * 512 * frames
+
+
+def make_stt():
+    local_whisper_stt._models.clear()
+    stt = local_whisper_stt.LocalWhisperSTT(model_path=tempfile.mkdtemp())
+    assert stt.is_available()
+    return stt
+
+
+def test_transcription_joins_segments():
+    stt = make_stt()
+    result = stt.transcribe(tone(0, 10) + tone(3000, 8) + tone(0, 10))
+
+    assert result.text == 'turn on the lights'
+    assert result.engine == 'local_whisper'
+    assert abs(result.confidence - math.exp(-0.2)) < 1e-9
+
+    call = stt.model.calls[0]
+    assert call['language'] == 'en'
+    assert call['condition_on_previous_text'] is False
+    # Silence is trimmed before decoding, keeping three frames of padding each side
+    assert len(call['samples']) == 512 * 14
+    assert call['samples'].max() <= 1.0
+
+
+def test_language_hint_and_detection():
+    stt = make_stt()
+    stt.transcribe(tone(3000, 4), language=None)
+    assert stt.model.calls[-1]['language'] is None
+
+    original_record = local_whisper_stt.record_utterance
+    local_whisper_stt.record_utterance = lambda **kwargs: tone(3000, 4)
+    try:
+        stt.model.detected_language = 'hi'
+        assert stt.recognize_with_language_detection() == ('turn on the lights', 'hi')
+        # Anything else is handled as English
+        stt.model.detected_language = 'fr'
+        assert stt.recognize_with_language_detection() == ('turn on the lights', 'en')
+    finally:
+        local_whisper_stt.record_utterance = original_record
+
+
+def test_empty_audio_is_not_decoded():
+    stt = make_stt()
+    assert stt.transcribe(tone(0, 10)) is None
+    assert stt.transcribe(b'') is None
+    assert stt.model.calls == []
+
+    # A decode with no segments is no result either
+    stt.model.segments = []
+    assert stt.transcribe(tone(3000, 4)) is None
+    assert len(stt.model.calls) == 1
+
+
+def test_missing_model_is_unavailable():
+    stt = local_whisper_stt.LocalWhisperSTT(model_path=os.path.join(tempfile.mkdtemp(), 'missing'))
+    assert not stt.is_available()
+    assert stt.transcribe(tone(3000, 4)) is None
+
+
+if __name__ == "__main__":
+    test_transcription_joins_segments()
+    test_language_hint_and_detection()
+    test_empty_audio_is_not_decoded()
+    test_missing_model_is_unavailable()
+    print("All local Whisper tests passed!")
@@ -0,0 +1,42 @@
+"""Tests for in-process metrics helpers"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.utils.metrics import LatencyStats, MetricsRegistry, word_error_rate
+
+
+def test_latency_percentiles():
+    """Percentiles come from the rolling window, snapshots are in milliseconds"""
+    stats = LatencyStats(window=100)
+    for ms in range(1, 101):
+        stats.record(ms / 1000)
+    assert abs(stats.percentile(0.5) - 0.051) < 1e-9
+    snapshot = stats.snapshot()
+    assert snapshot['count'] == 100
+    assert snapshot['max_ms'] == 100.0
+
+
+def test_registry_counters():
+    registry = MetricsRegistry()
+    registry.increment('a')
+    registry.increment('a', 2)
+    assert registry.counter('a') == 3
+    assert registry.snapshot()['counters'] == {'a': 3}
+
+
+def test_word_error_rate():
+    """Substitutions, deletions and insertions all count; case and punctuation do not"""
+    assert word_error_rate("Set a timer for five minutes.", "set a timer for five minutes") == 0.0
+    assert word_error_rate("open chrome", "open crown") == 0.5
+    assert word_error_rate("what time is it", "what is it") == 0.25
+    assert word_error_rate("play music", "play the music now") == 1.0
+    assert word_error_rate("", "") == 0.0
+
+
+if __name__ == "__main__":
+    test_latency_percentiles()
+    test_registry_counters()
+    test_word_error_rate()
+    print("All metrics tests passed!")
@@ -0,0 +1,46 @@
+"""Tests for power-aware duty cycling"""
+
+import sys
+import os
+from collections import namedtuple
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.service.power_policy import PowerPolicy
+
+Battery = namedtuple('Battery', ['percent', 'secsleft', 'power_plugged'])
+
+
+def test_profile_follows_power_source():
+    """Unplugging applies the battery profile; plugging back in restores AC"""
+    state = {'battery': Battery(80, 3600, True)}
+    policy = PowerPolicy(poll_seconds=60, battery_reader=lambda: state['battery'])
+    applied = []
+    policy.register(applied.append)
+    assert policy.refresh().mode == 'ac'
+
+    state['battery'] = Battery(79, 3500, False)
+    profile = policy.refresh()
+    assert profile.mode == 'battery'
+    assert not policy.allow_background_work()
+    assert profile.capture_buffer_frames > 1
+    assert applied[-1] is profile
+
+    state['battery'] = Battery(79, 3500, True)
+    assert policy.refresh().mode == 'ac'
+    assert policy.allow_background_work()
+    assert [p.mode for p in applied] == ['ac', 'battery', 'ac']
+
+
+def test_desktop_stays_on_ac():
+    """No battery means full responsiveness"""
+    policy = PowerPolicy(poll_seconds=60, battery_reader=lambda: None)
+    assert policy.refresh().mode == 'ac'
+    snapshot = policy.snapshot()
+    assert snapshot['battery_percent'] is None
+    assert snapshot['profile']['mode'] == 'ac'
+
+
+if __name__ == "__main__":
+    test_profile_follows_power_source()
+    test_desktop_stays_on_ac()
+    print("All power policy tests passed!")
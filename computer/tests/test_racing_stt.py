@@ -0,0 +1,183 @@
+"""Tests for the racing STT engine"""
+
+import sys
+import os
+import time
+from contextlib import contextmanager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core import racing_stt
+from chatur.core.racing_stt import RacingSTT
+from chatur.core.stt_factory import STTFactory
+from chatur.models.transcription import Transcription
+from chatur.utils.config import config
+from chatur.utils.metrics import metrics
+
+
+class FakeEngine:
+    """Engine returning a fixed transcript after a delay"""
+
+    def __init__(self, name, text, confidence=None, delay=0.0, fail=False):
+        self.name = name
+        self.text = text
+        self.confidence = confidence
+        self.delay = delay
+        self.fail = fail
+
+    def is_available(self):
+        return True
+
+    def transcribe(self, audio):
+        time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("provider down")
+        return Transcription(text=self.text, engine=self.name, confidence=self.confidence)
+
+
+class StreamingEngine(FakeEngine):
+    """Engine that decodes frames while they are recorded, like Vosk"""
+
+    def __init__(self, name, text, on_partial=None, noise_tracker=None):
+        super().__init__(name, text)
+        self.on_partial = on_partial
+        self.noise_tracker = noise_tracker
+        self.fed = []
+
+    @contextmanager
+    def partial_stream(self):
+        def feed(frame):
+            self.fed.append(frame)
+            self.on_partial(f"partial {len(self.fed)}")
+        yield feed
+
+
+class FakeTracker:
+    calibrated = True
+    energy_threshold = 500.0
+
+    def __init__(self):
+        self.started = False
+
+    def start(self):
+        self.started = True
+        return True
+
+    def stop(self):
+        pass
+
+    @contextmanager
+    def paused(self):
+        yield
+
+
+@contextmanager
+def race_config(**settings):
+    """Temporarily override stt.* settings"""
+    stt = config._config.setdefault('stt', {})
+    saved = dict(stt)
+    stt.update(settings)
+    try:
+        yield
+    finally:
+        stt.clear()
+        stt.update(saved)
+
+
+def test_fastest_confident_engine_wins():
+    """A slow engine does not delay an acceptable fast result"""
+    racer = RacingSTT({
+        'slow': FakeEngine('slow', 'open chrome', delay=1.0),
+        'fast': FakeEngine('fast', 'open chrome', confidence=0.9),
+    })
+    started = time.perf_counter()
+    result = racer.transcribe(b'\x00\x00' * 160)
+    assert result.engine == 'fast'
+    assert time.perf_counter() - started < 0.5
+    assert racer.stats()['fast']['wins'] >= 1
+
+
+def test_low_confidence_result_waits_for_better_one():
+    """A fast but unsure result loses to a slower confident one"""
+    racer = RacingSTT({
+        'unsure': FakeEngine('unsure', 'open come', confidence=0.2),
+        'sure': FakeEngine('sure', 'open chrome', confidence=0.95, delay=0.1),
+    })
+    assert racer.transcribe(b'').text == 'open chrome'
+
+
+def test_provider_outage_is_absorbed():
+    """An engine raising an error does not fail the race"""
+    errors_before = metrics.counter('stt.race.down.errors')
+    racer = RacingSTT({
+        'down': FakeEngine('down', '', fail=True),
+        'up': FakeEngine('up', 'what time is it', delay=0.05),
+    })
+    assert racer.transcribe(b'').engine == 'up'
+    assert metrics.counter('stt.race.down.errors') == errors_before + 1
+
+
+def test_best_rejected_candidate_is_fallback():
+    """With no acceptable result the most confident candidate is returned"""
+    racer = RacingSTT({
+        'a': FakeEngine('a', 'play music', confidence=0.3),
+        'b': FakeEngine('b', 'play muse', confidence=0.1),
+    })
+    assert racer.transcribe(b'').text == 'play music'
+
+
+def test_partials_stream_from_the_streaming_engine():
+    """on_partial keeps working with racing on: the streaming engine sees frames as they are recorded"""
+    partials = []
+    streaming = StreamingEngine('vosk', 'open chrome', on_partial=partials.append)
+    tracker = FakeTracker()
+    racer = RacingSTT({'vosk': streaming, 'other': FakeEngine('other', 'open chrome', delay=0.05)}, noise_tracker=tracker)
+    assert racer.noise_tracker is tracker and not tracker.started
+
+    def fake_record(on_frame=None, **kwargs):
+        for frame in (b'\x01\x00', b'\x02\x00'):
+            on_frame(frame)
+        return b'\x01\x00\x02\x00'
+
+    original_record = racing_stt.record_utterance
+    racing_stt.record_utterance = fake_record
+    try:
+        assert racer.recognize_once() == 'open chrome'
+    finally:
+        racing_stt.record_utterance = original_record
+
+    assert streaming.fed == [b'\x01\x00', b'\x02\x00']
+    assert partials == ['partial 1', 'partial 2']
+
+
+def test_race_shares_tracker_and_skips_unknown_engines():
+    """Unknown names are skipped; engines get the racer's tracker and the partial callback"""
+    built = []
+
+    def fake_build(name, on_partial=None, noise_tracker=None):
+        if name != 'vosk':
+            raise ValueError(f"Unknown STT engine: {name}")
+        engine = StreamingEngine(name, 'open chrome', on_partial, noise_tracker)
+        built.append(engine)
+        return engine
+
+    original_build = STTFactory._build
+    STTFactory._build = staticmethod(fake_build)
+    try:
+        with race_config(race_engines=['typo', 'vosk']):
+            racer = STTFactory._build_race(on_partial=print)
+    finally:
+        STTFactory._build = original_build
+
+    assert list(racer.engines) == ['vosk']
+    assert built[0].noise_tracker is racer.noise_tracker
+    assert built[0].on_partial is print
+
+
+if __name__ == "__main__":
+    test_fastest_confident_engine_wins()
+    test_low_confidence_result_waits_for_better_one()
+    test_provider_outage_is_absorbed()
+    test_best_rejected_candidate_is_fallback()
+    test_partials_stream_from_the_streaming_engine()
+    test_race_shares_tracker_and_skips_unknown_engines()
+    print("All racing STT tests passed!")
@@ -0,0 +1,96 @@
+"""Tests for STT engine selection and lazy engine imports"""
+
+import sys
+import os
+import json
+import subprocess
+from contextlib import contextmanager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.stt_factory import STTFactory
+from chatur.utils.config import config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Engine modules and their packages; none may load until an engine is built
+ENGINE_MODULES = [
+    'chatur.core.google_stt',
+    'chatur.core.whisper_stt',
+    'chatur.core.local_whisper_stt',
+    'chatur.core.vosk_stt',
+    'chatur.core.stt',
+    'chatur.core.racing_stt',
+    'azure.cognitiveservices.speech',
+    'speech_recognition',
+    'vosk',
+    'faster_whisper',
+]
+
+IMPORT_MAIN = """
+import json, sys
+missing = None
+try:
+    import chatur.main
+except ModuleNotFoundError as e:
+    missing = e.name
+print(json.dumps({'loaded': [m for m in %r if m in sys.modules], 'missing': missing}))
+""" % (ENGINE_MODULES,)
+
+
+@contextmanager
+def stt_config(**settings):
+    """Temporarily override stt.* settings"""
+    stt = config._config.setdefault('stt', {})
+    saved = dict(stt)
+    stt.update(settings)
+    try:
+        yield
+    finally:
+        stt.clear()
+        stt.update(saved)
+
+
+def test_configured_engine_is_selected():
+    from chatur.core.whisper_stt import WhisperSTT
+
+    with stt_config(engine='Whisper'):
+        assert isinstance(STTFactory.create(fallback=False), WhisperSTT)
+    # An explicit name wins over the configured one
+    with stt_config(engine='does-not-exist'):
+        assert isinstance(STTFactory.create('whisper', fallback=False), WhisperSTT)
+
+
+def test_unknown_engine_raises():
+    try:
+        STTFactory.create('telepathy')
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert 'telepathy' in str(e)
+
+    with stt_config(engine='telepathy'):
+        try:
+            STTFactory.create()
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
+def test_importing_main_loads_no_engine():
+    """Engines are imported by STTFactory.create(), not by importing the app"""
+    result = subprocess.run(
+        [sys.executable, '-c', IMPORT_MAIN],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    if report['missing']:
+        # Everything chatur.main imported before the missing dependency is still checked
+        print(f"chatur.main stopped at missing dependency {report['missing']}")
+    assert report['loaded'] == []
+
+
+if __name__ == "__main__":
+    test_configured_engine_is_selected()
+    test_unknown_engine_raises()
+    test_importing_main_loads_no_engine()
+    print("All STT factory tests passed!")
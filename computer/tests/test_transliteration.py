@@ -0,0 +1,39 @@
+"""Tests for Devanagari transliteration"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.utils.transliteration import transliterate, has_devanagari
+
+
+def test_inherent_vowel_and_schwa_deletion():
+    """Consonants carry 'a' except before a matra/virama or at the end of a word"""
+    assert transliterate("कमल") == "kamal"
+    assert transliterate("नमस्ते") == "namaste"
+    assert transliterate("राम") == "raam"
+    assert transliterate("न") == "na"
+    assert transliterate("घंटा") == "ghantaa"
+
+
+def test_conjuncts_nukta_and_punctuation():
+    assert transliterate("क्या") == "kyaa"
+    assert transliterate("ज्ञान") == "gyaan"
+    assert transliterate("ज़रूरी") == "zarooree"
+    assert transliterate("मैं ठीक हूँ।") == "main theek hoon."
+    assert transliterate("१० मिनट") == "10 minat"
+
+
+def test_mixed_and_plain_text():
+    """Latin text passes through untouched"""
+    assert transliterate("Timer: चाय") == "Timer: chaay"
+    assert transliterate("hello") == "hello"
+    assert has_devanagari("Timer: चाय")
+    assert not has_devanagari("hello")
+
+
+if __name__ == "__main__":
+    test_inherent_vowel_and_schwa_deletion()
+    test_conjuncts_nukta_and_punctuation()
+    test_mixed_and_plain_text()
+    print("All transliteration tests passed!")
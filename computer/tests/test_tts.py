@@ -0,0 +1,219 @@
+"""Tests for the TTS worker and its priority speech queue"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from pathlib import Path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chatur.core.tts import TextToSpeech, SpeechPriority, split_into_chunks
+from chatur.core.tts_backends import NullBackend, Voice
+from chatur.core.tts_cache import SpeechCache
+from chatur.core.tts_factory import TTSFactory
+
+
+def make_tts():
+    """Null-sink TTS whose worker blocks on the first utterance until released"""
+    tts = TextToSpeech(output='null')
+    spoken = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_speak(text, language):
+        spoken.append(text)
+        started.set()
+        release.wait(timeout=2.0)
+
+    tts._speak = fake_speak
+    return tts, spoken, started, release
+
+
+def test_priority_order_and_merge():
+    """Replies jump ahead of reminders and timers; duplicates are spoken once"""
+    tts, spoken, started, release = make_tts()
+    tts.speak("busy", wait=False)
+    assert started.wait(timeout=2.0)
+
+    tts.speak("timer done", priority=SpeechPriority.TIMER, wait=False)
+    tts.speak("reminder", priority=SpeechPriority.REMINDER, wait=False)
+    tts.speak("reminder", priority=SpeechPriority.REMINDER, wait=False)
+    tts.speak_async("reply")
+    release.set()
+    tts.speak("last", priority=SpeechPriority.TIMER)
+
+    assert spoken == ["busy", "reply", "reminder", "timer done", "last"]
+    tts.stop()
+
+
+def test_interrupt_drops_queued_replies_but_keeps_reminders():
+    """Replies queued before an interrupt are skipped (waiters return); reminders are still spoken"""
+    tts, spoken, started, release = make_tts()
+    tts.speak("busy", wait=False)
+    assert started.wait(timeout=2.0)
+
+    tts.speak("take your medicine", priority=SpeechPriority.REMINDER, wait=False)
+    waiter = threading.Thread(target=tts.speak, args=("stale reply",))
+    waiter.start()
+    while tts._queue.qsize() < 2:
+        time.sleep(0.01)
+    tts.interrupt()
+    release.set()
+    waiter.join(timeout=2.0)
+    assert not waiter.is_alive()
+
+    tts.speak("fresh reply")
+    assert spoken == ["busy", "take your medicine", "fresh reply"]
+    tts.stop()
+
+
+def test_interrupt_leaves_the_engine_to_the_worker():
+    """interrupt() never touches the backend; the worker stops it through should_stop"""
+    calls = []
+    stopped = threading.Event()
+
+    class PollingBackend(NullBackend):
+        def speak(self, text, should_stop=None):
+            calls.append(threading.current_thread().name)
+            while not should_stop():
+                time.sleep(0.01)
+            stopped.set()
+
+    tts = TextToSpeech(output='null')
+    tts.output, tts.cache, tts.chunked = 'speaker', None, False
+    tts.backend = PollingBackend()
+
+    tts.speak("a long reply", wait=False)
+    while not calls:
+        time.sleep(0.01)
+    tts.interrupt()
+
+    assert stopped.wait(timeout=2.0)
+    assert calls == ["TTSWorker"]
+    tts.stop()
+
+
+def test_speculative_synthesis_is_not_merged_with_the_reply():
+    """A cache-only prediction and the real reply with the same text both run, prediction first"""
+    tts, spoken, started, release = make_tts()
+    tts.cache = SpeechCache(Path(tempfile.mkdtemp()), max_bytes=1024 * 1024)
+    tts._presynthesize = lambda text, language: spoken.append(f"cache:{text}")
+    tts.speak("busy", wait=False)
+    assert started.wait(timeout=2.0)
+
+    assert tts.presynthesize("Playing next track", priority=SpeechPriority.INTERACTIVE)
+    assert not tts.presynthesize("x" * (tts.cache_max_chars + 1))
+    tts.speak("Playing next track", wait=False)
+    release.set()
+    tts.speak("done")
+
+    assert spoken == ["busy", "cache:Playing next track", "Playing next track", "done"]
+    tts.stop()
+
+
+def test_mispredicted_synthesis_is_skipped():
+    """A prediction still queued when a different reply arrives is dropped instead of delaying it"""
+    tts, spoken, started, release = make_tts()
+    tts.cache = SpeechCache(Path(tempfile.mkdtemp()), max_bytes=1024 * 1024)
+    tts._presynthesize = lambda text, language: spoken.append(f"cache:{text}")
+    tts.speak("busy", wait=False)
+    assert started.wait(timeout=2.0)
+
+    assert tts.presynthesize("Playing next track", priority=SpeechPriority.INTERACTIVE)
+    tts.speak("Nothing is playing", wait=False)
+    release.set()
+    tts.speak("done")
+
+    assert spoken == ["busy", "Nothing is playing", "done"]
+    tts.stop()
+
+
+def test_streamed_chunks_are_not_merged_and_flush_waits():
+    """Identical streamed lines are all spoken, in order, before flush() returns"""
+    tts, spoken, started, release = make_tts()
+    release.set()
+
+    for chunk in ["Here are your emails:", "- From Alice: Hi", "- From Alice: Hi"]:
+        tts.speak(chunk, wait=False, merge=False)
+    tts.flush()
+
+    assert spoken == ["Here are your emails:", "- From Alice: Hi", "- From Alice: Hi"]
+    tts.stop()
+
+
+def test_split_into_chunks():
+    """Sentences and lines become chunks; list numbers stay with their item"""
+    text = "You have 2 unread emails.\n1. Meeting moved from Alice\n2. Invoice from Bob"
+    assert split_into_chunks(text) == [
+        "You have 2 unread emails.",
+        "1. Meeting moved from Alice",
+        "2. Invoice from Bob",
+    ]
+    assert split_into_chunks("Okay") == ["Okay"]
+    assert split_into_chunks("आज बारिश होगी। कल धूप रहेगी।", min_chars=5) == ["आज बारिश होगी।", "कल धूप रहेगी।"]
+
+
+def test_speech_cache_evicts_least_recently_played():
+    """Clips are keyed by text and voice settings and evicted LRU by total size"""
+    directory = Path(tempfile.mkdtemp())
+    cache = SpeechCache(directory / 'cache', max_bytes=250)
+
+    def clip(name):
+        path = directory / f'{name}.part'
+        path.write_bytes(b'x' * 100)
+        return path
+
+    okay = cache.key("Okay", "voice-1", 150, 0.9)
+    assert okay != cache.key("Okay", "voice-1", 175, 0.9)
+    done = cache.key("Done", "voice-1", 150, 0.9)
+    cache.put(okay, clip('okay'))
+    cache.put(done, clip('done'))
+    assert cache.get(okay) is not None  # "Done" is now least recently played
+
+    cache.put(cache.key("Next", "voice-1", 150, 0.9), clip('next'))
+    assert cache.get(done) is None
+    assert cache.get(okay) is not None
+    assert len(cache) == 2 and cache.total_bytes == 200
+
+    reopened = SpeechCache(directory / 'cache', max_bytes=250)
+    assert okay in reopened and len(reopened) == 2
+
+
+def test_factory_and_voice_catalogue():
+    """Backends come from the factory; voices are looked up in the startup catalogue"""
+    backend = TTSFactory.create('null', fallback=False)
+    assert isinstance(backend, NullBackend)
+
+    backend.voices = [
+        Voice(id='david', name='Microsoft David Desktop'),
+        Voice(id='kalpana', name='Microsoft Kalpana Desktop'),
+        Voice(id='en-gb', name='english', languages=['en']),
+    ]
+    assert backend.default_voice == 'david'
+    assert backend.find_voice('hi') == 'kalpana'
+    assert backend.find_voice('en') == 'en-gb'
+    assert backend.find_voice('ta') is None
+
+    path = Path(tempfile.mkdtemp()) / 'null.wav'
+    backend.synthesize_to_file("Okay", str(path))
+    assert path.exists()
+
+    try:
+        TTSFactory.create('festival', fallback=False)
+        assert False, "unknown backend accepted"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_priority_order_and_merge()
+    test_interrupt_drops_queued_replies_but_keeps_reminders()
+    test_interrupt_leaves_the_engine_to_the_worker()
+    test_speculative_synthesis_is_not_merged_with_the_reply()
+    test_mispredicted_synthesis_is_skipped()
+    test_streamed_chunks_are_not_merged_and_flush_waits()
+    test_split_into_chunks()
+    test_speech_cache_evicts_least_recently_played()
+    test_factory_and_voice_catalogue()
+    print("All TTS tests passed!")
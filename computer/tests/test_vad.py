@@ -0,0 +1,120 @@
+"""Tests for energy-based voice activity helpers"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from chatur.core.audio_capture import AudioCapture, AudioSubscription, FileCapture
+from chatur.core.vad import frame_rms, trim_silence, NoiseFloorTracker, EnergyGate, record_utterance
+
+
+class FakeCapture(AudioCapture):
+    """Capture stream fed by the test instead of a microphone"""
+
+    def start(self) -> bool:
+        return True
+
+    def feed(self, frame: bytes, count: int) -> None:
+        for _ in range(count):
+            for subscriber in list(self._subscribers):
+                subscriber.push(frame)
+
+
+def tone(amplitude: int, length: int = 512) -> bytes:
+    return np.full(length, amplitude, dtype=np.int16).tobytes()
+
+
+def test_frame_rms():
+    """RMS of a constant frame is its amplitude"""
+    assert frame_rms(tone(1000)) == 1000.0
+    assert frame_rms(b'') == 0.0
+
+
+def test_trim_silence_keeps_padded_speech():
+    """Leading and trailing silence is cut, keeping a few frames of padding"""
+    audio = tone(0) * 10 + tone(2000) * 4 + tone(0) * 10
+    trimmed = trim_silence(audio, energy_threshold=300, padding_frames=2)
+    assert trimmed == tone(0) * 2 + tone(2000) * 4 + tone(0) * 2
+    assert trim_silence(tone(0) * 5) == b''
+
+
+def test_noise_floor_calibrates_in_background():
+    """The tracker publishes a threshold without blocking the caller"""
+    capture = FakeCapture()
+    thresholds = []
+    tracker = NoiseFloorTracker(on_threshold=thresholds.append, capture=capture, min_threshold=0)
+    assert tracker.start()
+
+    capture.feed(tone(1000), 40)
+    deadline = time.time() + 2
+    while not tracker.calibrated and time.time() < deadline:
+        time.sleep(0.01)
+    tracker.stop()
+
+    assert tracker.calibrated
+    assert abs(thresholds[0] - 1500.0) < 1e-3
+
+
+def test_noise_floor_ignores_paused_audio():
+    """Speech captured while paused does not raise the threshold"""
+    capture = FakeCapture()
+    tracker = NoiseFloorTracker(capture=capture, min_threshold=0)
+    tracker.start()
+    capture.feed(tone(1000), 40)
+    deadline = time.time() + 2
+    while not tracker.calibrated and time.time() < deadline:
+        time.sleep(0.01)
+    calibrated = tracker.energy_threshold
+
+    with tracker.paused():
+        capture.feed(tone(20000), 40)
+        time.sleep(0.2)
+        assert abs(tracker.energy_threshold - calibrated) < 1.0
+    tracker.stop()
+
+
+def test_energy_gate_hysteresis():
+    """The gate opens on speech, releases the look-back, and closes after the hang time"""
+    gate = EnergyGate(frame_seconds=0.032, min_threshold=100, hang_seconds=0.096, lookback_seconds=0.096)
+    for _ in range(20):
+        assert gate.process(tone(50)) == []
+    assert not gate.is_open
+
+    released = gate.process(tone(5000))
+    assert gate.is_open
+    assert len(released) == 4  # Three look-back frames plus the onset
+
+    # Quiet frames keep passing until the hang time runs out
+    passed = [len(gate.process(tone(50))) for _ in range(5)]
+    assert passed == [1, 1, 1, 0, 0]
+    assert not gate.is_open
+    assert 0.5 < gate.skipped_fraction < 1.0
+
+
+def test_record_utterance_reports_frames_as_captured():
+    """on_frame sees the pre-roll and every utterance frame, in order"""
+    path = os.path.join(tempfile.mkdtemp(), 'utterance.pcm')
+    with open(path, 'wb') as f:
+        f.write(tone(0) * 20 + tone(3000) * 5 + tone(0) * 40)
+    capture = FileCapture(path)
+    seen = []
+    try:
+        audio = record_utterance(capture=capture, timeout_seconds=2.0, silence_seconds=0.2, on_frame=seen.append)
+    finally:
+        capture.stop()
+
+    assert b''.join(seen) == audio
+    assert tone(3000) * 5 in audio
+
+
+if __name__ == "__main__":
+    test_frame_rms()
+    test_trim_silence_keeps_padded_speech()
+    test_noise_floor_calibrates_in_background()
+    test_noise_floor_ignores_paused_audio()
+    test_energy_gate_hysteresis()
+    test_record_utterance_reports_frames_as_captured()
+    print("All VAD tests passed!")
@@ -0,0 +1,146 @@
+"""Tests for the event-driven wake word worker"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from chatur.core.audio_capture import AudioCapture
+from chatur.core.keyword_backends import KeywordBackend, VoskKeywordBackend
+from chatur.core.wake_word import WakeWordDetector
+
+
+class FakeCapture(AudioCapture):
+    """Capture stream fed by the test instead of a microphone"""
+
+    def start(self) -> bool:
+        return True
+
+    def feed(self, frame: bytes, count: int) -> None:
+        for _ in range(count):
+            for subscriber in list(self._subscribers):
+                subscriber.push(frame)
+
+
+class FakeBackend(KeywordBackend):
+    """Detects the keyword on any frame with a positive first sample"""
+    name = "fake"
+    frame_length = 256
+
+    def __init__(self):
+        self.frames = []
+
+    def process(self, frame: bytes) -> int:
+        self.frames.append(frame)
+        return 0 if np.frombuffer(frame, dtype=np.int16)[0] > 0 else -1
+
+
+def make_detector(on_wake_word, gated: bool = False):
+    detector = WakeWordDetector(on_wake_word=on_wake_word, backend=FakeBackend())
+    detector.capture = FakeCapture()
+    if not gated:
+        detector.gate = None
+    return detector
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_worker_rechunks_and_detects():
+    """Capture frames are split to Porcupine's frame length and decoded as int16"""
+    detections = []
+    detector = make_detector(lambda: detections.append(True))
+    assert detector.start()
+
+    silence = np.zeros(512, dtype=np.int16).tobytes()
+    keyword = np.full(512, 100, dtype=np.int16).tobytes()
+    detector.capture.feed(silence, 2)
+    detector.capture.feed(keyword, 1)
+
+    assert wait_for(lambda: detections)
+    assert wait_for(lambda: detector.frames_processed == 6)
+    assert len(detector.backend.frames[0]) == 256 * 2
+    assert len(detections) == 2  # Both halves of the keyword frame
+
+    stats = detector.stats()
+    assert stats['frames_processed'] == 6
+    assert stats['frame_processing']['count'] >= 6
+    detector.stop()
+
+
+def test_gate_skips_silence_and_replays_onset():
+    """Quiet frames never reach Porcupine; the look-back frames do once speech starts"""
+    detections = []
+    detector = make_detector(lambda: detections.append(True), gated=True)
+    assert detector.gate is not None
+    assert detector.start()
+
+    quiet = np.full(512, 10, dtype=np.int16).tobytes()
+    speech = np.full(512, 5000, dtype=np.int16).tobytes()
+    detector.capture.feed(quiet, 50)
+    detector.capture.feed(speech, 1)
+
+    assert wait_for(lambda: detections)
+    lookback = detector.gate._lookback.maxlen
+    assert wait_for(lambda: detector.frames_processed == 2 * (lookback + 1))
+    assert detector.stats()['gate_skipped_fraction'] > 0.5
+    detector.stop()
+
+
+def words(text: str, conf: float = 1.0):
+    return [{'word': word, 'conf': conf} for word in text.split()]
+
+
+def test_vosk_backend_matches_whole_keywords():
+    """Keyword matching works on whole words, including multi-word phrases"""
+    backend = VoskKeywordBackend.__new__(VoskKeywordBackend)
+    backend.keywords = ['computer', 'hey chatur']
+    backend.min_confidence = 0.5
+    assert backend._match(words('computer')) == 0
+    assert backend._match(words('[unk] hey chatur')) == 1
+    assert backend._match(words('computers')) == -1
+    assert backend._match(words('chatur hey')) == -1
+    assert backend._match([]) == -1
+
+
+def test_vosk_backend_applies_sensitivity_as_confidence():
+    """Lower sensitivity demands more confident keyword words"""
+    backend = VoskKeywordBackend.__new__(VoskKeywordBackend)
+    backend.keywords = ['computer', 'hey chatur']
+    backend.min_confidence = 1.0 - 0.3
+    assert backend._match(words('computer', conf=0.9)) == 0
+    assert backend._match(words('computer', conf=0.6)) == -1
+    assert backend._match([{'word': 'hey', 'conf': 0.95}, {'word': 'chatur', 'conf': 0.4}]) == -1
+
+    try:
+        VoskKeywordBackend(['computer'], sensitivity=1.5)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_stop_closes_subscription():
+    """Stopping the detector unsubscribes from the shared stream"""
+    detector = make_detector(lambda: None)
+    assert detector.start()
+    assert detector.capture._subscribers
+
+    detector.stop()
+    assert not detector.capture._subscribers
+    assert detector._thread is None
+
+
+if __name__ == "__main__":
+    test_worker_rechunks_and_detects()
+    test_gate_skips_silence_and_replays_onset()
+    test_vosk_backend_matches_whole_keywords()
+    test_vosk_backend_applies_sensitivity_as_confidence()
+    test_stop_closes_subscription()
+    print("All wake word tests passed!")
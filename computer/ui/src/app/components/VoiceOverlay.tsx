@@ -17,6 +17,7 @@ const statusText: Record<Status, string> = {
 export function VoiceOverlay() {
     const [isActive, setIsActive] = useState(false);
     const [status, setStatus] = useState<Status>('listening');
+    const [transcript, setTranscript] = useState('');
 
     useEffect(() => {
         let ws: WebSocket | null = null;
@@ -37,12 +38,21 @@ export function VoiceOverlay() {
 
                         if (nextStatus === 'idle') {
                             window.setTimeout(() => setIsActive(false), HIDE_DELAY_MS);
+                            setTranscript('');
+                            return;
+                        }
+
+                        if (nextStatus === 'transcript') {
+                            setTranscript(data?.text ?? '');
                             return;
                         }
 
                         if (nextStatus === 'listening' || nextStatus === 'processing' || nextStatus === 'speaking') {
                             setIsActive(true);
                             setStatus(nextStatus);
+                            if (nextStatus === 'listening') {
+                                setTranscript('');
+                            }
                         }
                     } catch (error) {
                         console.error('Error parsing WS message', error);
@@ -146,9 +156,12 @@ export function VoiceOverlay() {
                                 <span className="text-white font-medium text-lg tracking-wide">
                                     {statusText[status]}
                                 </span>
-                                {status === 'listening' && (
+                                {status === 'listening' && !transcript && (
                                     <span className="text-white/50 text-xs uppercase tracking-wider">Speak Now</span>
                                 )}
+                                {transcript && (
+                                    <span className="text-white/70 text-sm max-w-xs text-center truncate">{transcript}</span>
+                                )}
                             </div>
                         </motion.div>
                     </motion.div>